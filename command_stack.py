@@ -1,10 +1,26 @@
 from typing import Any, List, Dict, Set, Callable
 from pathlib import Path
 import json
+import os
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QToolButton, QListWidgetItem
 from PyQt6.QtGui import QColor
 from PyQt6.QtCore import Qt
 
+# Undo history limits: the oldest commands are dropped past MAX_UNDO_STEPS, and commands
+# further back than WIDGET_UNDO_STEPS let go of the widgets they kept for undo
+MAX_UNDO_STEPS = 200
+WIDGET_UNDO_STEPS = 50
+
+# One encoder for every file write; same output as json.dumps(data, indent=4)
+_ENCODER = json.JSONEncoder(indent=4, separators=(',', ': '))
+
+def write_json_file(path, data) -> None:
+    """Encode JSON in one call and swap it into place so a failed write can't leave a truncated file"""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(_ENCODER.encode(data).encode('utf-8'))
+    os.replace(tmp_path, path)
+
 class Command:
     """Base class for all commands"""
     def __init__(self, file_path: Path, data_path: List[str | int], old_value: Any, new_value: Any):
@@ -29,13 +45,15 @@ class CommandStack:
         self.modified_files: Set[Path] = set()  # Track files with unsaved changes
         self.file_data: Dict[Path, dict] = {}  # Store current data for each file
         self.data_change_callbacks: Dict[Path, List[Callable]] = {}  # Callbacks for data changes
+        self.notifying: Set[Path] = set()  # Files whose callbacks are currently running
         print("Initialized new CommandStack")
         
     def register_data_change_callback(self, file_path: Path, callback: Callable) -> None:
         """Register a callback to be called when data changes for a file"""
-        if file_path not in self.data_change_callbacks:
-            self.data_change_callbacks[file_path] = []
-        self.data_change_callbacks[file_path].append(callback)
+        callbacks = self.data_change_callbacks.setdefault(file_path, [])
+        if callback in callbacks:
+            return
+        callbacks.append(callback)
         print(f"Registered data change callback for {file_path}")
         
     def unregister_data_change_callback(self, file_path: Path, callback: Callable) -> None:
@@ -50,20 +68,36 @@ class CommandStack:
     def notify_data_change(self, file_path: Path, data_path: List = None, value: Any = None, source_widget = None) -> None:
         """Notify all registered callbacks that data has changed for a file"""
         if file_path in self.data_change_callbacks:
-            for callback in self.data_change_callbacks[file_path]:
-                try:
-                    if data_path is not None:
-                        # Partial update with path and value
-                        print("calling data change callback")
-                        callback(self.get_file_data(file_path), data_path, value, source_widget)
-                    else:
-                        # Full update with just data
-                        callback(self.get_file_data(file_path), None, None, None)
-                except Exception as e:
-                    print(f"Error in data change callback for {file_path}: {str(e)}")
+            # Don't let widget updates made by the callbacks notify the same file again
+            if file_path in self.notifying:
+                print(f"Skipping nested data change notification for {file_path}")
+                return
+            self.notifying.add(file_path)
+            try:
+                data = self.get_file_data(file_path)
+                # Iterate a copy, full refreshes unregister callbacks of destroyed views
+                for callback in list(self.data_change_callbacks[file_path]):
+                    try:
+                        if data_path is not None:
+                            # Partial update with path and value
+                            print("calling data change callback")
+                            callback(data, data_path, value, source_widget)
+                        else:
+                            # Full update with just data
+                            callback(data, None, None, None)
+                    except Exception as e:
+                        print(f"Error in data change callback for {file_path}: {str(e)}")
+            finally:
+                self.notifying.discard(file_path)
         
     def update_file_data(self, file_path: Path, data: dict) -> None:
         """Update the stored data for a file"""
+        # Skip rewriting identical data, e.g. when the same entity is selected again.
+        # Stored data is a shallow copy, so equal nested values are usually the same objects
+        # and this compares little more than the top-level keys
+        current = self.file_data.get(file_path)
+        if current is data or (current is not None and current == data):
+            return
         print(f"Updating stored data for file: {file_path}")
         self.file_data[file_path] = data.copy()  # Store a copy to prevent reference issues
         
@@ -129,12 +163,34 @@ class CommandStack:
         
         print("appending command to undo stack")
         self.undo_stack.append(command)
+        self.trim_undo_stack()
         print("clearing redo stack")
-        self.redo_stack.clear()  # Clear redo stack when new command is added
+        # Clear redo stack when new command is added, undone transforms still hold hidden widgets
+        for redo_command in self.redo_stack:
+            release_command_widgets(redo_command)
+        self.redo_stack.clear()
         print("adding file path to modified files")
         self.modified_files.add(command.file_path)  # Track modified file
         print(f"Modified files after push: {self.modified_files}")
         
+    def trim_undo_stack(self) -> None:
+        """Keep the undo history within MAX_UNDO_STEPS and make commands past WIDGET_UNDO_STEPS data-only"""
+        overflow = len(self.undo_stack) - MAX_UNDO_STEPS
+        if overflow > 0:
+            for old_command in self.undo_stack[:overflow]:
+                release_command_widgets(old_command)
+            del self.undo_stack[:overflow]
+        # One command crosses the line per push, so only that one needs releasing
+        if len(self.undo_stack) > WIDGET_UNDO_STEPS:
+            release_command_widgets(self.undo_stack[-WIDGET_UNDO_STEPS - 1])
+    
+    def notify_command_change(self, command, value: Any) -> None:
+        """Notify listeners after undo/redo, rebuilding the views when the command has no widgets left"""
+        if getattr(command, 'data_only', False):
+            self.notify_data_change(command.file_path)
+        else:
+            self.notify_data_change(command.file_path, command.data_path, value, command.source_widget)
+        
     def undo(self) -> None:
         """Undo the last command"""
         if not self.undo_stack:
@@ -177,7 +233,7 @@ class CommandStack:
                     
             # Store updated data and notify listeners
             self.update_file_data(command.file_path, data)
-            self.notify_data_change(command.file_path, command.data_path, command.old_value, command.source_widget)
+            self.notify_command_change(command, command.old_value)
             
         self.redo_stack.append(command)
         
@@ -229,7 +285,7 @@ class CommandStack:
                     
             # Store updated data and notify listeners
             self.update_file_data(command.file_path, data)
-            self.notify_data_change(command.file_path, command.data_path, command.new_value, command.source_widget)
+            self.notify_command_change(command, command.new_value)
             
         self.undo_stack.append(command)
         
@@ -250,9 +306,7 @@ class CommandStack:
         
     def has_unsaved_changes(self) -> bool:
         """Check if there are any unsaved changes"""
-        has_changes = len(self.modified_files) > 0
-        print(f"Checking for unsaved changes: {has_changes} (modified files: {self.modified_files})")
-        return has_changes
+        return len(self.modified_files) > 0
     
     def mark_all_saved(self) -> None:
         """Mark all changes as saved"""
@@ -273,8 +327,7 @@ class CommandStack:
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Save the file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
+            write_json_file(file_path, data)
             
             # Remove from modified files
             self.modified_files.discard(file_path)
@@ -289,10 +342,25 @@ class CommandStack:
         """Clear the modified state for a file without saving"""
         self.modified_files.discard(file_path)
         
+    def forget_file(self, file_path: Path) -> tuple:
+        """Drop the stored data of a deleted file, returns (data, was_modified) for restore_file"""
+        was_modified = file_path in self.modified_files
+        self.modified_files.discard(file_path)
+        return self.file_data.pop(file_path, None), was_modified
+        
+    def restore_file(self, file_path: Path, state: tuple) -> None:
+        """Put back what forget_file dropped"""
+        data, was_modified = state
+        if data is not None:
+            self.file_data[file_path] = data
+        if was_modified:
+            self.modified_files.add(file_path)
+        
 class CompositeCommand:
     """Command that combines multiple commands into one atomic operation"""
     def __init__(self, commands):
         self.commands = commands
+        self.transform_executed = False  # Whether the transform command has built its widget yet
         # For logging purposes, use the first command's attributes
         if commands and hasattr(commands[0], 'file_path'):
             try:
@@ -307,9 +375,13 @@ class CompositeCommand:
     def redo(self):
         """Execute the command (called by command stack)"""
         try:
-            # Execute transform command first to create new widget
+            # Transform the widget first: build it the first time, afterwards bring back the one undo kept
             if len(self.commands) > 1:
-                self.commands[1].execute()
+                if self.transform_executed:
+                    self.commands[1].redo()
+                else:
+                    self.commands[1].execute()
+                    self.transform_executed = True
             # Then update the value
             if self.commands:
                 self.commands[0].redo()
@@ -324,7 +396,22 @@ class CompositeCommand:
                 cmd.undo()
         except Exception as e:
             print(f"Error executing composite command undo: {str(e)}")
+    
+    def release_widgets(self):
+        """Drop the widget transform and keep only the value change"""
+        for cmd in self.commands[1:]:
+            if isinstance(cmd, TransformWidgetCommand):
+                cmd.release_transform_widgets()
+        self.commands = self.commands[:1]
+        self.source_widget = None
+        self.data_only = True  # Undo/redo rebuild the view from the data instead
       
+def release_command_widgets(command) -> None:
+    """Let a command free the widgets it keeps for undo/redo, if it keeps any"""
+    release = getattr(command, 'release_widgets', None)
+    if release is not None and not getattr(command, 'data_only', False):
+        release()
+
 class TransformWidgetCommand:
     """Command for transforming a widget from one type to another"""
     def __init__(self, gui, widget, old_value, new_value):
@@ -339,27 +426,21 @@ class TransformWidgetCommand:
             self.parent_layout = QVBoxLayout(self.parent)
             self.parent_layout.setContentsMargins(0, 0, 0, 0)
             self.parent_layout.setSpacing(4)
-            
-        # Create a container widget to hold our transformed widgets
-        self.container = QWidget(self.parent)
-        self.container_layout = QVBoxLayout(self.container)
-        self.container_layout.setContentsMargins(0, 0, 0, 0)
-        self.container_layout.setSpacing(0)
         
         # Store original widget index and properties
         self.widget_index = self.parent_layout.indexOf(widget)
-        self.data_path = widget.property("data_path")
+        self.data_path = self.gui.widget_path(widget)
         self.is_base_game = widget.property("is_base_game") or False
         
         # For array items, we'll add to the existing layout instead of replacing
         self.is_array_item = old_value is None and isinstance(widget, QWidget) and widget.layout() is not None
         if not self.is_array_item:
-            # Move the original widget into our container
-            widget.setParent(self.container)
-            self.container_layout.addWidget(widget)
-            
-            # Add container to parent layout
-            self.parent_layout.insertWidget(self.widget_index, self.container)
+            # Scalar widgets are swapped in place in the parent layout, no wrapper container needed
+            self.container = None
+            self.container_layout = None
+            self.current_widget = widget
+            if self.widget_index < 0:
+                self.parent_layout.addWidget(widget)
         else:
             # For array items, we'll use the existing widget and layout
             self.container = widget
@@ -382,24 +463,28 @@ class TransformWidgetCommand:
         self.preserved_index_label = None
 
     def replace_widget(self, new_widget):
-        """Replace all widgets in container with new widget"""
-        if not self.container_layout or not new_widget:
+        """Replace the current widget with new widget, or add it to the array item's layout"""
+        if not new_widget:
             return None
             
         if not self.is_array_item:
-            # Clear all widgets from container
-            while self.container_layout.count():
-                item = self.container_layout.takeAt(0)
-                if item.widget():
-                    item.widget().hide()
-                    item.widget().deleteLater()
-                    
-            # Add new widget to container
-            self.container_layout.addWidget(new_widget)
-        else:
+            # Swap the current widget for the new one at the same spot in the parent layout
+            old_widget = self.current_widget
+            if old_widget and self.parent_layout.indexOf(old_widget) >= 0:
+                self.parent_layout.replaceWidget(old_widget, new_widget)
+                # Spin boxes go back to the GUI's pool, everything else is deleted
+                if not self.gui.release_editor_widget(old_widget):
+                    old_widget.hide()
+                    old_widget.deleteLater()
+            else:
+                self.parent_layout.addWidget(new_widget)
+            self.current_widget = new_widget
+        elif self.container_layout:
             # For array items, just add the new widget to the existing layout
             self.container_layout.addWidget(new_widget)
             self.added_widget = new_widget  # Track the added widget for array items
+        else:
+            return None
             
         return new_widget
         
@@ -422,7 +507,7 @@ class TransformWidgetCommand:
             if new_widget:
                 # Store transformation info
                 self.is_texture = True  # We'll treat all transforms the same way
-                self.parent_container = self.container.parent() if self.container else None
+                self.parent_container = self.parent
                 
                 # For all transformations, preserve the parent container
                 if self.parent_container and self.parent_container.parent():
@@ -509,8 +594,8 @@ class TransformWidgetCommand:
                                 # Preserve index label if it exists
                                 if self.preserved_index_label:
                                     self.preserved_index_label.setParent(None)
+                                # Keep the new container for redo, like the old one is kept for undo
                                 item.widget().hide()
-                                item.widget().deleteLater()
                             break
                     
                     # Show and restore old container
@@ -570,6 +655,21 @@ class TransformWidgetCommand:
             import traceback
             traceback.print_exc()
             return None
+    
+    def release_transform_widgets(self):
+        """Delete the container hidden for undo/redo and drop all widget references"""
+        for container in (self.old_container, self.new_container):
+            try:
+                if container is not None and container.isHidden():
+                    container.deleteLater()
+            except RuntimeError:
+                pass  # Already deleted with its view
+        self.is_texture = False
+        self.old_container = self.new_container = self.parent_container = None
+        self.container = self.container_layout = self.current_widget = None
+        self.parent = self.parent_layout = None
+        self.preserved_index_label = None
+        self.source_widget = self.added_widget = None
 
 class EditValueCommand(Command):
     """Command for editing a value in a data structure"""
@@ -649,7 +749,7 @@ class AddArrayItemCommand(TransformWidgetCommand):
                     
                     # Add index label first
                     index_label = QLabel(f"[{self.data_path[-1]}]")
-                    index_label.setProperty("data_path", self.data_path)
+                    self.gui.set_widget_path(index_label, self.data_path)
                     index_label.setProperty("array_data", updated_array)  # Use updated array data
                     index_label.setStyleSheet("QLabel { color: gray; }")
                     
@@ -674,12 +774,7 @@ class AddArrayItemCommand(TransformWidgetCommand):
                     def find_array_content_layout():
                         """Find the array's content layout in the UI"""
                         # Find the schema view first
-                        schema_view = None
-                        for widget in self.gui.findChildren(QWidget):
-                            if (hasattr(widget, 'property') and 
-                                widget.property("file_path") == str(self.file_path)):
-                                schema_view = widget
-                                break
+                        schema_view = self.gui.find_schema_view(self.file_path)
                         
                         if not schema_view:
                             return None
@@ -688,7 +783,7 @@ class AddArrayItemCommand(TransformWidgetCommand):
                         array_path = self.data_path[:-1]  # Remove the index
                         array_button = None
                         for widget in schema_view.findChildren(QToolButton):
-                            if widget.property("data_path") == array_path:
+                            if self.gui.widget_path(widget) == array_path:
                                 array_button = widget
                                 break
                         
@@ -756,12 +851,7 @@ class AddArrayItemCommand(TransformWidgetCommand):
                 """Find the widget in the UI by its data path"""
                 try:
                     # Find the schema view first
-                    schema_view = None
-                    for widget in self.gui.findChildren(QWidget):
-                        if (hasattr(widget, 'property') and 
-                            widget.property("file_path") == str(self.file_path)):
-                            schema_view = widget
-                            break
+                    schema_view = self.gui.find_schema_view(self.file_path)
                     
                     if not schema_view:
                         print("Could not find schema view")
@@ -891,10 +981,10 @@ class DeleteArrayItemCommand(Command):
                         if isinstance(index_label, QLabel):
                             index_label.setText(f"[{i}]")
                             # Update data path property
-                            data_path = index_label.property("data_path")
+                            data_path = self.gui.widget_path(index_label)
                             if data_path:
                                 data_path = data_path[:-1] + [i]  # Update index
-                                index_label.setProperty("data_path", data_path)
+                                self.gui.set_widget_path(index_label, data_path)
             
         except Exception as e:
             print(f"Error executing delete array item command: {str(e)}")
@@ -1080,8 +1170,8 @@ class AddPropertyCommand(Command):
                             toggle_btn.setStyleSheet("QToolButton { border: none; font-weight: bold; }")
                     
                     # Store data path and value for context menu
-                    toggle_btn.setProperty("data_path", self.data_path + [self.prop_name])
-                    toggle_btn.setProperty("original_value", default_value)
+                    self.gui.set_widget_path(toggle_btn, self.data_path + [self.prop_name])
+                    self.gui.set_widget_original(toggle_btn, default_value)
                     
                     # Add context menu
                     toggle_btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -1130,7 +1220,7 @@ class AddPropertyCommand(Command):
                     
                     # Add context menu to label
                     label.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-                    label.setProperty("data_path", self.data_path + [self.prop_name])
+                    self.gui.set_widget_path(label, self.data_path + [self.prop_name])
                     label.customContextMenuRequested.connect(
                         lambda pos, w=label, v=default_value: self.gui.show_context_menu(w, pos, v)
                     )
@@ -1202,12 +1292,12 @@ class DeletePropertyCommand(Command):
         self.property_name = property_name.split("_(")[0]
         
         # Get the full data path from the widget
-        data_path = property_widget.property("data_path")
+        data_path = gui.widget_path(property_widget)
         if not data_path:
             # Try parent widget if this one doesn't have the path
             parent = property_widget.parent()
             if parent:
-                data_path = parent.property("data_path")
+                data_path = gui.widget_path(parent)
         
         print(f"Full data path from widget: {data_path}")
         print(f"Property name after stripping suffix: {self.property_name}")
@@ -1292,12 +1382,7 @@ class DeletePropertyCommand(Command):
                 self.gui.update_data_value(self.data_path, self.new_value)
             
             # Find the widget to remove
-            schema_view = None
-            for widget in self.gui.findChildren(QWidget):
-                if (hasattr(widget, 'property') and 
-                    widget.property("file_path") == str(self.file_path)):
-                    schema_view = widget
-                    break
+            schema_view = self.gui.find_schema_view(self.file_path)
 
             if not schema_view:
                 print("Could not find schema view")
@@ -1334,7 +1419,7 @@ class DeletePropertyCommand(Command):
                     # If we can't find the collapsible button, try to find the property's row widget
                     for widget in schema_view.findChildren(QWidget):
                         if (hasattr(widget, 'property') and 
-                            widget.property("data_path") == self.full_path):
+                            self.gui.widget_path(widget) == self.full_path):
                             collapsible_widget = widget.parent()
                             break
 
@@ -1399,12 +1484,7 @@ class DeletePropertyCommand(Command):
                     )
                     if new_widget:
                         # Find parent widget to add to
-                        schema_view = None
-                        for widget in self.gui.findChildren(QWidget):
-                            if (hasattr(widget, 'property') and 
-                                widget.property("file_path") == str(self.file_path)):
-                                schema_view = widget
-                                break
+                        schema_view = self.gui.find_schema_view(self.file_path)
                         
                         if schema_view:
                             # Find the parent container
@@ -1412,7 +1492,7 @@ class DeletePropertyCommand(Command):
                             parent_container = None
                             for widget in schema_view.findChildren(QWidget):
                                 if (hasattr(widget, 'property') and 
-                                    widget.property("data_path") == parent_path):
+                                    self.gui.widget_path(widget) == parent_path):
                                     parent_container = widget
                                     break
                             
@@ -1533,18 +1613,18 @@ class CreateFileFromCopy(Command):
             self.created_file_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Write the new file
-            with open(self.created_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.source_data, f, indent=4)
+            write_json_file(self.created_file_path, self.source_data)
+            self.gui.update_entity_file_index(self.created_file_path, True)
                 
             # Write the manifest file if it exists
             if self.manifest_file_path:
-                with open(self.manifest_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.new_manifest_data, f, indent=4)
+                write_json_file(self.manifest_file_path, self.new_manifest_data)
                 
                 # Update the GUI's manifest data
                 if self.source_type not in self.gui.manifest_data['mod']:
                     self.gui.manifest_data['mod'][self.source_type] = {}
                 self.gui.manifest_data['mod'][self.source_type][self.new_name] = self.source_data
+                self.gui.rebuild_manifest_index()
             
             # Update the appropriate list based on file type
             self.update_list_for_type()
@@ -1563,18 +1643,19 @@ class CreateFileFromCopy(Command):
             if self.created_file_path and self.created_file_path.exists():
                 print(f"Deleting created file: {self.created_file_path}")
                 self.created_file_path.unlink()
+                self.gui.update_entity_file_index(self.created_file_path, False)
                 
             # Restore old manifest data if it exists
             if self.manifest_file_path and self.old_manifest_data:
                 print(f"Restoring old manifest data to: {self.manifest_file_path}")
                 print(f"Old manifest data: {self.old_manifest_data}")
-                with open(self.manifest_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.old_manifest_data, f, indent=4)
+                write_json_file(self.manifest_file_path, self.old_manifest_data)
                     
                 # Remove from GUI's manifest data
                 if self.source_type in self.gui.manifest_data['mod']:
                     print(f"Removing {self.new_name} from GUI manifest data")
                     self.gui.manifest_data['mod'][self.source_type].pop(self.new_name, None)
+                    self.gui.rebuild_manifest_index()
                 
             # Update the appropriate list based on file type
             self.update_list_for_type()
@@ -1634,6 +1715,7 @@ class CreateFileFromCopy(Command):
                             # Always add base game files, even if they exist in mod folder
                             item = QListWidgetItem(file.stem)
                             item.setForeground(QColor(150, 150, 150))
+                            item.setData(Qt.ItemDataRole.UserRole, True)  # Marks a base game item
                             font = item.font()
                             font.setItalic(True)
                             item.setFont(font)
@@ -1678,6 +1760,7 @@ class CreateFileFromCopy(Command):
                             # Always add base game files, even if they exist in mod folder
                             item = QListWidgetItem(file.stem)
                             item.setForeground(QColor(150, 150, 150))
+                            item.setData(Qt.ItemDataRole.UserRole, True)  # Marks a base game item
                             font = item.font()
                             font.setItalic(True)
                             item.setFont(font)
@@ -1701,6 +1784,7 @@ class CreateFileFromCopy(Command):
                             if base_file.exists():
                                 item = QListWidgetItem(unit_id)
                                 item.setForeground(QColor(150, 150, 150))
+                                item.setData(Qt.ItemDataRole.UserRole, True)  # Marks a base game item
                                 font = item.font()
                                 font.setItalic(True)
                                 item.setFont(font)
@@ -1723,6 +1807,7 @@ class CreateFileFromCopy(Command):
                             if base_file.exists():
                                 item = QListWidgetItem(unit_id)
                                 item.setForeground(QColor(150, 150, 150))
+                                item.setData(Qt.ItemDataRole.UserRole, True)  # Marks a base game item
                                 font = item.font()
                                 font.setItalic(True)
                                 item.setFont(font)
@@ -1751,6 +1836,7 @@ class CreateFileFromCopy(Command):
                             # Always add base game files, even if they exist in mod folder
                             item = QListWidgetItem(file.stem)
                             item.setForeground(QColor(150, 150, 150))
+                            item.setData(Qt.ItemDataRole.UserRole, True)  # Marks a base game item
                             font = item.font()
                             font.setItalic(True)
                             item.setFont(font)
@@ -1792,6 +1878,7 @@ class CreateLocalizedText(Command):
             if self.language not in self.gui.all_localized_strings['mod']:
                 self.gui.all_localized_strings['mod'][self.language] = {}
             self.gui.all_localized_strings['mod'][self.language][self.key] = self.text
+            self.gui.refresh_localized_key(self.key)
             
             return True
             
@@ -1807,6 +1894,7 @@ class CreateLocalizedText(Command):
             # Remove the key from GUI's in-memory strings
             if self.language in self.gui.all_localized_strings['mod']:
                 self.gui.all_localized_strings['mod'][self.language].pop(self.key, None)
+                self.gui.refresh_localized_key(self.key)
             
             return True
             
@@ -1934,8 +2022,7 @@ class CreateResearchSubjectCommand(Command):
 
             # Update the research subject file with new settings if provided
             if hasattr(self, 'subject_data'):
-                with open(self.subject_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.subject_data, f, indent=4)
+                write_json_file(self.subject_file, self.subject_data)
 
             # Update only the specific research array
             self.gui.command_stack.update_file_data(self.file_path, self.new_value)
@@ -1993,6 +2080,7 @@ class DeleteFileCommand(Command):
         self.new_manifest_data = None
         self.file_data = None  # Store file contents for undo
         self.manifest_mod_data = None  # Store mod manifest data for undo
+        self.stored_state = (None, False)  # Command stack data of the file, for undo
         
     def prepare(self) -> bool:
         """Prepare the command by gathering necessary data and validating the operation"""
@@ -2045,16 +2133,19 @@ class DeleteFileCommand(Command):
             # Delete the file
             if self.file_path.exists():
                 self.file_path.unlink()
+                self.gui.update_entity_file_index(self.file_path, False)
+            # Otherwise load_file would keep serving the deleted file's data
+            self.stored_state = self.gui.command_stack.forget_file(self.file_path)
 
             # Update manifest if needed
             if self.remove_manifest and self.manifest_file_path and self.new_manifest_data:
-                with open(self.manifest_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.new_manifest_data, f, indent=4)
+                write_json_file(self.manifest_file_path, self.new_manifest_data)
 
             # Always remove from GUI's manifest data when deleting the file
             # This ensures the item is removed from the list view
             if self.file_type in self.gui.manifest_data['mod']:
                 self.gui.manifest_data['mod'][self.file_type].pop(self.file_id, None)
+                self.gui.rebuild_manifest_index()
 
             # Update the appropriate list
             self.update_list_for_type()
@@ -2071,19 +2162,20 @@ class DeleteFileCommand(Command):
             # Restore the file
             if self.file_data:
                 self.file_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(self.file_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.file_data, f, indent=4)
+                write_json_file(self.file_path, self.file_data)
+                self.gui.update_entity_file_index(self.file_path, True)
+            self.gui.command_stack.restore_file(self.file_path, self.stored_state)
 
             # Restore manifest if needed
             if self.remove_manifest and self.manifest_file_path and self.old_manifest_data:
-                with open(self.manifest_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.old_manifest_data, f, indent=4)
+                write_json_file(self.manifest_file_path, self.old_manifest_data)
 
             # Restore GUI's manifest data if we had stored it
             if self.manifest_mod_data is not None:
                 if self.file_type not in self.gui.manifest_data['mod']:
                     self.gui.manifest_data['mod'][self.file_type] = {}
                 self.gui.manifest_data['mod'][self.file_type][self.file_id] = json.loads(json.dumps(self.manifest_mod_data))
+                self.gui.rebuild_manifest_index()
 
             # Update the appropriate list
             self.update_list_for_type()
@@ -2119,6 +2211,7 @@ class DeleteFileCommand(Command):
                             # Always add base game files, even if they exist in mod folder
                             item = QListWidgetItem(file.stem)
                             item.setForeground(QColor(150, 150, 150))
+                            item.setData(Qt.ItemDataRole.UserRole, True)  # Marks a base game item
                             font = item.font()
                             font.setItalic(True)
                             item.setFont(font)
@@ -2163,6 +2256,7 @@ class DeleteFileCommand(Command):
                             # Always add base game files, even if they exist in mod folder
                             item = QListWidgetItem(file.stem)
                             item.setForeground(QColor(150, 150, 150))
+                            item.setData(Qt.ItemDataRole.UserRole, True)  # Marks a base game item
                             font = item.font()
                             font.setItalic(True)
                             item.setFont(font)
@@ -2186,6 +2280,7 @@ class DeleteFileCommand(Command):
                                 if base_file.exists():
                                     item = QListWidgetItem(unit_id)
                                     item.setForeground(QColor(150, 150, 150))
+                                    item.setData(Qt.ItemDataRole.UserRole, True)  # Marks a base game item
                                     font = item.font()
                                     font.setItalic(True)
                                     item.setFont(font)
@@ -2208,6 +2303,7 @@ class DeleteFileCommand(Command):
                             if base_file.exists():
                                 item = QListWidgetItem(unit_id)
                                 item.setForeground(QColor(150, 150, 150))
+                                item.setData(Qt.ItemDataRole.UserRole, True)  # Marks a base game item
                                 font = item.font()
                                 font.setItalic(True)
                                 item.setFont(font)
@@ -2236,6 +2332,7 @@ class DeleteFileCommand(Command):
                             # Always add base game files, even if they exist in mod folder
                             item = QListWidgetItem(file.stem)
                             item.setForeground(QColor(150, 150, 150))
+                            item.setData(Qt.ItemDataRole.UserRole, True)  # Marks a base game item
                             font = item.font()
                             font.setItalic(True)
                             item.setFont(font)
@@ -2256,6 +2353,7 @@ class DeleteResearchSubjectCommand(Command):
         self.manifest_file = gui.current_folder / "entities" / "research_subject.entity_manifest"
         self.manifest_data = None
         self.subject_data = None
+        self.stored_state = (None, False)  # Command stack data of the subject file, for undo
         
     def prepare(self) -> bool:
         """Prepare the command by gathering necessary data and validating the operation"""
@@ -2323,6 +2421,9 @@ class DeleteResearchSubjectCommand(Command):
                 # Delete the subject file
                 if self.subject_file.exists():
                     self.subject_file.unlink()
+                    self.gui.update_entity_file_index(self.subject_file, False)
+                # Otherwise load_file would keep serving the deleted file's data
+                self.stored_state = self.gui.command_stack.forget_file(self.subject_file)
 
                 # Update the manifest file
                 if self.manifest_file.exists() and self.manifest_data:
@@ -2334,12 +2435,12 @@ class DeleteResearchSubjectCommand(Command):
                         self.gui.command_stack.modified_files.add(self.manifest_file)
                         
                         # Write to file
-                        with open(self.manifest_file, 'w', encoding='utf-8') as f:
-                            json.dump(manifest_data, f, indent=4)
+                        write_json_file(self.manifest_file, manifest_data)
 
                     # Remove from GUI's manifest data
                     if 'research_subject' in self.gui.manifest_data['mod']:
                         self.gui.manifest_data['mod']['research_subject'].pop(self.subject_id, None)
+                        self.gui.rebuild_manifest_index()
 
             # Now do UI updates
             self.gui.update_data_value(self.array_path, self.new_value['research'][self.array_path[-1]])
@@ -2364,8 +2465,9 @@ class DeleteResearchSubjectCommand(Command):
                 # Restore the subject file
                 if self.subject_data:
                     self.subject_file.parent.mkdir(parents=True, exist_ok=True)
-                    with open(self.subject_file, 'w', encoding='utf-8') as f:
-                        json.dump(self.subject_data, f, indent=4)
+                    write_json_file(self.subject_file, self.subject_data)
+                    self.gui.update_entity_file_index(self.subject_file, True)
+                self.gui.command_stack.restore_file(self.subject_file, self.stored_state)
 
                 # Restore the manifest file
                 if self.manifest_data:
@@ -2374,14 +2476,14 @@ class DeleteResearchSubjectCommand(Command):
                     self.gui.command_stack.modified_files.add(self.manifest_file)
                     
                     # Write to file
-                    with open(self.manifest_file, 'w', encoding='utf-8') as f:
-                        json.dump(self.manifest_data, f, indent=4)
+                    write_json_file(self.manifest_file, self.manifest_data)
 
                     # Restore GUI's manifest data
                     if self.subject_data:
                         if 'research_subject' not in self.gui.manifest_data['mod']:
                             self.gui.manifest_data['mod']['research_subject'] = {}
                         self.gui.manifest_data['mod']['research_subject'][self.subject_id] = self.subject_data
+                        self.gui.rebuild_manifest_index()
 
             # Now do UI updates
             self.gui.update_data_value(self.array_path, self.old_value['research'][self.array_path[-1]])
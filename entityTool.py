@@ -1,38 +1,346 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, 
                             QPushButton, QLabel, QFileDialog, QHBoxLayout, 
                             QLineEdit, QListWidget, QComboBox, QTabWidget, QScrollArea, QGroupBox, QDialog, QSplitter, QToolButton,
-                            QSpinBox, QDoubleSpinBox, QCheckBox, QMessageBox, QListWidgetItem, QMenu, QTreeWidget, QTreeWidgetItem, QPlainTextEdit, QProgressBar, QApplication, QFormLayout, QInputDialog)
-from PyQt6.QtCore import (Qt, QTimer, QObject, QEvent, QPoint)
+                            QSpinBox, QDoubleSpinBox, QCheckBox, QMessageBox, QListWidgetItem, QMenu, QTreeWidget, QTreeWidgetItem, QPlainTextEdit, QProgressBar, QApplication, QFormLayout, QInputDialog, QListView)
+from PyQt6.QtCore import (Qt, QTimer, QObject, QEvent, QPoint, QDir, QDirIterator, QThread, QEventLoop, pyqtSignal)
 from PyQt6.QtGui import (QDragEnterEvent, QDropEvent, QPixmap, QIcon, QKeySequence,
-                        QColor, QShortcut, QFont)
+                        QColor, QShortcut, QFont, QPixmapCache)
 import json
 import logging
 from pathlib import Path
 from research_view import ResearchTreeView
 import os
-from command_stack import CommandStack, EditValueCommand, AddPropertyCommand, DeleteArrayItemCommand, DeletePropertyCommand, CompositeCommand, TransformWidgetCommand, AddArrayItemCommand, CreateFileFromCopy, CreateLocalizedText, CreateResearchSubjectCommand, DeleteResearchSubjectCommand, DeleteFileCommand
-from typing import List, Any
+import mmap
+import pickle
+import sys
+import time
+from command_stack import CommandStack, EditValueCommand, AddPropertyCommand, DeleteArrayItemCommand, DeletePropertyCommand, CompositeCommand, TransformWidgetCommand, AddArrayItemCommand, CreateFileFromCopy, CreateLocalizedText, CreateResearchSubjectCommand, DeleteResearchSubjectCommand, DeleteFileCommand, write_json_file
+from typing import List, Any, Callable
 import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 import pygame.mixer
 
 
 # add debug logging
 logging.basicConfig(level=logging.DEBUG)
 
+# Maximum number of decoded textures kept in memory
+TEXTURE_CACHE_SIZE = 256
+
+# Minimum seconds between loading screen label repaints forced by set_status
+STATUS_PAINT_INTERVAL = 0.02
+
+# Parsed, ref-resolved schemas from the last run, kept in the app folder
+SCHEMA_CACHE_FILE = "schema_cache.pkl"
+# Bump when schema loading or _resolve_refs changes what ends up in the cache
+SCHEMA_CACHE_VERSION = 1
+
+# Files at least this large are parsed from a memory map
+MMAP_THRESHOLD = 1 << 20
+
+# Keys shared by every manifest/entity/localized file, so each one is only stored once
+_KEY_CACHE: dict[str, str] = {}
+# Localized strings repeat a lot between languages; bounded so huge mods can't grow it forever
+_VALUE_CACHE: dict[str, str] = {}
+VALUE_CACHE_SIZE = 50000
+
+def _intern_pairs(pairs) -> dict:
+    """object_pairs_hook that reuses one str object per distinct key"""
+    return {_KEY_CACHE.setdefault(k, k): v for k, v in pairs}
+
+def _intern_localized_pairs(pairs) -> dict:
+    """Like _intern_pairs but also shares repeated string values"""
+    result = {}
+    for k, v in pairs:
+        if isinstance(v, str):
+            cached = _VALUE_CACHE.get(v)
+            if cached is not None:
+                v = cached
+            elif len(_VALUE_CACHE) < VALUE_CACHE_SIZE:
+                _VALUE_CACHE[v] = v
+        result[_KEY_CACHE.setdefault(k, k)] = v
+    return result
+
+# Decoders are built once and shared, json.loads makes a new one whenever a hook is passed
+_DECODER = json.JSONDecoder()
+_INTERN_DECODER = json.JSONDecoder(object_pairs_hook=_intern_pairs)
+_LOCALIZED_DECODER = json.JSONDecoder(object_pairs_hook=_intern_localized_pairs)
+
+class _LazyJsonDict(dict):
+    """Dict whose values are JSON file paths until first looked up, then the parsed data"""
+    decoder = _INTERN_DECODER
+    
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if isinstance(value, Path):
+            try:
+                loaded = _read_json_fast(value, self.decoder)
+                print(f"Loaded {key} from {value}")
+            except Exception as e:
+                print(f"Error loading {value}: {str(e)}")
+                loaded = self.failed_value()
+            dict.__setitem__(self, key, loaded)
+            value = loaded
+        return value
+    
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+    
+    def failed_value(self):
+        return None
+
+class _LazyLanguageDict(_LazyJsonDict):
+    """{language: {key: text}} that holds file paths until a language is first looked up"""
+    decoder = _LOCALIZED_DECODER
+    
+    def failed_value(self):
+        return {}
+
+def _iter_files(folder, suffix: str):
+    """Yield the files in a folder whose name ends with suffix, one readdir pass without fnmatch"""
+    with os.scandir(folder) as it:
+        for entry in it:
+            if entry.name.endswith(suffix) and entry.is_file():
+                yield Path(entry.path)
+
+def _read_json_fast(path, decoder=_DECODER) -> Any:
+    """Parse a JSON file from a single bytes buffer instead of a buffered text read"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                raw = mm[:]
+        else:
+            raw = f.read()
+    # Same encoding detection as json.loads, so a BOM is still accepted
+    return decoder.decode(raw.decode(json.detect_encoding(raw)))
+
+# Texture file extensions indexed by load_all_texture_files, lowercase without the dot
+_TEXTURE_SUFFIXES = frozenset(('png', 'dds'))
+
+# Maximum number of detached collapsible sections kept for reuse
+GROUP_WIDGET_POOL_SIZE = 256
+# Maximum number of detached spin boxes kept for reuse, per spin box type
+EDITOR_WIDGET_POOL_SIZE = 64
+
+# Property names that reference entities, mapped to their manifest type
+_MANIFEST_TYPE_MAP = {
+    "weapon": "weapon",
+    "weapons": "weapon",
+    "skins": "unit_skin",
+    "skin": "unit_skin",
+    "abilities": "ability",
+    "ability": "ability",
+    "action_data_source": "action_data_source",
+    "buffs": "buff",
+    "buff": "buff",
+    "item": "unit_item",
+    "unit_items": "unit_item",
+    "unit_item": "unit_item",
+    "formations": "formation",
+    "formation": "formation",
+    "flight_patterns": "flight_pattern",
+    "flight_pattern": "flight_pattern",
+    "npc_rewards": "npc_reward",
+    "npc_reward": "npc_reward",
+    "exotics": "exotic",
+    "exotic": "exotic",
+    "uniforms": "uniform",
+    "uniform": "uniform",
+    "research_subjects": "research_subject",
+    "research_subject": "research_subject"
+}
+
+# Value styles, set as the "valueStyle" property and matched by rules in style.qss
+# so widgets share the window stylesheet instead of each parsing their own
+_BASE_GAME_STYLE = "baseGame"  # Read-only base game values
+_ITALIC_STYLE = "italic"  # Entity references, localized keys and textures
+_MUTED_STYLE = "muted"  # Read-only text that isn't otherwise marked
+
+# Value types rendered as a single inline widget
+_PRIMITIVES = (str, int, float, bool)
+
+# stateChanged sends a plain int, compare against this instead of resolving the enum each time
+_CHECKED = Qt.CheckState.Checked.value
+
+# Folder this module ships in, icons and the stylesheet live next to it
+_MODULE_DIR = Path(__file__).parent
+# Folder for files the tool writes for itself, the executable's folder in a frozen build
+_APP_DIR = Path(sys.executable).parent if getattr(sys, 'frozen', False) else _MODULE_DIR
+
+# Toolbar/button icons, each file is decoded once: {file name: QIcon}
+_ICON_DIR = _MODULE_DIR / "icons"
+_ICON_CACHE: dict[str, QIcon] = {}
+
+def _icon(name: str) -> QIcon:
+    """Get the icon for a file in the icons folder, loading it on first use"""
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        icon = _ICON_CACHE[name] = QIcon(str(_ICON_DIR / name))
+    return icon
+
+@contextmanager
+def _batched_list(list_widget: QListWidget):
+    """Hold a list widget's repaints and signals while rows are added, so it lays out and repaints once"""
+    list_widget.setUpdatesEnabled(False)
+    was_blocked = list_widget.blockSignals(True)
+    try:
+        yield list_widget
+    finally:
+        list_widget.blockSignals(was_blocked)
+        list_widget.setUpdatesEnabled(True)
+
+def _style_base_game_item(item: QListWidgetItem) -> None:
+    """Grey out and italicize a list item that comes from the base game"""
+    item.setForeground(QColor(150, 150, 150))
+    font = item.font()
+    font.setItalic(True)
+    item.setFont(font)
+
+def _fill_list(list_widget: QListWidget, names, base_names=()) -> None:
+    """Append mod names, then base game names marked in UserRole, in one batch"""
+    with _batched_list(list_widget):
+        list_widget.addItems(names)
+        for name in base_names:
+            item = QListWidgetItem(name)
+            _style_base_game_item(item)
+            item.setData(Qt.ItemDataRole.UserRole, True)  # Marks a base game item
+            list_widget.addItem(item)
+
+# Display labels per property name: {name: ("Title Case", "Title Case:")}
+_LABEL_CACHE: dict[str, tuple[str, str]] = {}
+
+def _labels(name: str) -> tuple[str, str]:
+    """Get the title text and the label text for a property name"""
+    labels = _LABEL_CACHE.get(name)
+    if labels is None:
+        title = name.replace("_", " ").title()
+        labels = (title, title + ":")
+        _LABEL_CACHE[name] = labels
+    return labels
+
+_LOWER_CACHE: dict[str, str] = {}
+
+def _lower_key(name: str) -> str:
+    """Get the interned lower-case form of a property name"""
+    lowered = _LOWER_CACHE.get(name)
+    if lowered is None:
+        lowered = _LOWER_CACHE[name] = sys.intern(name.lower())
+    return lowered
+
+_SCHEMA_NAME_CACHE: dict[tuple[str, str], str] = {}
+
+def _schema_name(file_type: str, stem: str = None) -> str:
+    """Get the schema name for a file type, uniforms are looked up by file stem"""
+    key = (file_type, stem)
+    name = _SCHEMA_NAME_CACHE.get(key)
+    if name is None:
+        if file_type == "uniform":
+            # Convert from snake_case to kebab-case and append -uniforms-schema
+            name = stem.replace("_", "-") + "-uniforms-schema" if stem else "uniforms-schema"
+        else:
+            # Convert from snake_case to kebab-case for schema lookup
+            name = file_type.replace("_", "-") + "-schema"
+        _SCHEMA_NAME_CACHE[key] = name
+    return name
+
+_VIEW_TITLE_CACHE: dict[tuple[str, bool], str] = {}
+
+def _view_title(file_type: str, is_base_game: bool) -> str:
+    """Get the details group title of a schema view"""
+    key = (file_type, is_base_game)
+    title = _VIEW_TITLE_CACHE.get(key)
+    if title is None:
+        title = f"{file_type.replace('-', ' ').title()} Details"
+        if is_base_game:
+            title += " (Base Game)"
+        _VIEW_TITLE_CACHE[key] = title
+    return title
+
+# How referenced entities are shown, by entity type:
+# (tab name, list attributes to select the entity in, details layout attribute, schema name, file attribute)
+_ENTITY_VIEWS = {
+    "weapon": ("Units", (), "weapon_details_layout", "weapon", "weapon_file"),
+    "unit_skin": ("Units", (), "skin_details_layout", "unit-skin", "skin_file"),
+    "ability": ("Abilities/Buffs", ("ability_list",), "ability_details_layout", "ability", "ability_file"),
+    "unit_item": ("Unit Items", ("items_list",), "item_details_layout", "unit-item", None),
+    "buff": ("Abilities/Buffs", ("buff_list",), "buff_details_layout", "buff", None),
+    "action_data_source": ("Abilities/Buffs", ("action_list",), "action_details_layout", "action-data-source", None),
+    "formation": ("Formations/Flight Patterns", ("formations_list",), "formation_details_layout", "formation", None),
+    "flight_pattern": ("Formations/Flight Patterns", ("patterns_list",), "pattern_details_layout", "flight-pattern", None),
+    "npc_reward": ("NPC Rewards", ("rewards_list",), "reward_details_layout", "npc-reward", None),
+    "exotic": ("Exotics", ("exotics_list",), "exotic_details_layout", "exotic", None),
+    "uniform": ("Uniforms", ("uniforms_list",), "uniform_details_layout", "uniform", None),
+    # Units can be in the buildable, strikecraft or all units list, checked in that order
+    "unit": ("Units", ("units_list", "strikecraft_list", "all_units_list"), "unit_details_layout", "unit", None),
+}
+
+# How partial updates put a new value into each editor type
+_SET_VALUE_DISPATCH = {
+    QLineEdit: lambda w, v: w.setText(str(v) if v is not None else ""),
+    QSpinBox: lambda w, v: w.setValue(int(v) if v is not None else 0),
+    QDoubleSpinBox: lambda w, v: w.setValue(float(v) if v is not None else 0.0),
+    QCheckBox: lambda w, v: w.setChecked(bool(v)),
+    QComboBox: lambda w, v: w.setCurrentText(str(v) if v is not None else ""),
+}
+
+def _value_setter(widget):
+    """Get the value setter for an editor widget, or None if it isn't one"""
+    setter = _SET_VALUE_DISPATCH.get(type(widget))
+    if setter is None:
+        # Fall back to the slower check for subclasses
+        for widget_type, type_setter in _SET_VALUE_DISPATCH.items():
+            if isinstance(widget, widget_type):
+                return type_setter
+    return setter
+
+# Schema properties shown first in object views, in this order
+PRIORITY_RANK = {name: i for i, name in enumerate(("name", "description", "id", "type", "version"))}
+
+class _LogBridge(QObject):
+    """Carries log messages to the GUI thread, records can come from worker threads"""
+    message = pyqtSignal(str)
+
 class GUILogHandler(logging.Handler):
     def __init__(self, log_widget):
         super().__init__()
         self.log_widget = log_widget
+        self.bridge = _LogBridge()
+        self.bridge.message.connect(self.append_message)
+        # Colors are resolved once instead of per line
+        self.error_color = QColor(Qt.GlobalColor.red)
+        self.normal_color = QColor(Qt.GlobalColor.black)
+        # Messages arriving close together are added to the list in one batch
+        self.pending_messages = []
+        self.flush_timer = QTimer()
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(16)
+        self.flush_timer.timeout.connect(self.flush_messages)
         
     def emit(self, record):
-        msg = self.format(record)
-        self.log_widget.addItem(msg)
-        item = self.log_widget.item(self.log_widget.count() - 1)
-        item.setForeground(Qt.GlobalColor.red if 'ERROR' in msg else Qt.GlobalColor.black)
+        self.bridge.message.emit(self.format(record))
+        
+    def append_message(self, msg):
+        self.pending_messages.append(msg)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+    
+    def flush_messages(self):
+        """Add the queued messages to the log widget and scroll to the bottom once"""
+        messages, self.pending_messages = self.pending_messages, []
+        if not messages:
+            return
+        first_row = self.log_widget.count()
+        self.log_widget.addItems(messages)
+        for row, msg in enumerate(messages, first_row):
+            self.log_widget.item(row).setForeground(self.error_color if 'ERROR' in msg else self.normal_color)
         self.log_widget.scrollToBottom()
 
 class LoadingDialog(QDialog):
     """Loading screen dialog shown during program initialization"""
+    statusChanged = pyqtSignal(str)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Loading Entity Tool")
@@ -57,11 +365,68 @@ class LoadingDialog(QDialog):
         self.progress.setTextVisible(False)
         self.progress.setRange(0, 0)  # Indeterminate progress
         layout.addWidget(self.progress)
+        self._last_paint = 0.0  # time.monotonic() of the last forced repaint
+        
+        # Status text goes through a queued signal so it is applied by the event loop
+        self.statusChanged.connect(self.status_label.setText, Qt.ConnectionType.QueuedConnection)
         
     def set_status(self, text: str):
         """Update the status text"""
-        self.status_label.setText(text)
-        QApplication.processEvents()  # Force UI update
+        self.statusChanged.emit(text)
+        # Busy on the GUI thread there is no event loop to deliver it, so apply just the label's
+        # queued update and paint it, at most every STATUS_PAINT_INTERVAL. Unlike processEvents this
+        # can't run timers or other handlers in the middle of startup.
+        if QThread.currentThread() is not self.thread():
+            return
+        now = time.monotonic()
+        if now - self._last_paint >= STATUS_PAINT_INTERVAL:
+            self._last_paint = now
+            QApplication.sendPostedEvents(self.status_label, QEvent.Type.MetaCall.value)
+            self.status_label.repaint()
+
+class StartupWorker(QObject):
+    """Runs startup steps that only read files on a worker thread, reporting each step's status"""
+    progress = pyqtSignal(str)
+    finished = pyqtSignal()
+    
+    def __init__(self, steps):
+        super().__init__()
+        self.steps = steps  # [(status text, callable)]
+        self.error = None
+        
+    def run(self):
+        try:
+            for status, step in self.steps:
+                self.progress.emit(status)
+                step()
+        except Exception as e:
+            self.error = e  # Re-raised on the GUI thread
+        self.finished.emit()
+
+class LazySchemaPanel(QWidget):
+    """Schema view content that is only built once shown, and rebuilt on show if it changed while hidden"""
+    def __init__(self, build):
+        super().__init__()
+        self.build = build  # Called with the data to build the content for
+        self.pending_data = None
+        self.is_dirty = False
+        
+    def request_build(self, data):
+        """Build now if visible, otherwise on the next show"""
+        self.pending_data = data
+        self.is_dirty = True
+        if self.isVisible():
+            self.build_pending()
+            
+    def build_pending(self):
+        if self.is_dirty:
+            self.is_dirty = False
+            data, self.pending_data = self.pending_data, None
+            self.build(data)
+            
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.build_pending()
 
 class EntityToolGUI(QMainWindow):
     def __init__(self):
@@ -96,19 +461,49 @@ class EntityToolGUI(QMainWindow):
                 'mod': {},      # {manifest_type: {id: data}}
                 'base_game': {} # {manifest_type: {id: data}}
             }
-            self.texture_cache = {}
+            self._manifest_index_mod = {}  # {entity_id: [manifest types]} in manifest order
+            self._manifest_index_base = {}
+            self.texture_cache = OrderedDict()  # LRU of {cache_key: (pixmap, is_base_game)}
+            QPixmapCache.setCacheLimit(100 * 1024)  # Shared decoded image cache, in KB
             self.schemas = {}
             self.schema_extensions = set()
-            self.all_texture_files = {'mod': set(), 'base_game': set()}
+            self.all_texture_files = {'mod': {}, 'base_game': {}}  # {stem: file name}
+            self._texture_set = frozenset()  # Names of all mod and base game textures
+            self.all_entity_files = {'mod': {}, 'base_game': {}}  # {extension: set of stems} in entities/
             self.all_localized_strings = {
                 'mod': {},
                 'base_game': {}
             }
+            self._sorted_props_cache = {}  # {id(properties): (properties, sorted items)}
+            self._ref_cache = {}  # {id(root schema): (root schema, {$ref: target})}
+            self._classify_cache = {}  # {(string value, property name): (kind, payload)}
+            self._widget_paths = {}  # {id(widget): data path tuple}
+            self._widget_original = {}  # {id(widget): original value}
+            self._widgets_by_path = {}  # {data path tuple: [widgets]} across all views
+            self._schema_views = {}  # {file path: schema view scroll area}
+            self._entity_paths = {}  # {(entity id, extension, is base game): file path}
+            self.save_btn = self.undo_btn = self.redo_btn = None  # Created in init_ui
+            self._button_state = (False, False, False)  # Last (save, undo, redo) enabled states
+            self._group_widget_pool = []  # Detached collapsible sections ready for reuse
+            self._editor_pool = {QSpinBox: [], QDoubleSpinBox: []}  # Detached, already connected spin boxes
+            self._domain_bg_cache = {}  # {domain: ([(field id, picture)], {field id: QPixmap})}
+            self._schema_dispatch = {
+                "object": self._build_object_widget,
+                "array": self._build_array_widget
+            }
+            self._merged_strings = {}  # {key: text} for current language with fallbacks applied
+            self._base_game_keys = set()  # Keys in _merged_strings that resolved from base game
             self.text_edit_timer = QTimer()
             self.text_edit_timer.setInterval(300)
             self.text_edit_timer.setSingleShot(True)
             self.text_edit_timer.timeout.connect(self.on_text_edit_timer_timeout)
             self.current_text_edit = None
+            # Typing and spinning are coalesced into one command per widget
+            self._pending_edits = {}  # {id(widget): (widget, handler, latest value)}
+            self.edit_commit_timer = QTimer()
+            self.edit_commit_timer.setInterval(300)
+            self.edit_commit_timer.setSingleShot(True)
+            self.edit_commit_timer.timeout.connect(self.flush_pending_edits)
             
             # Initialize UI components
             self.loading.set_status("Initializing UI...")
@@ -118,13 +513,6 @@ class EntityToolGUI(QMainWindow):
             self.loading.set_status("Setting up logging...")
             self.setup_logging()
             
-            # Setup timers
-            self.text_edit_timer = QTimer()
-            self.text_edit_timer.setInterval(300)
-            self.text_edit_timer.setSingleShot(True)
-            self.text_edit_timer.timeout.connect(self.on_text_edit_timer_timeout)
-            self.current_text_edit = None
-            
             # Initialize command stack
             self.loading.set_status("Initializing command system...")
             self.command_stack = CommandStack()
@@ -132,11 +520,10 @@ class EntityToolGUI(QMainWindow):
             # Load or create config
             self.loading.set_status("Loading configuration...")
             try:
-                with open('config.json', 'r') as f:
-                    self.config = json.load(f)
-                    if "base_game_folder" in self.config:
-                        self.base_game_folder = Path(self.config["base_game_folder"])
-                        print(f"Loaded base game folder from config: {self.base_game_folder}")
+                self.config = _read_json_fast('config.json')
+                if "base_game_folder" in self.config:
+                    self.base_game_folder = Path(self.config["base_game_folder"])
+                    print(f"Loaded base game folder from config: {self.base_game_folder}")
             except FileNotFoundError:
                 logging.info("No config.json found, creating default")
                 self.create_default_config()
@@ -144,13 +531,12 @@ class EntityToolGUI(QMainWindow):
                 logging.error("Error parsing config.json, creating default")
                 self.create_default_config()
             
-            # Load schemas
-            self.loading.set_status("Loading schemas...")
-            self.load_schemas()
-            
-            # Load base game manifest files
-            self.loading.set_status("Loading base game manifests...")
-            self.load_base_game_manifest_files()
+            # Load schemas and base game manifest files off the GUI thread, they only read files
+            self.run_startup_steps([
+                ("Loading schemas...", self.load_schemas),
+                ("Indexing entity files...", self.load_all_entity_files),  # Manifests only list ids that have a file
+                ("Loading base game manifests...", self.load_base_game_manifest_files),
+            ])
             
             # Apply stylesheet
             self.loading.set_status("Applying visual styles...")
@@ -175,6 +561,23 @@ class EntityToolGUI(QMainWindow):
                 self.loading = None
             raise  # Re-raise the exception for proper error handling
         
+    def run_startup_steps(self, steps) -> None:
+        """Run file loading steps on a worker thread while the loading screen keeps repainting"""
+        thread = QThread()
+        worker = StartupWorker(steps)
+        worker.moveToThread(thread)
+        loop = QEventLoop()
+        thread.started.connect(worker.run)
+        worker.progress.connect(self.loading.set_status)  # Queued, the worker lives on the other thread
+        worker.finished.connect(loop.quit)
+        thread.start()
+        # The main window isn't shown yet, so only the loading screen gets events while we wait
+        loop.exec()
+        thread.quit()
+        thread.wait()
+        if worker.error:
+            raise worker.error
+    
     def setup_logging(self):
         """Setup logging configuration"""
         # Create log list widget if not already created in init_ui
@@ -184,6 +587,7 @@ class EntityToolGUI(QMainWindow):
             
         # Create and configure the log handler
         handler = GUILogHandler(self.log_widget)
+        handler.setLevel(logging.INFO)  # DEBUG records are dropped before they are formatted
         handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
         
         # Get the root logger and add our handler
@@ -215,51 +619,24 @@ class EntityToolGUI(QMainWindow):
         left_toolbar_layout = QHBoxLayout(left_toolbar)
         left_toolbar_layout.setContentsMargins(0, 0, 0, 0)
         
-        # Folder button with icon
-        folder_btn = QPushButton()
-        folder_btn.setIcon(QIcon(str(Path(__file__).parent / "icons" / "folder.png")))
-        folder_btn.setToolTip('Open Mod Folder')
-        folder_btn.setFixedSize(32, 32)
-        folder_btn.clicked.connect(self.open_folder_dialog)
-        left_toolbar_layout.addWidget(folder_btn)
-        
-        # Settings button with icon
-        settings_btn = QPushButton()
-        settings_btn.setIcon(QIcon(str(Path(__file__).parent / "icons" / "settings.png")))
-        settings_btn.setToolTip('Settings')
-        settings_btn.setFixedSize(32, 32)
-        settings_btn.clicked.connect(self.show_settings_dialog)
-        left_toolbar_layout.addWidget(settings_btn)
-        
-        # Save button with icon
-        save_btn = QPushButton()
-        save_btn.setIcon(QIcon(str(Path(__file__).parent / "icons" / "save.png")))
-        save_btn.setToolTip('Save Changes')
-        save_btn.setFixedSize(32, 32)
-        save_btn.clicked.connect(self.save_changes)
-        save_btn.setEnabled(False)  # Initially disabled
-        self.save_btn = save_btn  # Store reference
-        left_toolbar_layout.addWidget(save_btn)
-        
-        # Undo button with icon
-        undo_btn = QPushButton()
-        undo_btn.setIcon(QIcon(str(Path(__file__).parent / "icons" / "undo.png")))
-        undo_btn.setToolTip('Undo (Ctrl+Z)')
-        undo_btn.setFixedSize(32, 32)
-        undo_btn.clicked.connect(self.undo)
-        undo_btn.setEnabled(False)  # Initially disabled
-        self.undo_btn = undo_btn  # Store reference
-        left_toolbar_layout.addWidget(undo_btn)
-        
-        # Redo button with icon
-        redo_btn = QPushButton()
-        redo_btn.setIcon(QIcon(str(Path(__file__).parent / "icons" / "redo.png")))
-        redo_btn.setToolTip('Redo (Ctrl+Y)')
-        redo_btn.setFixedSize(32, 32)
-        redo_btn.clicked.connect(self.redo)
-        redo_btn.setEnabled(False)  # Initially disabled
-        self.redo_btn = redo_btn  # Store reference
-        left_toolbar_layout.addWidget(redo_btn)
+        # Toolbar buttons: (attribute to store it in or None, icon, tooltip, slot, initially enabled)
+        toolbar_buttons = (
+            (None, "folder.png", 'Open Mod Folder', self.open_folder_dialog, True),
+            (None, "settings.png", 'Settings', self.show_settings_dialog, True),
+            ("save_btn", "save.png", 'Save Changes', self.save_changes, False),
+            ("undo_btn", "undo.png", 'Undo (Ctrl+Z)', self.undo, False),
+            ("redo_btn", "redo.png", 'Redo (Ctrl+Y)', self.redo, False),
+        )
+        for attr, icon_name, tooltip, slot, enabled in toolbar_buttons:
+            btn = QPushButton()
+            btn.setIcon(_icon(icon_name))
+            btn.setToolTip(tooltip)
+            btn.setFixedSize(32, 32)
+            btn.clicked.connect(slot)
+            btn.setEnabled(enabled)
+            if attr:
+                setattr(self, attr, btn)  # Store reference
+            left_toolbar_layout.addWidget(btn)
         
         toolbar_layout.addWidget(left_toolbar)
         toolbar_layout.addStretch()
@@ -277,7 +654,7 @@ class EntityToolGUI(QMainWindow):
 
         # Add/Delete Player button
         add_player_btn = QPushButton()
-        add_player_btn.setIcon(QIcon(str(Path(__file__).parent / "icons" / "add_delete.png")))
+        add_player_btn.setIcon(_icon("add_delete.png"))
         add_player_btn.setToolTip('Add/Delete Player')
         add_player_btn.setFixedSize(20, 20)
         add_player_btn.clicked.connect(self.show_add_player_dialog)
@@ -408,7 +785,7 @@ class EntityToolGUI(QMainWindow):
         items_list_group = QGroupBox("Unit Items")
         items_list_layout = QVBoxLayout()
         self.items_list = QListWidget()
-        self.items_list.itemClicked.connect(self.on_item_selected)
+        self.items_list.itemClicked.connect(lambda item: self.on_entity_selected(item, "unit_item"))
         self.setup_list_context_menu(self.items_list, "unit_item")
         items_list_layout.addWidget(self.items_list)
         items_list_group.setLayout(items_list_layout)
@@ -442,7 +819,7 @@ class EntityToolGUI(QMainWindow):
         ability_group = QGroupBox("Abilities")
         ability_layout = QVBoxLayout()
         self.ability_list = QListWidget()
-        self.ability_list.itemClicked.connect(self.on_ability_selected)
+        self.ability_list.itemClicked.connect(lambda item: self.on_entity_selected(item, "ability"))
         self.setup_list_context_menu(self.ability_list, "ability")
         ability_layout.addWidget(self.ability_list)
         ability_group.setLayout(ability_layout)
@@ -452,7 +829,7 @@ class EntityToolGUI(QMainWindow):
         action_group = QGroupBox("Action Data Sources")
         action_layout = QVBoxLayout()
         self.action_list = QListWidget()
-        self.action_list.itemClicked.connect(self.on_action_selected)
+        self.action_list.itemClicked.connect(lambda item: self.on_entity_selected(item, "action_data_source"))
         self.setup_list_context_menu(self.action_list, "action_data_source")
         action_layout.addWidget(self.action_list)
         action_group.setLayout(action_layout)
@@ -462,7 +839,7 @@ class EntityToolGUI(QMainWindow):
         buff_group = QGroupBox("Buffs")
         buff_layout = QVBoxLayout()
         self.buff_list = QListWidget()
-        self.buff_list.itemClicked.connect(self.on_buff_selected)
+        self.buff_list.itemClicked.connect(lambda item: self.on_entity_selected(item, "buff"))
         self.setup_list_context_menu(self.buff_list, "buff")
         buff_layout.addWidget(self.buff_list)
         buff_group.setLayout(buff_layout)
@@ -527,7 +904,7 @@ class EntityToolGUI(QMainWindow):
         formations_group = QGroupBox("Formations")
         formations_list_layout = QVBoxLayout()
         self.formations_list = QListWidget()
-        self.formations_list.itemClicked.connect(self.on_formation_selected)
+        self.formations_list.itemClicked.connect(lambda item: self.on_entity_selected(item, "formation"))
         self.setup_list_context_menu(self.formations_list, "formation")
         formations_list_layout.addWidget(self.formations_list)
         formations_group.setLayout(formations_list_layout)
@@ -537,7 +914,7 @@ class EntityToolGUI(QMainWindow):
         patterns_group = QGroupBox("Flight Patterns")
         patterns_list_layout = QVBoxLayout()
         self.patterns_list = QListWidget()
-        self.patterns_list.itemClicked.connect(self.on_pattern_selected)
+        self.patterns_list.itemClicked.connect(lambda item: self.on_entity_selected(item, "flight_pattern"))
         self.setup_list_context_menu(self.patterns_list, "flight_pattern")
         patterns_list_layout.addWidget(self.patterns_list)
         patterns_group.setLayout(patterns_list_layout)
@@ -584,7 +961,7 @@ class EntityToolGUI(QMainWindow):
         rewards_list_group = QGroupBox("NPC Rewards")
         rewards_list_layout = QVBoxLayout()
         self.rewards_list = QListWidget()
-        self.rewards_list.itemClicked.connect(self.on_reward_selected)
+        self.rewards_list.itemClicked.connect(lambda item: self.on_entity_selected(item, "npc_reward"))
         self.setup_list_context_menu(self.rewards_list, "npc_reward")
         rewards_list_layout.addWidget(self.rewards_list)
         rewards_list_group.setLayout(rewards_list_layout)
@@ -614,7 +991,7 @@ class EntityToolGUI(QMainWindow):
         exotics_list_group = QGroupBox("Exotics")
         exotics_list_layout = QVBoxLayout()
         self.exotics_list = QListWidget()
-        self.exotics_list.itemClicked.connect(self.on_exotic_selected)
+        self.exotics_list.itemClicked.connect(lambda item: self.on_entity_selected(item, "exotic"))
         self.setup_list_context_menu(self.exotics_list, "exotic")
         exotics_list_layout.addWidget(self.exotics_list)
         exotics_list_group.setLayout(exotics_list_layout)
@@ -644,7 +1021,7 @@ class EntityToolGUI(QMainWindow):
         uniforms_list_group = QGroupBox("Uniforms")
         uniforms_list_layout = QVBoxLayout()
         self.uniforms_list = QListWidget()
-        self.uniforms_list.itemClicked.connect(self.on_uniform_selected)
+        self.uniforms_list.itemClicked.connect(lambda item: self.on_entity_selected(item, "uniform"))
         self.setup_list_context_menu(self.uniforms_list, "uniform")
         uniforms_list_layout.addWidget(self.uniforms_list)
         uniforms_list_group.setLayout(uniforms_list_layout)
@@ -670,6 +1047,30 @@ class EntityToolGUI(QMainWindow):
         meta_widget.setWidget(meta_content)
         self.tab_widget.addTab(meta_widget, "Mod Meta Data")
         
+        # Tabs are fixed after construction, so look their indices up by name once
+        self._tab_index_by_name = {self.tab_widget.tabText(i): i for i in range(self.tab_widget.count())}
+        
+        # Resolve the widget attribute names of _ENTITY_VIEWS once the widgets exist
+        self._entity_handlers = {
+            entity_type: (tab_name, tuple(getattr(self, name) for name in list_names),
+                          getattr(self, layout_name), schema_name, file_attr)
+            for entity_type, (tab_name, list_names, layout_name, schema_name, file_attr) in _ENTITY_VIEWS.items()
+        }
+        
+        # {list widget: {item text: row}}, built on first lookup and dropped whenever the list's rows change
+        self._list_index = {}
+        for _, list_widgets, _, _, _ in self._entity_handlers.values():
+            for list_widget in list_widgets:
+                # Entity lists can hold thousands of one-line rows: size them from the first row
+                # and lay them out in batches instead of measuring every item up front
+                list_widget.setUniformItemSizes(True)
+                list_widget.setLayoutMode(QListView.LayoutMode.Batched)
+                list_widget.setBatchSize(256)
+                model = list_widget.model()
+                for signal in (model.rowsInserted, model.rowsRemoved, model.rowsMoved,
+                               model.dataChanged, model.layoutChanged, model.modelReset):
+                    signal.connect(lambda *args, w=list_widget: self._list_index.pop(w, None))
+        
         main_layout.addWidget(self.tab_widget)
         
         # Enable drag and drop
@@ -692,7 +1093,7 @@ class EntityToolGUI(QMainWindow):
     def load_stylesheet(self):
         """Load and apply the dark theme stylesheet from QSS file"""
         try:
-            style_path = Path(__file__).parent / "style.qss"
+            style_path = _MODULE_DIR / "style.qss"
             if not style_path.exists():
                 logging.error("Style file not found")
                 return
@@ -721,18 +1122,38 @@ class EntityToolGUI(QMainWindow):
             # Clear existing extensions and schemas
             self.schema_extensions = set()
             self.schemas = {}
+            self._sorted_props_cache = {}
+            self._ref_cache = {}
             
             # Process each schema file
-            schema_files = list(schema_path.glob("*-schema.json"))  # Changed pattern to match actual filenames
-            print(f"Found {len(schema_files)} schema files")
+            with os.scandir(schema_path) as it:
+                schema_entries = [e for e in it if e.is_file() and e.name.endswith("-schema.json")]
+            print(f"Found {len(schema_entries)} schema files")
+            
+            # Reuse last run's schemas if no schema file was added, removed or changed
+            cache_path = _APP_DIR / SCHEMA_CACHE_FILE
+            signature = (SCHEMA_CACHE_VERSION, str(schema_path.resolve()), tuple(sorted(
+                (e.name, e.stat().st_mtime_ns, e.stat().st_size) for e in schema_entries)))
+            try:
+                with open(cache_path, 'rb') as f:
+                    cached_signature, schemas, extensions = pickle.load(f)
+                if cached_signature == signature:
+                    self.schemas = schemas
+                    self.schema_extensions = extensions
+                    print(f"Loaded {len(self.schemas)} schemas from cache")
+                    return
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Ignoring unreadable schema cache: {str(e)}")
             
-            for file_path in schema_files:
+            for entry in schema_entries:
                 try:
-                    with open(file_path, encoding='utf-8') as f:
-                        schema = json.load(f)
+                    schema = _read_json_fast(entry.path)
                         
                     # Get schema name from filename (e.g. "unit-schema.json" -> "unit-schema")
-                    schema_name = file_path.stem  # This will be e.g. "unit-schema"
+                    schema_name = entry.name[:-5]  # Strip ".json"
+                    self._resolve_refs(schema, schema)
                     self.schemas[schema_name] = schema
                     
                     # Add file extension if specified in schema
@@ -745,13 +1166,75 @@ class EntityToolGUI(QMainWindow):
                         
                     print(f"Loaded schema: {schema_name}")
                 except Exception as e:
-                    print(f"Error loading schema {file_path}: {str(e)}")
+                    print(f"Error loading schema {entry.path}: {str(e)}")
             
             print(f"Successfully loaded {len(self.schemas)} schemas")
             
+            # Pickle keeps the __ref_target__ pointers, so the cache needs no second resolve pass
+            try:
+                tmp_path = cache_path.with_name(SCHEMA_CACHE_FILE + ".tmp")
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump((signature, self.schemas, self.schema_extensions), f, pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except Exception as e:
+                print(f"Could not write schema cache: {str(e)}")
+            
         except Exception as e:
             print(f"Error loading schemas: {str(e)}")
     
+    def resolve_ref(self, ref: str):
+        """Resolve a $ref string against the current schema, caching the result per schema"""
+        root = self.current_schema
+        if not isinstance(root, dict):
+            return None
+        cached = self._ref_cache.get(id(root))
+        if cached is None or cached[0] is not root:
+            cached = (root, {})
+            self._ref_cache[id(root)] = cached
+        refs = cached[1]
+        if ref in refs:
+            return refs[ref]
+        
+        current = root
+        for part in ref.split("/")[1:]:  # Skip the '#'
+            if isinstance(current, dict) and part in current:
+                current = current[part]
+            else:
+                current = None
+                break
+        refs[ref] = current
+        return current
+    
+    def _resolve_refs(self, node, root: dict, visited: set = None):
+        """Walk a schema once and store a direct pointer to each $ref target.
+        The target is kept under "__ref_target__" next to the original "$ref"."""
+        if visited is None:
+            visited = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if id(current) in visited:
+                continue
+            visited.add(id(current))
+            
+            if isinstance(current, dict):
+                ref = current.get("$ref")
+                if isinstance(ref, str) and ref.startswith("#"):
+                    target = root
+                    for part in ref.split("/")[1:]:  # Skip the '#'
+                        if isinstance(target, dict) and part in target:
+                            target = target[part]
+                        else:
+                            target = None
+                            break
+                    if isinstance(target, dict):
+                        current["__ref_target__"] = target
+                # Don't descend into the pointers we just added
+                stack.extend(v for k, v in current.items()
+                             if k != "__ref_target__" and isinstance(v, (dict, list)))
+            elif isinstance(current, list):
+                stack.extend(v for v in current if isinstance(v, (dict, list)))
+    
     def load_folder(self, folder_path: Path):
         """Load all files from the mod folder"""
         # Show loading screen
@@ -763,9 +1246,12 @@ class EntityToolGUI(QMainWindow):
         try:
             loading.set_status("Initializing...")
             self.current_folder = folder_path.resolve()  # Get absolute path
+            self._entity_paths.clear()
             self.files_by_type.clear()
             self.manifest_files.clear()
+            self.player_selector.blockSignals(True)  # Clearing would emit an empty selection
             self.player_selector.clear()
+            self.player_selector.blockSignals(False)
             
             # Load all data into memory
             loading.set_status("Loading localized strings...")
@@ -773,6 +1259,7 @@ class EntityToolGUI(QMainWindow):
             
             loading.set_status("Loading texture files...")
             self.load_all_texture_files()
+            self.load_all_entity_files()
             
             loading.set_status("Loading manifest files...")
             self.load_mod_manifest_files()
@@ -794,90 +1281,56 @@ class EntityToolGUI(QMainWindow):
             entities_folder = self.current_folder / "entities"
             base_entities_folder = None if not self.base_game_folder else self.base_game_folder / "entities"
             
-            def add_items_to_list(list_widget, pattern, folder, is_base_game=False):
-                """Add items to a list widget with optional base game styling"""
+            # Map file suffixes to the list widgets they populate
+            entity_lists = {
+                ".unit": self.all_units_list,
+                ".unit_item": self.items_list,
+                ".ability": self.ability_list,
+                ".action_data_source": self.action_list,
+                ".buff": self.buff_list,
+                ".formation": self.formations_list,
+                ".flight_pattern": self.patterns_list,
+                ".npc_reward": self.rewards_list,
+                ".exotic": self.exotics_list
+            }
+            
+            def scan_folder(folder, suffix_to_list):
+                """Collect file names per list widget in a single directory pass"""
+                names = {}
                 if not folder or not folder.exists():
-                    return
-                for file in folder.glob(pattern):
-                    item = QListWidgetItem(file.stem)
-                    if is_base_game:
-                        item.setForeground(QColor(150, 150, 150))
-                        font = item.font()
-                        font.setItalic(True)
-                        item.setFont(font)
-                    list_widget.addItem(item)
-
+                    return names
+                it = QDirIterator(str(folder), ["*" + suffix for suffix in suffix_to_list], QDir.Filter.Files)
+                while it.hasNext():
+                    it.next()
+                    stem, _, extension = it.fileName().rpartition('.')
+                    list_widget = suffix_to_list.get('.' + extension)
+                    if list_widget is not None:
+                        names.setdefault(list_widget, []).append(stem)
+                return names
+            
             if entities_folder.exists():
-                loading.set_status("Loading units...")
-                # Load all units first
                 self.all_units_list.clear()
-                add_items_to_list(self.all_units_list, "*.unit", entities_folder)
-                if base_entities_folder:
-                    add_items_to_list(self.all_units_list, "*.unit", base_entities_folder, True)
-                
-                loading.set_status("Loading unit items...")
-                # Load unit items
-                add_items_to_list(self.items_list, "*.unit_item", entities_folder)
-                if base_entities_folder:
-                    add_items_to_list(self.items_list, "*.unit_item", base_entities_folder, True)
-                
-                loading.set_status("Loading abilities...")
-                # Load abilities
-                add_items_to_list(self.ability_list, "*.ability", entities_folder)
-                if base_entities_folder:
-                    add_items_to_list(self.ability_list, "*.ability", base_entities_folder, True)
-                
-                loading.set_status("Loading actions...")
-                # Load action data sources
-                add_items_to_list(self.action_list, "*.action_data_source", entities_folder)
-                if base_entities_folder:
-                    add_items_to_list(self.action_list, "*.action_data_source", base_entities_folder, True)
-                
-                loading.set_status("Loading buffs...")
-                # Load buffs
-                add_items_to_list(self.buff_list, "*.buff", entities_folder)
-                if base_entities_folder:
-                    add_items_to_list(self.buff_list, "*.buff", base_entities_folder, True)
-                
-                loading.set_status("Loading formations...")
-                # Load formations
-                add_items_to_list(self.formations_list, "*.formation", entities_folder)
-                if base_entities_folder:
-                    add_items_to_list(self.formations_list, "*.formation", base_entities_folder, True)
-                
-                loading.set_status("Loading flight patterns...")
-                # Load flight patterns
-                add_items_to_list(self.patterns_list, "*.flight_pattern", entities_folder)
-                if base_entities_folder:
-                    add_items_to_list(self.patterns_list, "*.flight_pattern", base_entities_folder, True)
-                
-                loading.set_status("Loading NPC rewards...")
-                # Load NPC rewards
-                add_items_to_list(self.rewards_list, "*.npc_reward", entities_folder)
-                if base_entities_folder:
-                    add_items_to_list(self.rewards_list, "*.npc_reward", base_entities_folder, True)
-                
-                loading.set_status("Loading exotics...")
-                # Load exotics
-                add_items_to_list(self.exotics_list, "*.exotic", entities_folder)
-                if base_entities_folder:
-                    add_items_to_list(self.exotics_list, "*.exotic", base_entities_folder, True)
+                mod_names = scan_folder(entities_folder, entity_lists)
+                base_names = scan_folder(base_entities_folder, entity_lists)
+                # Mod entries first, then base game entries for each list
+                for list_widget in entity_lists.values():
+                    _fill_list(list_widget, mod_names.get(list_widget, []), base_names.get(list_widget, []))
 
             loading.set_status("Loading uniforms...")
             # Load uniforms from uniforms folder
             uniforms_folder = self.current_folder / "uniforms"
             base_uniforms_folder = None if not self.base_game_folder else self.base_game_folder / "uniforms"
-            add_items_to_list(self.uniforms_list, "*.uniforms", uniforms_folder)
-            if base_uniforms_folder and base_uniforms_folder.exists():
-                add_items_to_list(self.uniforms_list, "*.uniforms", base_uniforms_folder, True)
+            uniform_lists = {".uniforms": self.uniforms_list}
+            _fill_list(self.uniforms_list,
+                       scan_folder(uniforms_folder, uniform_lists).get(self.uniforms_list, []),
+                       scan_folder(base_uniforms_folder, uniform_lists).get(self.uniforms_list, []))
             
             loading.set_status("Loading mod metadata...")
             # Load mod meta data if exists
             meta_file = self.current_folder / ".mod_meta_data"
             if meta_file.exists():
                 try:
-                    with open(meta_file, 'r', encoding='utf-8') as f:
-                        meta_data = json.load(f)
+                    meta_data = _read_json_fast(meta_file)
                     self.clear_layout(self.meta_layout)
                     schema_view = self.create_schema_view("mod-meta-data", meta_data, False, meta_file)
                     self.meta_layout.addWidget(schema_view)
@@ -888,7 +1341,14 @@ class EntityToolGUI(QMainWindow):
             # Update player selector from manifest data
             if 'player' in self.manifest_data['mod']:
                 player_ids = sorted(self.manifest_data['mod']['player'].keys())
+                # Insert in one batch and notify once with the final selection
+                self.player_selector.blockSignals(True)
+                self.player_selector.setUpdatesEnabled(False)
+                self.player_selector.clear()
                 self.player_selector.addItems(player_ids)
+                self.player_selector.setUpdatesEnabled(True)
+                self.player_selector.blockSignals(False)
+                self.player_selector.currentTextChanged.emit(self.player_selector.currentText())
                 print(f"Added {len(player_ids)} players to selector")
             
             loading.close()
@@ -900,21 +1360,39 @@ class EntityToolGUI(QMainWindow):
             loading.close()
             QMessageBox.critical(self, "Error", f"Failed to load folder: {str(e)}")
     
+    def entity_file_path(self, entity_id: str, extension: str, is_base_game: bool = False) -> Path:
+        """Get the path of an entity file in the mod or base game folder, built once per id"""
+        key = (entity_id, extension, is_base_game)
+        path = self._entity_paths.get(key)
+        if path is None:
+            root = self.base_game_folder if is_base_game else self.current_folder
+            # Uniforms live in their own folder, everything else is in entities
+            folder = "uniforms" if extension == "uniforms" else "entities"
+            path = self._entity_paths[key] = root / folder / f"{entity_id}.{extension}"
+        return path
+    
     def load_file(self, file_path: Path, try_base_game: bool = True) -> tuple[dict, bool]:
         """Load a file from mod folder or base game folder.
         Returns tuple of (data, is_from_base_game)"""
         try:
+            # Files already opened this session are parsed once and held by the command stack,
+            # together with any unsaved edits, so reuse that instead of re-reading the file.
+            # Base game fallbacks are stored under the mod path, those go through the lookup below
+            # so they are still reported as base game data
+            if file_path in self.command_stack.file_data:
+                is_base_game = self.base_game_folder is not None and file_path.is_relative_to(self.base_game_folder)
+                if is_base_game or file_path.exists():
+                    return self.command_stack.get_file_data(file_path), is_base_game
+            
             # Try mod folder first
             if file_path.exists():
-                with open(file_path, encoding='utf-8') as f:
-                    return json.load(f), False
+                return _read_json_fast(file_path), False
             
             # Try base game folder if enabled
             if try_base_game and self.config.get("base_game_folder"):
                 base_game_path = Path(self.config["base_game_folder"]) / file_path.relative_to(self.current_folder)
                 if base_game_path.exists():
-                    with open(base_game_path, encoding='utf-8') as f:
-                        return json.load(f), True
+                    return _read_json_fast(base_game_path), True
             
             raise FileNotFoundError(f"File not found in mod or base game folder: {file_path}")
             
@@ -931,46 +1409,39 @@ class EntityToolGUI(QMainWindow):
         # Check cache first
         cache_key = f"{self.current_folder}:{texture_name}"
         if cache_key in self.texture_cache:
+            self.texture_cache.move_to_end(cache_key)
             return self.texture_cache[cache_key]
-            
-        # Try mod folder first
-        if texture_name in self.all_texture_files['mod']:
-            texture_path = self.current_folder / "textures" / f"{texture_name}.png"
-            if texture_path.exists():
-                pixmap = QPixmap(str(texture_path))
-                if not pixmap.isNull():
-                    self.texture_cache[cache_key] = (pixmap, False)
-                    return pixmap, False
-                    
-            # Try DDS if PNG not found
-            texture_path = self.current_folder / "textures" / f"{texture_name}.dds"
-            if texture_path.exists():
-                pixmap = QPixmap(str(texture_path))
-                if not pixmap.isNull():
-                    self.texture_cache[cache_key] = (pixmap, False)
-                    return pixmap, False
-        
-        # Try base game folder
-        if texture_name in self.all_texture_files['base_game']:
+        
+        # Try mod folder first, then base game folder
+        pixmap = self._try_load(self.current_folder, 'mod', texture_name)
+        if pixmap is not None:
+            result = (pixmap, False)
+        else:
             base_game_folder = self.config.get("base_game_folder")
-            if base_game_folder:
-                texture_path = Path(base_game_folder) / "textures" / f"{texture_name}.png"
-                if texture_path.exists():
-                    pixmap = QPixmap(str(texture_path))
-                    if not pixmap.isNull():
-                        self.texture_cache[cache_key] = (pixmap, True)
-                        return pixmap, True
-                        
-                # Try DDS if PNG not found
-                texture_path = Path(base_game_folder) / "textures" / f"{texture_name}.dds"
-            if texture_path.exists():
-                pixmap = QPixmap(str(texture_path))
-                if not pixmap.isNull():
-                    self.texture_cache[cache_key] = (pixmap, True)
-                    return pixmap, True
-        
-        # Return empty pixmap if texture not found
-        return QPixmap(), False
+            pixmap = self._try_load(Path(base_game_folder) if base_game_folder else None, 'base_game', texture_name)
+            # Cache misses too so missing textures aren't retried
+            result = (pixmap, True) if pixmap is not None else (QPixmap(), False)
+        
+        self.texture_cache[cache_key] = result
+        if len(self.texture_cache) > TEXTURE_CACHE_SIZE:
+            self.texture_cache.popitem(last=False)  # Evict least recently used
+        return result
+    
+    def _try_load(self, folder: Path, source: str, texture_name: str) -> QPixmap | None:
+        """Load a texture from the given folder if it is in the texture index"""
+        file_name = self.all_texture_files[source].get(texture_name)
+        if not folder or not file_name:
+            return None
+        # Share decoded images across views through Qt's global pixmap cache
+        texture_path = str(folder / "textures" / file_name)
+        pixmap = QPixmapCache.find(texture_path)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+        pixmap = QPixmap(texture_path)
+        if pixmap.isNull():
+            return None
+        QPixmapCache.insert(texture_path, pixmap)
+        return pixmap
  
     def load_base_game_manifest_files(self) -> None:
         """Load manifest files from base game into memory"""
@@ -984,24 +1455,23 @@ class EntityToolGUI(QMainWindow):
             entities_folder = self.base_game_folder / "entities"
             if entities_folder.exists():
                 print(f"Found base game entities folder: {entities_folder}")
-                for manifest_file in entities_folder.glob("*.entity_manifest"):
+                for manifest_file in _iter_files(entities_folder, ".entity_manifest"):
                     try:
                         manifest_type = manifest_file.stem  # e.g., 'player', 'weapon'
                         print(f"Loading base game manifest: {manifest_file}")
-                        with open(manifest_file, 'r', encoding='utf-8') as f:
-                            manifest_data = json.load(f)
+                        manifest_data = _read_json_fast(manifest_file, _INTERN_DECODER)
                             
                         if manifest_type not in self.manifest_data['base_game']:
-                            self.manifest_data['base_game'][manifest_type] = {}
+                            self.manifest_data['base_game'][manifest_type] = _LazyJsonDict()
                             
-                        # Load each referenced entity file
+                        # Record each referenced entity file, it is parsed the first time it is looked up
                         if 'ids' in manifest_data:
+                            existing = self.all_entity_files['base_game'].get(manifest_type, ())
+                            entities = self.manifest_data['base_game'][manifest_type]
                             for entity_id in manifest_data['ids']:
                                 entity_file = entities_folder / f"{entity_id}.{manifest_type}"
-                                if entity_file.exists():
-                                    with open(entity_file, 'r', encoding='utf-8') as f:
-                                        entity_data = json.load(f)
-                                        self.manifest_data['base_game'][manifest_type][entity_id] = entity_data
+                                if entity_id in existing:
+                                    entities[entity_id] = entity_file
                                 else:
                                     print(f"Referenced base game entity file not found: {entity_file}")
                                         
@@ -1019,6 +1489,8 @@ class EntityToolGUI(QMainWindow):
             print(f"Total base game {manifest_type} entries: {count}")
             if count > 0:
                 print(f"Example {manifest_type} entries: {list(self.manifest_data['base_game'][manifest_type].keys())[:3]}")
+        
+        self.rebuild_manifest_index()
                    
     def load_mod_manifest_files(self) -> None:
         """Load manifest files from mod folder into memory"""
@@ -1032,25 +1504,23 @@ class EntityToolGUI(QMainWindow):
             entities_folder = self.current_folder / "entities"
             if entities_folder.exists():
                 print(f"Found mod entities folder: {entities_folder}")
-                for manifest_file in entities_folder.glob("*.entity_manifest"):
+                for manifest_file in _iter_files(entities_folder, ".entity_manifest"):
                     try:
                         manifest_type = manifest_file.stem  # e.g., 'player', 'weapon'
                         print(f"Loading mod manifest: {manifest_file}")
-                        with open(manifest_file, 'r', encoding='utf-8') as f:
-                            manifest_data = json.load(f)
+                        manifest_data = _read_json_fast(manifest_file, _INTERN_DECODER)
                             
                         if manifest_type not in self.manifest_data['mod']:
-                            self.manifest_data['mod'][manifest_type] = {}
+                            self.manifest_data['mod'][manifest_type] = _LazyJsonDict()
                             
-                        # Load each referenced entity file
+                        # Record each referenced entity file, it is parsed the first time it is looked up
                         if 'ids' in manifest_data:
+                            existing = self.all_entity_files['mod'].get(manifest_type, ())
+                            entities = self.manifest_data['mod'][manifest_type]
                             for entity_id in manifest_data['ids']:
                                 entity_file = entities_folder / f"{entity_id}.{manifest_type}"
-                                if entity_file.exists():
-                                    with open(entity_file, 'r', encoding='utf-8') as f:
-                                        entity_data = json.load(f)
-                                        self.manifest_data['mod'][manifest_type][entity_id] = entity_data
-                                        print(f"Loaded mod {manifest_type} data for {entity_id}")
+                                if entity_id in existing:
+                                    entities[entity_id] = entity_file
                                 else:
                                     print(f"Referenced mod entity file not found: {entity_file}")
                                         
@@ -1068,6 +1538,20 @@ class EntityToolGUI(QMainWindow):
             print(f"Total mod {manifest_type} entries: {count}")
             if count > 0:
                 print(f"Example {manifest_type} entries: {list(self.manifest_data['mod'][manifest_type].keys())[:3]}")
+        
+        self.rebuild_manifest_index()
+    
+    def rebuild_manifest_index(self) -> None:
+        """Index which manifest types contain each entity id, call after manifest_data changes"""
+        self._classify_cache.clear()
+        for source, index in (('mod', {}), ('base_game', {})):
+            for manifest_type, entities in self.manifest_data[source].items():
+                for entity_id in entities:
+                    index.setdefault(entity_id, []).append(manifest_type)
+            if source == 'mod':
+                self._manifest_index_mod = index
+            else:
+                self._manifest_index_base = index
                          
     def load_all_localized_strings(self) -> None:
         """Load all localized strings from both mod and base game into memory"""
@@ -1076,7 +1560,7 @@ class EntityToolGUI(QMainWindow):
         # Initialize dictionaries to store all strings
         self.all_localized_strings = {
             'mod': {},  # {language: {key: text}}
-            'base_game': {}  # {language: {key: text}}
+            'base_game': _LazyLanguageDict()  # {language: {key: text}}, parsed on first lookup
         }
         
         # Load mod strings
@@ -1085,20 +1569,21 @@ class EntityToolGUI(QMainWindow):
             localized_text_folder = self.current_folder / "localized_text"
             print(f"Checking mod localized_text folder: {localized_text_folder}")
             if localized_text_folder.exists():
-                for text_file in localized_text_folder.glob("*.localized_text"):
+                for text_file in _iter_files(localized_text_folder, ".localized_text"):
                     print(f"Loading mod localized text from: {text_file}")
                     try:
-                        with open(text_file, 'r', encoding='utf-8') as f:
-                            json_data = json.load(f)
-                            # Initialize language dictionary if needed
-                            language = text_file.stem
-                            if language not in self.all_localized_strings['mod']:
-                                self.all_localized_strings['mod'][language] = {}
+                        json_data = _read_json_fast(text_file, _LOCALIZED_DECODER)
+                        language = text_file.stem
+                        strings = self.all_localized_strings['mod']
+                        if language not in strings:
+                            # The parsed dict is fresh, keep it instead of copying into a growing one
+                            strings[language] = json_data
+                        else:
                             # Add strings for this language
-                            self.all_localized_strings['mod'][language].update(json_data)
-                            # Initialize command stack with this data
-                            self.command_stack.update_file_data(text_file, json_data)
-                            print(f"Loaded {len(json_data)} strings for language {language} from {text_file}")
+                            strings[language].update(json_data)
+                        # Initialize command stack with this data
+                        self.command_stack.update_file_data(text_file, json_data)
+                        print(f"Loaded {len(json_data)} strings for language {language} from {text_file}")
                     except Exception as e:
                         print(f"Error loading localized text file {text_file}: {str(e)}")
                         # Initialize with empty data on error
@@ -1118,26 +1603,19 @@ class EntityToolGUI(QMainWindow):
             localized_text_folder = self.base_game_folder / "localized_text"
             print(f"Checking base game localized_text folder: {localized_text_folder}")
             if localized_text_folder.exists():
-                for text_file in localized_text_folder.glob("*.localized_text"):
-                    print(f"Loading base game localized text from: {text_file}")
-                    try:
-                        with open(text_file, 'r', encoding='utf-8') as f:
-                            json_data = json.load(f)
-                            # Initialize language dictionary if needed
-                            language = text_file.stem
-                            if language not in self.all_localized_strings['base_game']:
-                                self.all_localized_strings['base_game'][language] = {}
-                            # Add strings for this language
-                            self.all_localized_strings['base_game'][language].update(json_data)
-                            print(f"Loaded {len(json_data)} strings for language {language} from {text_file}")
-                    except Exception as e:
-                        print(f"Error loading localized text file {text_file}: {str(e)}")
+                # Base game text is read-only, so only remember where each language lives
+                # and leave parsing to the first lookup of that language
+                for text_file in _iter_files(localized_text_folder, ".localized_text"):
+                    print(f"Found base game localized text: {text_file}")
+                    self.all_localized_strings['base_game'][text_file.stem] = text_file
             else:
                 logging.debug("No base game localized_text folder found")
                         
         # Log summary
         for source in ['mod', 'base_game']:
             for language in self.all_localized_strings[source]:
+                if source == 'base_game' and language not in (self.current_language, "en"):
+                    continue  # Not parsed until someone asks for it
                 count = len(self.all_localized_strings[source][language])
                 print(f"Total {source} strings for {language}: {count}")
                 if count > 0:
@@ -1147,40 +1625,126 @@ class EntityToolGUI(QMainWindow):
                         print(f"  {key} = {value}")
                         if i >= 2:
                             break
+        
+        self.build_localized_lookup()
+    
+    def build_localized_lookup(self) -> None:
+        """Flatten localized strings for the current language into a single lookup dict"""
+        self._classify_cache.clear()
+        self._merged_strings = {}
+        self._base_game_keys = set()
+        
+        # Write lowest priority first so higher priority sources overwrite
+        for source, language in [('base_game', "en"), ('base_game', self.current_language),
+                                 ('mod', "en"), ('mod', self.current_language)]:
+            strings = self.all_localized_strings[source].get(language)
+            if not strings:
+                continue
+            self._merged_strings.update(strings)
+            if source == 'base_game':
+                self._base_game_keys.update(strings)
+            else:
+                self._base_game_keys.difference_update(strings)
+    
+    def refresh_localized_key(self, key: str) -> None:
+        """Re-resolve a single key in the lookup after its strings were edited"""
+        self._classify_cache.clear()
+        self._merged_strings.pop(key, None)
+        self._base_game_keys.discard(key)
+        for source, language in [('mod', self.current_language), ('mod', "en"),
+                                 ('base_game', self.current_language), ('base_game', "en")]:
+            strings = self.all_localized_strings[source].get(language)
+            if strings and key in strings:
+                self._merged_strings[key] = strings[key]
+                if source == 'base_game':
+                    self._base_game_keys.add(key)
+                return
     
     def load_all_texture_files(self) -> None:
         """Load list of all texture files from both mod and base game into memory"""
         logging.info("Loading all texture files...")
         
-        # Initialize lists to store texture file paths
+        # Cached lookups may be stale once the index changes
+        self.texture_cache.clear()
+        self._domain_bg_cache.clear()
+        
+        # Initialize indexes of texture files
         self.all_texture_files = {
-            'mod': set(),  # Set of texture file names without extension
-            'base_game': set()  # Set of texture file names without extension
+            'mod': {},  # {texture name without extension: file name}
+            'base_game': {}  # {texture name without extension: file name}
         }
         
+        def index_textures(textures_folder: Path) -> dict:
+            index = {}
+            with os.scandir(textures_folder) as it:
+                for entry in it:
+                    if not entry.is_file():
+                        continue
+                    stem, _, suffix = entry.name.rpartition('.')
+                    suffix = suffix.lower()
+                    if not stem or suffix not in _TEXTURE_SUFFIXES:
+                        continue
+                    # Prefer PNG over DDS when both exist
+                    if suffix == 'png' or stem not in index:
+                        index[stem] = entry.name
+            return index
+        
         # Load mod textures
         if self.current_folder:
             textures_folder = self.current_folder / "textures"
             if textures_folder.exists():
-                for texture_file in textures_folder.glob("*.*"):
-                    if texture_file.suffix.lower() in ['.png', '.dds']:
-                        self.all_texture_files['mod'].add(texture_file.stem)
+                self.all_texture_files['mod'] = index_textures(textures_folder)
                 print(f"Found {len(self.all_texture_files['mod'])} texture files in mod")
         
         # Load base game textures
         if self.base_game_folder:
             textures_folder = self.base_game_folder / "textures"
             if textures_folder.exists():
-                for texture_file in textures_folder.glob("*.*"):
-                    if texture_file.suffix.lower() in ['.png', '.dds']:
-                        self.all_texture_files['base_game'].add(texture_file.stem)
+                self.all_texture_files['base_game'] = index_textures(textures_folder)
                 print(f"Found {len(self.all_texture_files['base_game'])} texture files in base game")
+        
+        self._texture_set = frozenset(self.all_texture_files['mod']) | frozenset(self.all_texture_files['base_game'])
+        self._classify_cache.clear()
 
+    def load_all_entity_files(self) -> None:
+        """Index entity file names per extension so existence checks don't hit the disk"""
+        self.all_entity_files = {'mod': {}, 'base_game': {}}
+        
+        def index_entities(entities_folder: Path) -> dict:
+            index = {}
+            with os.scandir(entities_folder) as it:
+                for entry in it:
+                    stem, _, extension = entry.name.rpartition('.')
+                    if stem and entry.is_file():
+                        index.setdefault(extension, set()).add(stem)
+            return index
+        
+        for source, folder in (('mod', self.current_folder), ('base_game', self.base_game_folder)):
+            if not folder:
+                continue
+            entities_folder = folder / "entities"
+            if entities_folder.exists():
+                self.all_entity_files[source] = index_entities(entities_folder)
+                print(f"Indexed {sum(len(stems) for stems in self.all_entity_files[source].values())} entity files in {source}")
+    
+    def entity_file_exists(self, entity_id: str, entity_type: str, source: str = 'mod') -> bool:
+        """Check whether an entity file exists using the index instead of the disk"""
+        return entity_id in self.all_entity_files[source].get(entity_type, ())
+    
+    def update_entity_file_index(self, file_path: Path, exists: bool) -> None:
+        """Keep the mod entity file index in sync after a file is written or deleted"""
+        if not self.current_folder or file_path.parent != self.current_folder / "entities":
+            return
+        stems = self.all_entity_files['mod'].setdefault(file_path.suffix[1:], set())
+        if exists:
+            stems.add(file_path.stem)
+        else:
+            stems.discard(file_path.stem)
+    
     def load_player_file(self, file_path: Path):
         """Load a player file into the application"""
         try:
-            with open(file_path, encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_json_fast(file_path)
                 
             self.current_file = file_path
             self.current_data = data
@@ -1219,6 +1783,7 @@ class EntityToolGUI(QMainWindow):
     
     def closeEvent(self, event):
         """Handle window close event"""
+        self.flush_pending_edits()
         if self.command_stack.has_unsaved_changes():
             reply = QMessageBox.question(
                 self,
@@ -1304,9 +1869,11 @@ class EntityToolGUI(QMainWindow):
                 base_game_path.setText(folder)
                 self.config["base_game_folder"] = folder
                 self.base_game_folder = Path(folder)  # Update base_game_folder path
+                self._entity_paths.clear()
                 self.save_config()
                 self.load_all_localized_strings()  # Reload localized strings with new path
                 self.load_all_texture_files()  # Reload texture files with new path
+                self.load_all_entity_files()  # Reload entity file index with new path
                 self.load_base_game_manifest_files()  # Reload base game manifest files
         
         base_game_btn.clicked.connect(select_base_game_folder)
@@ -1332,8 +1899,7 @@ class EntityToolGUI(QMainWindow):
                 "base_game_folder": str(self.base_game_folder) if self.base_game_folder else "",
                 "schema_folder": str(self.config.get("schema_folder", ""))
             }
-            with open('config.json', 'w') as f:
-                json.dump(config_to_save, f, indent=4)
+            write_json_file('config.json', config_to_save)
             logging.info("Configuration saved successfully")
         except Exception as e:
             logging.error(f"Failed to save config.json: {e}")
@@ -1355,7 +1921,7 @@ class EntityToolGUI(QMainWindow):
         
         # Get schema and data path from widget or its container
         schema = None
-        data_path = widget.property("data_path")
+        data_path = self.widget_path(widget)
         print(f"Creating context menu for path: {data_path}")
             
         if data_path is not None:  # Changed from 'if data_path:' to handle empty lists
@@ -1497,22 +2063,13 @@ class EntityToolGUI(QMainWindow):
             file_type = type_combo.currentText()
             search_text = search_box.text().lower()
             
-            # Add mod files first
-            for file_id in sorted(self.manifest_data['mod'].get(file_type, {})):
-                if search_text in file_id.lower():
-                    item = QListWidgetItem(file_id)
-                    file_list.addItem(item)
-                    
-            # Then add base game files (grayed out)
-            for file_id in sorted(self.manifest_data['base_game'].get(file_type, {})):
-                if (file_id not in self.manifest_data['mod'].get(file_type, {}) and 
-                    search_text in file_id.lower()):
-                    item = QListWidgetItem(file_id)
-                    item.setForeground(QColor(150, 150, 150))
-                    font = item.font()
-                    font.setItalic(True)
-                    item.setFont(font)
-                    file_list.addItem(item)
+            # Mod files first, then base game files (grayed out)
+            mod_files = self.manifest_data['mod'].get(file_type, {})
+            _fill_list(
+                file_list,
+                [file_id for file_id in sorted(mod_files) if search_text in file_id.lower()],
+                [file_id for file_id in sorted(self.manifest_data['base_game'].get(file_type, {}))
+                 if file_id not in mod_files and search_text in file_id.lower()])
         
         type_combo.currentTextChanged.connect(update_file_list)
         search_box.textChanged.connect(update_file_list)
@@ -1542,7 +2099,7 @@ class EntityToolGUI(QMainWindow):
                 
             source_file = file_list.currentItem().text()
             file_type = type_combo.currentText()
-            is_base_game = file_list.currentItem().foreground().color().getRgb()[:3] == (150, 150, 150)
+            is_base_game = bool(file_list.currentItem().data(Qt.ItemDataRole.UserRole))
             
             # Show copy dialog
             copy_dialog = QDialog(dialog)
@@ -1557,7 +2114,7 @@ class EntityToolGUI(QMainWindow):
                 
                 def on_overwrite_changed(state):
                     nonlocal overwrite
-                    overwrite = state == Qt.CheckState.Checked.value
+                    overwrite = state == _CHECKED
                     name_edit.setEnabled(not overwrite)
                     name_edit.setText(source_file if overwrite else "")
                     
@@ -1587,7 +2144,7 @@ class EntityToolGUI(QMainWindow):
                 try:
                     # Get the file path and data path from the target widget
                     file_path = self.get_schema_view_file_path(target_widget)
-                    data_path = target_widget.property("data_path")
+                    data_path = self.widget_path(target_widget)
                     
                     # Create the copy command
                     copy_command = CreateFileFromCopy(
@@ -1676,15 +2233,15 @@ class EntityToolGUI(QMainWindow):
         if self.current_folder:
             mod_uniforms_dir = self.current_folder / "uniforms"
             if mod_uniforms_dir.exists():
-                for file_path in mod_uniforms_dir.glob("*.uniforms"):
-                    mod_uniforms.add(file_path.stem)
+                with os.scandir(mod_uniforms_dir) as it:
+                    mod_uniforms.update(entry.name[:-len(".uniforms")] for entry in it if entry.name.endswith(".uniforms"))
         
         # Get base game uniforms
         if self.base_game_folder:
             base_uniforms_dir = self.base_game_folder / "uniforms"
             if base_uniforms_dir.exists():
-                for file_path in base_uniforms_dir.glob("*.uniforms"):
-                    base_uniforms.add(file_path.stem)
+                with os.scandir(base_uniforms_dir) as it:
+                    base_uniforms.update(entry.name[:-len(".uniforms")] for entry in it if entry.name.endswith(".uniforms"))
         
         # Add all files to combo box, marking their source
         all_files = sorted(mod_uniforms | base_uniforms)
@@ -1868,19 +2425,17 @@ class EntityToolGUI(QMainWindow):
                         item = QListWidgetItem(f"{key}: {value}")
                         item.setData(Qt.ItemDataRole.UserRole, key)  # Store just the key
                         if is_base_game:
-                            item.setForeground(QColor(150, 150, 150))
-                            font = item.font()
-                            font.setItalic(True)
-                            item.setFont(font)
+                            _style_base_game_item(item)
                         text_list.addItem(item)
             
-            # Add mod texts first
-            if current_lang in self.all_localized_strings['mod']:
-                add_items(self.all_localized_strings['mod'][current_lang])
-            
-            # Then add base game texts
-            if current_lang in self.all_localized_strings['base_game']:
-                add_items(self.all_localized_strings['base_game'][current_lang], True)
+            with _batched_list(text_list):
+                # Add mod texts first
+                if current_lang in self.all_localized_strings['mod']:
+                    add_items(self.all_localized_strings['mod'][current_lang])
+                
+                # Then add base game texts
+                if current_lang in self.all_localized_strings['base_game']:
+                    add_items(self.all_localized_strings['base_game'][current_lang], True)
         
         search_box.textChanged.connect(update_text_list)
         lang_combo.currentTextChanged.connect(lambda: update_text_list(search_box.text()))
@@ -2007,7 +2562,7 @@ class EntityToolGUI(QMainWindow):
         menu = QMenu()
         
         # Get data path and array data
-        data_path = widget.property("data_path")
+        data_path = self.widget_path(widget)
         array_data = widget.property("array_data")
         
         if data_path and array_data and len(array_data) > 1:
@@ -2056,21 +2611,11 @@ class EntityToolGUI(QMainWindow):
             texture_list.clear()
             search = search.lower()
             
-            def add_textures(textures, is_base_game=False):
-                for texture in sorted(textures):
-                    if search in texture.lower():
-                        item = QListWidgetItem(texture)
-                        if is_base_game:
-                            item.setForeground(QColor(150, 150, 150))
-                            font = item.font()
-                            font.setItalic(True)
-                            item.setFont(font)
-                        texture_list.addItem(item)
-            
-            # Add mod textures first
-            add_textures(self.all_texture_files['mod'])
-            # Then add base game textures
-            add_textures(self.all_texture_files['base_game'], True)
+            # Mod textures first, then base game textures
+            _fill_list(
+                texture_list,
+                [texture for texture in sorted(self.all_texture_files['mod']) if search in texture.lower()],
+                [texture for texture in sorted(self.all_texture_files['base_game']) if search in texture.lower()])
         
         # Connect search box
         search_box.textChanged.connect(update_texture_list)
@@ -2182,29 +2727,19 @@ class EntityToolGUI(QMainWindow):
             search = search.lower()
             sound_files = get_sound_files()
             
-            # Add mod sounds first
-            for sound in sorted(sound_files['mod']):
-                if search in sound.lower():
-                    # Strip .ogg extension for display
-                    display_name = str(Path(sound).with_suffix(''))
-                    item = QListWidgetItem(display_name)
-                    # Store full path with extension as data
-                    item.setData(Qt.ItemDataRole.UserRole, sound)
-                    sound_list.addItem(item)
-            
-            # Then add base game sounds
-            for sound in sorted(sound_files['base_game']):
-                if search in sound.lower():
-                    # Strip .ogg extension for display
-                    display_name = str(Path(sound).with_suffix(''))
-                    item = QListWidgetItem(display_name)
-                    # Store full path with extension as data
-                    item.setData(Qt.ItemDataRole.UserRole, sound)
-                    item.setForeground(QColor(150, 150, 150))
-                    font = item.font()
-                    font.setItalic(True)
-                    item.setFont(font)
-                    sound_list.addItem(item)
+            with _batched_list(sound_list):
+                # Add mod sounds first, then base game sounds
+                for source in ('mod', 'base_game'):
+                    for sound in sorted(sound_files[source]):
+                        if search in sound.lower():
+                            # Strip .ogg extension for display
+                            display_name = str(Path(sound).with_suffix(''))
+                            item = QListWidgetItem(display_name)
+                            # Store full path with extension as data
+                            item.setData(Qt.ItemDataRole.UserRole, sound)
+                            if source == 'base_game':
+                                _style_base_game_item(item)
+                            sound_list.addItem(item)
         
         def play_sound():
             if not sound_list.currentItem():
@@ -2326,22 +2861,13 @@ class EntityToolGUI(QMainWindow):
             player_list.clear()
             search = search.lower()
 
-            # Add mod players first
-            for player_id in sorted(self.manifest_data['mod'].get('player', {})):
-                if search in player_id.lower():
-                    item = QListWidgetItem(player_id)
-                    player_list.addItem(item)
-
-            # Then add base game players
-            for player_id in sorted(self.manifest_data['base_game'].get('player', {})):
-                if (player_id not in self.manifest_data['mod'].get('player', {}) and 
-                    search in player_id.lower()):
-                    item = QListWidgetItem(player_id)
-                    item.setForeground(QColor(150, 150, 150))
-                    font = item.font()
-                    font.setItalic(True)
-                    item.setFont(font)
-                    player_list.addItem(item)
+            # Mod players first, then base game players
+            mod_players = self.manifest_data['mod'].get('player', {})
+            _fill_list(
+                player_list,
+                [player_id for player_id in sorted(mod_players) if search in player_id.lower()],
+                [player_id for player_id in sorted(self.manifest_data['base_game'].get('player', {}))
+                 if player_id not in mod_players and search in player_id.lower()])
 
         search_box.textChanged.connect(update_player_list)
         update_player_list()  # Initial population
@@ -2364,7 +2890,7 @@ class EntityToolGUI(QMainWindow):
                 return
 
             source_file = player_list.currentItem().text()
-            is_base_game = player_list.currentItem().foreground().color().getRgb()[:3] == (150, 150, 150)
+            is_base_game = bool(player_list.currentItem().data(Qt.ItemDataRole.UserRole))
 
             # Show copy dialog
             copy_dialog = QDialog(dialog)
@@ -2379,7 +2905,7 @@ class EntityToolGUI(QMainWindow):
 
                 def on_overwrite_changed(state):
                     nonlocal overwrite
-                    overwrite = state == Qt.CheckState.Checked.value
+                    overwrite = state == _CHECKED
                     name_edit.setEnabled(not overwrite)
                     name_edit.setText(source_file if overwrite else "")
 
@@ -2451,7 +2977,7 @@ class EntityToolGUI(QMainWindow):
                 return
 
             player_id = player_list.currentItem().text()
-            is_base_game = player_list.currentItem().foreground().color().getRgb()[:3] == (150, 150, 150)
+            is_base_game = bool(player_list.currentItem().data(Qt.ItemDataRole.UserRole))
 
             if is_base_game:
                 QMessageBox.warning(dialog, "Error", "Cannot delete base game players")
@@ -2473,6 +2999,7 @@ class EntityToolGUI(QMainWindow):
                 player_file = self.current_folder / "entities" / f"{player_id}.player"
                 if player_file.exists():
                     player_file.unlink()
+                    self.update_entity_file_index(player_file, False)
 
                 # Update the manifest file
                 manifest_file = self.current_folder / "entities" / "player.entity_manifest"
@@ -2481,12 +3008,12 @@ class EntityToolGUI(QMainWindow):
                         manifest_data = json.load(f)
                     if "ids" in manifest_data and player_id in manifest_data["ids"]:
                         manifest_data["ids"].remove(player_id)
-                        with open(manifest_file, 'w', encoding='utf-8') as f:
-                            json.dump(manifest_data, f, indent=4)
+                        write_json_file(manifest_file, manifest_data)
 
                 # Remove from GUI's manifest data
                 if 'player' in self.manifest_data['mod']:
                     self.manifest_data['mod']['player'].pop(player_id, None)
+                    self.rebuild_manifest_index()
 
                 # Remove from player selector
                 index = self.player_selector.findText(player_id)
@@ -2507,7 +3034,7 @@ class EntityToolGUI(QMainWindow):
 
         def on_current_item_changed(current, previous):
             if current:
-                is_base_game = current.foreground().color().getRgb()[:3] == (150, 150, 150)
+                is_base_game = bool(current.data(Qt.ItemDataRole.UserRole))
                 delete_btn.setEnabled(not is_base_game)
 
         player_list.currentItemChanged.connect(on_current_item_changed)
@@ -2519,11 +3046,13 @@ class EntityToolGUI(QMainWindow):
 
     def undo(self):
         """Undo the last command"""
+        self.flush_pending_edits()
         self.command_stack.undo()
         self.update_save_button()  # Update button states
     
     def redo(self):
         """Redo the last undone command"""
+        self.flush_pending_edits()
         self.command_stack.redo()
         self.update_save_button()  # Update button states
     
@@ -2557,6 +3086,7 @@ class EntityToolGUI(QMainWindow):
 
     def save_changes(self):
         """Save all changes and return True if successful"""
+        self.flush_pending_edits()
         if not self.command_stack.has_unsaved_changes():
             logging.info("No unsaved changes to save")
             return True
@@ -2567,6 +3097,7 @@ class EntityToolGUI(QMainWindow):
         print(f"Modified files list: {modified_files}")
         
         success = True
+        to_save = []
         for file_path in modified_files:
             print(f"Processing file for save: {file_path}")
             
@@ -2577,31 +3108,45 @@ class EntityToolGUI(QMainWindow):
                 print(f"No data found in command stack for file: {file_path}")
                 success = False
                 continue
-                    
-            # Save the file
+            to_save.append((file_path, data))
+        
+        def save_file(file_path, data):
+            """Write one file, returns the error or None"""
             print(f"Attempting to save file: {file_path}")
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=4)
-                print(f"Successfully saved file: {file_path}")
+                write_json_file(file_path, data)
+                return None
             except Exception as e:
-                print(f"Failed to save file {file_path}: {str(e)}")
-                success = False
-                continue
+                return e
+        
+        # Write the files concurrently so disk latency overlaps instead of adding up
+        if to_save:
+            with ThreadPoolExecutor(max_workers=min(8, len(to_save))) as ex:
+                errors = list(ex.map(lambda item: save_file(*item), to_save))
+            for (file_path, _), error in zip(to_save, errors):
+                if error is not None:
+                    print(f"Failed to save file {file_path}: {str(error)}")
+                    success = False
+                    continue
+                self.update_entity_file_index(file_path, True)
+                print(f"Successfully saved file: {file_path}")
                 
         # Update UI and command stack state
         if success:
             self.status_label.setText("All changes saved")
-            self.status_label.setProperty("status", "success")
+            status = "success"
             logging.info("All files saved successfully")
             # Mark all changes as saved in command stack
             self.command_stack.mark_all_saved()
         else:
             self.status_label.setText("Error saving some changes")
-            self.status_label.setProperty("status", "error")
+            status = "error"
             logging.error("Some files failed to save")
-        self.status_label.style().unpolish(self.status_label)
-        self.status_label.style().polish(self.status_label)
+        # Restyling is only needed when the status property actually changes
+        if self.status_label.property("status") != status:
+            self.status_label.setProperty("status", status)
+            self.status_label.style().unpolish(self.status_label)
+            self.status_label.style().polish(self.status_label)
         
         # Update save button state
         self.update_save_button()
@@ -2611,64 +3156,68 @@ class EntityToolGUI(QMainWindow):
         
     def update_save_button(self):
         """Update save button enabled state"""
-        if hasattr(self, 'save_btn'):
-            has_changes = self.command_stack.has_unsaved_changes()
+        state = (self.command_stack.has_unsaved_changes(),
+                 self.command_stack.can_undo(),
+                 self.command_stack.can_redo())
+        # Most edits don't change any of the three, skip touching the buttons then
+        if state == self._button_state:
+            return
+        self._button_state = state
+        has_changes, can_undo, can_redo = state
+        
+        if self.save_btn is not None:
             self.save_btn.setEnabled(has_changes)
             
         # Also update undo/redo buttons
-        if hasattr(self, 'undo_btn'):
-            self.undo_btn.setEnabled(self.command_stack.can_undo())
-        if hasattr(self, 'redo_btn'):
-            self.redo_btn.setEnabled(self.command_stack.can_redo())
+        if self.undo_btn is not None:
+            self.undo_btn.setEnabled(can_undo)
+        if self.redo_btn is not None:
+            self.redo_btn.setEnabled(can_redo)
 
     def update_data_value(self, data_path: list, new_value: any):
         """Update a value in the data structure using its path"""
-        print(f"Updating data value at path {data_path} to {new_value}")
+        print(f"Updating data value at path {data_path}")
 
         if not data_path:
             # Empty path - replace entire data structure
             self.current_data = new_value
-            print(f"Replaced entire data structure with new value")
             return
         
-        if len(data_path) == 1:
+        last = len(data_path) - 1
+        current = self.current_data
+        if last == 0:
             # Single path element - modify root property
-            if isinstance(self.current_data, dict):
+            if type(current) is dict:
+                key = data_path[0]
                 if new_value is None:
                     # Remove property if new_value is None
-                    if data_path[0] in self.current_data:
-                        del self.current_data[data_path[0]]
-                        print(f"Removed root property {data_path[0]}")
+                    current.pop(key, None)
                 else:
                     # Add or update property
-                    self.current_data[data_path[0]] = new_value
-                    print(f"Updated root property {data_path[0]} to {new_value}")
+                    current[key] = new_value
             return
         
-        current = self.current_data
-        for i, key in enumerate(data_path[:-1]):
-            print(f"Traversing path element {i}: {key}")
-            if isinstance(current, dict):
+        # Walk to the parent container, creating missing containers on the way
+        for i in range(last):
+            key = data_path[i]
+            container_type = type(current)
+            if container_type is dict:
                 if key not in current:
-                    current[key] = {} if isinstance(data_path[i + 1], str) else []
-                    print(f"Created new dict/list for key {key}")
+                    current[key] = {} if type(data_path[i + 1]) is str else []
                 current = current[key]
-            elif isinstance(current, list):
+            elif container_type is list:
                 while len(current) <= key:
-                    current.append({} if isinstance(data_path[i + 1], str) else [])
-                    print(f"Extended list to accommodate index {key}")
+                    current.append({} if type(data_path[i + 1]) is str else [])
                 current = current[key]
         
-        if data_path:
-            if isinstance(current, dict):
-                print(f"Setting dict key {data_path[-1]} to {new_value}")
-                current[data_path[-1]] = new_value
-            elif isinstance(current, list):
-                while len(current) <= data_path[-1]:
-                    current.append(None)
-                    print(f"Extended list to accommodate final index {data_path[-1]}")
-                print(f"Setting list index {data_path[-1]} to {new_value}")
-                current[data_path[-1]] = new_value
+        key = data_path[last]
+        container_type = type(current)
+        if container_type is dict:
+            current[key] = new_value
+        elif container_type is list:
+            while len(current) <= key:
+                current.append(None)
+            current[key] = new_value
 
     def on_player_selected(self, player_name: str):
         """Handle player selection from dropdown"""
@@ -2676,7 +3225,7 @@ class EntityToolGUI(QMainWindow):
             return
             
         # Find and load the selected player file
-        player_file = self.current_folder / "entities" / f"{player_name}.player"
+        player_file = self.entity_file_path(player_name, "player")
         self.load_player_file(player_file) 
 
     def update_player_display(self):
@@ -2699,24 +3248,19 @@ class EntityToolGUI(QMainWindow):
             
         # Add buildable units
         if "buildable_units" in self.current_data:
-            for unit_id in sorted(self.current_data["buildable_units"]):
-                item = QListWidgetItem(unit_id)
-                # Check if unit exists in mod folder first
-                mod_file = self.current_folder / "entities" / f"{unit_id}.unit"
-                # Style as base game if it doesn't exist in mod folder
-                if (not mod_file.exists() and self.base_game_folder and 
-                    unit_id in self.manifest_data['base_game'].get('unit', {})):
-                    item.setForeground(QColor(150, 150, 150))
-                    font = item.font()
-                    font.setItalic(True)
-                    item.setFont(font)
-                self.units_list.addItem(item)
+            with _batched_list(self.units_list):
+                for unit_id in sorted(self.current_data["buildable_units"]):
+                    item = QListWidgetItem(unit_id)
+                    # Style as base game if it doesn't exist in mod folder
+                    if (not self.entity_file_exists(unit_id, 'unit') and self.base_game_folder and 
+                        unit_id in self.manifest_data['base_game'].get('unit', {})):
+                        _style_base_game_item(item)
+                        item.setData(Qt.ItemDataRole.UserRole, True)  # Marks a base game item
+                    self.units_list.addItem(item)
         
         # Add buildable strikecraft
         if "buildable_strikecraft" in self.current_data:
-            for unit_id in sorted(self.current_data["buildable_strikecraft"]):
-                item = QListWidgetItem(unit_id)
-                self.strikecraft_list.addItem(item)
+            _fill_list(self.strikecraft_list, sorted(self.current_data["buildable_strikecraft"]))
             
             # Clear all detail panels
             self.clear_layout(self.unit_details_layout)
@@ -2746,7 +3290,7 @@ class EntityToolGUI(QMainWindow):
 
         # Add refresh button on the right side
         refresh_btn = QPushButton()
-        refresh_btn.setIcon(QIcon(str(Path(__file__).parent / "icons" / "refresh.png")))
+        refresh_btn.setIcon(_icon("refresh.png"))
         refresh_btn.setToolTip('Refresh Research View')
         refresh_btn.setFixedSize(18, 18)
         refresh_btn.clicked.connect(lambda: self.refresh_research_view())
@@ -2768,31 +3312,23 @@ class EntityToolGUI(QMainWindow):
         self.research_details_layout = QVBoxLayout(details_widget)
         split_layout.addWidget(details_widget, 1)  # 1/3 of the width
         
-        # Load field backgrounds from research data
-        field_backgrounds = {}
-        if "research_domains" in research_data:
-            for domain_name, domain_data in research_data["research_domains"].items():
-                if "research_fields" in domain_data:
-                    for field_data in domain_data["research_fields"]:
-                        field_id = field_data.get("id")
-                        picture = field_data.get("picture")
-                        if field_id and picture:
-                            pixmap, is_base_game = self.load_texture(picture)
-                            if not pixmap.isNull():
-                                field_backgrounds[field_id] = pixmap
-                                print(f"Loaded background for field {field_id}: {picture}")
-        
         # Set field backgrounds in tree view
-        tree_view.set_field_backgrounds(field_backgrounds)
+        tree_view.set_field_backgrounds(self.load_field_background_pixmaps(research_data))
         
         # Add research subjects to the view
         if "research_subjects" in research_data:
             # First pass: collect all subjects and sort by tier
             subjects_by_tier = {}
-            for subject_id in research_data["research_subjects"]:
-                subject_file = self.current_folder / "entities" / f"{subject_id}.research_subject"
-                subject_data, is_base_game = self.load_file(subject_file)
-                
+            subject_ids = research_data["research_subjects"]
+            paths = [self.current_folder / "entities" / f"{subject_id}.research_subject" for subject_id in subject_ids]
+            
+            # Read subject files in parallel, only the file I/O leaves the GUI thread
+            results = []
+            if paths:
+                with ThreadPoolExecutor(max_workers=min(16, len(paths))) as ex:
+                    results = list(ex.map(self.load_file, paths))
+            
+            for subject_id, (subject_data, is_base_game) in zip(subject_ids, results):
                 if subject_data:
                     tier = subject_data.get("tier", 0)  # Default to tier 0
                     if tier not in subjects_by_tier:
@@ -2845,13 +3381,39 @@ class EntityToolGUI(QMainWindow):
         layout.addWidget(split_widget)
         return container 
 
+    def load_field_background_pixmaps(self, research_data: dict) -> dict:
+        """Load background pictures for all research fields, keyed by field id"""
+        field_backgrounds = {}
+        # Only try textures that are known to exist in the mod or base game
+        texture_set = self._texture_set
+        for domain_name, domain_data in research_data.get("research_domains", {}).items():
+            fields = [(field_data.get("id"), field_data.get("picture"))
+                      for field_data in domain_data.get("research_fields", ())]
+            
+            # Reuse this domain's pixmaps if its fields haven't changed
+            cached = self._domain_bg_cache.get(domain_name)
+            if cached is not None and cached[0] == fields:
+                field_backgrounds.update(cached[1])
+                continue
+            
+            domain_backgrounds = {}
+            for field_id, picture in fields:
+                if field_id and picture and picture in texture_set:
+                    pixmap, _ = self.load_texture(picture)
+                    if not pixmap.isNull():
+                        domain_backgrounds[field_id] = pixmap
+                        print(f"Loaded background for field {field_id}: {picture}")
+            self._domain_bg_cache[domain_name] = (fields, domain_backgrounds)
+            field_backgrounds.update(domain_backgrounds)
+        return field_backgrounds
+
     def load_research_subject(self, subject_id: str):
         """Load a research subject file and display its details using the schema"""
         if not self.current_folder or not hasattr(self, 'research_details_layout'):
             return
             
         # Look for the research subject file in the entities folder
-        subject_file = self.current_folder / "entities" / f"{subject_id}.research_subject"
+        subject_file = self.entity_file_path(subject_id, "research_subject")
         
         try:
             # Check if we have data in the command stack first
@@ -2871,10 +3433,7 @@ class EntityToolGUI(QMainWindow):
                 print(f"Using data from command stack for {subject_file}")
             
             # Clear any existing details
-            while self.research_details_layout.count():
-                item = self.research_details_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
+            self.clear_layout(self.research_details_layout)
             
             # Create and add the schema view
             schema_view = self.create_schema_view("research-subject", subject_data, is_base_game, subject_file)
@@ -2905,51 +3464,13 @@ class EntityToolGUI(QMainWindow):
         
         return label
 
-    def get_research_field_picture_path(self, domain: str, field_id: str) -> str:
-        """Get the path to a research field's background picture."""
-        # First check mod folder
-        mod_path = f"textures/advent_research_field_picture_{domain}_{field_id}.png"
-        if os.path.exists(mod_path):
-            return mod_path
-        
-        # Then check game folder
-        game_path = os.path.join(os.environ.get('SINS2_PATH', ''), 
-                                f"textures/advent_research_field_picture_{domain}_{field_id}.png")
-        if os.path.exists(game_path):
-            return game_path
-        
-        return None 
-
-    def load_field_backgrounds(self, domain: str, fields: list):
-        """Load background images for all fields in a domain."""
-        backgrounds = {}
-        for field in fields:
-            path = self.get_research_field_picture_path(domain, field['id'])
-            if path:
-                pixmap = QPixmap(path)
-                if not pixmap.isNull():
-                    backgrounds[field['id']] = pixmap
-        
-        self.set_field_backgrounds(backgrounds) 
-
-    def set_domain(self, domain: str):
-        """Switch to displaying a different domain"""
-        self.current_domain = domain
-        
-        # Load field backgrounds for this domain
-        if domain in self.research_data['research_domains']:
-            fields = self.research_data['research_domains'][domain]['research_fields']
-            self.load_field_backgrounds(domain, fields)
-        
-        # Rest of existing code... 
-
     def on_unit_selected(self, item):
         """Handle unit selection from the list"""
         if not self.current_folder:
             return
             
         unit_id = item.text()
-        unit_file = self.current_folder / "entities" / f"{unit_id}.unit"
+        unit_file = self.entity_file_path(unit_id, "unit")
         
         try:
             # Check if we have data in the command stack first
@@ -2988,356 +3509,146 @@ class EntityToolGUI(QMainWindow):
             error_label.setStyleSheet("color: red;")
             self.unit_details_layout.addWidget(error_label)
 
-    def on_item_selected(self, item):
-        """Handle unit item selection from the list"""
+    def on_entity_selected(self, item, entity_type: str):
+        """Handle selection in any of the entity lists that show one schema view, see _ENTITY_VIEWS"""
         if not self.current_folder:
             return
             
-        item_id = item.text()
-        is_base_game = item.foreground().color().getRgb()[:3] == (150, 150, 150)  # Check if it's a base game item
-        item_file = (self.base_game_folder if is_base_game else self.current_folder) / "entities" / f"{item_id}.unit_item"
+        _, _, layout_attr, schema_name, _ = _ENTITY_VIEWS[entity_type]
+        details_layout = getattr(self, layout_attr)
+        label = entity_type.replace('_', ' ')
         
-        try:
-            # Load from file
-            item_data, _ = self.load_file(item_file, try_base_game=False)  # Don't try base game again
-            if not item_data:
-                print(f"Item file not found: {item_file}")
-                return
-                
-            # Clear existing details
-            self.clear_layout(self.item_details_layout)
-            
-            # Create and add the schema view for item details
-            schema_view = self.create_schema_view("unit-item", item_data, is_base_game, item_file)
-            self.item_details_layout.addWidget(schema_view)
-            
-        except Exception as e:
-            print(f"Error loading item {item_id}: {str(e)}")
-            error_label = QLabel(f"Error loading item: {str(e)}")
-            error_label.setStyleSheet("color: red;")
-            self.item_details_layout.addWidget(error_label)
-
-    def on_ability_selected(self, item):
-        """Handle ability selection from the list"""
-        if not self.current_folder:
-            return
-            
-        ability_id = item.text()
-        is_base_game = item.foreground().color().getRgb()[:3] == (150, 150, 150)  # Check if it's a base game item
-        ability_file = (self.base_game_folder if is_base_game else self.current_folder) / "entities" / f"{ability_id}.ability"
+        entity_id = item.text()
+        is_base_game = bool(item.data(Qt.ItemDataRole.UserRole))  # Set on base game items
+        extension = "uniforms" if entity_type == "uniform" else entity_type
+        entity_file = self.entity_file_path(entity_id, extension, is_base_game)
         
         try:
             # Load from file
-            ability_data, _ = self.load_file(ability_file, try_base_game=False)  # Don't try base game again
-            if not ability_data:
-                print(f"Ability file not found: {ability_file}")
+            entity_data, _ = self.load_file(entity_file, try_base_game=False)  # Don't try base game again
+            if not entity_data:
+                print(f"{label.capitalize()} file not found: {entity_file}")
                 return
                 
             # Clear existing details
-            self.clear_layout(self.ability_details_layout)
+            self.clear_layout(details_layout)
             
-            # Create and add the schema view for ability details
-            schema_view = self.create_schema_view("ability", ability_data, is_base_game, ability_file)
-            self.ability_details_layout.addWidget(schema_view)
+            # Create and add the schema view for the details
+            schema_view = self.create_schema_view(schema_name, entity_data, is_base_game, entity_file)
+            details_layout.addWidget(schema_view)
             
         except Exception as e:
-            print(f"Error loading ability {ability_id}: {str(e)}")
-            error_label = QLabel(f"Error loading ability: {str(e)}")
+            print(f"Error loading {label} {entity_id}: {str(e)}")
+            error_label = QLabel(f"Error loading {label}: {str(e)}")
             error_label.setStyleSheet("color: red;")
-            self.ability_details_layout.addWidget(error_label)
+            details_layout.addWidget(error_label)
 
-    def on_action_selected(self, item):
-        """Handle action data source selection from the list"""
-        if not self.current_folder:
-            return
-            
-        action_id = item.text()
-        is_base_game = item.foreground().color().getRgb()[:3] == (150, 150, 150)  # Check if it's a base game item
-        action_file = (self.base_game_folder if is_base_game else self.current_folder) / "entities" / f"{action_id}.action_data_source"
+    def create_schema_view(self, file_type: str, file_data: dict, is_base_game: bool = False, file_path: Path = None) -> QWidget:
+        """Create a reusable schema view for any file type.
         
-        try:
-            # Load from file
-            action_data, _ = self.load_file(action_file, try_base_game=False)  # Don't try base game again
-            if not action_data:
-                print(f"Action data source file not found: {action_file}")
-                return
-                
-            # Clear existing details
-            self.clear_layout(self.action_details_layout)
-            
-            # Create and add the schema view for action details
-            schema_view = self.create_schema_view("action-data-source", action_data, is_base_game, action_file)
-            self.action_details_layout.addWidget(schema_view)
-            
-        except Exception as e:
-            print(f"Error loading action data source {action_id}: {str(e)}")
-            error_label = QLabel(f"Error loading action data source: {str(e)}")
-            error_label.setStyleSheet("color: red;")
-            self.action_details_layout.addWidget(error_label)
-
-    def on_buff_selected(self, item):
-        """Handle buff selection from the list"""
-        if not self.current_folder:
-            return
+        Args:
+            file_type: The type of file (e.g. 'unit', 'research-subject')
+            file_data: The data to display
+            is_base_game: Whether the data is from the base game
+            file_path: The path to the file being displayed
             
-        buff_id = item.text()
-        is_base_game = item.foreground().color().getRgb()[:3] == (150, 150, 150)  # Check if it's a base game item
-        buff_file = (self.base_game_folder if is_base_game else self.current_folder) / "entities" / f"{buff_id}.buff"
+        Returns:
+            A QWidget containing the schema view
+        """
+        print(f"Creating schema view for {file_type}")
+        print(f"Is base game: {is_base_game}")
+        print(f"File path: {file_path}")
         
-        try:
-            # Load from file
-            buff_data, _ = self.load_file(buff_file, try_base_game=False)  # Don't try base game again
-            if not buff_data:
-                print(f"Buff file not found: {buff_file}")
-                return
-                
-            # Clear existing details
-            self.clear_layout(self.buff_details_layout)
-            
-            # Create and add the schema view for buff details
-            schema_view = self.create_schema_view("buff", buff_data, is_base_game, buff_file)
-            self.buff_details_layout.addWidget(schema_view)
-            
-        except Exception as e:
-            print(f"Error loading buff {buff_id}: {str(e)}")
-            error_label = QLabel(f"Error loading buff: {str(e)}")
-            error_label.setStyleSheet("color: red;")
-            self.buff_details_layout.addWidget(error_label)
-
-    def on_formation_selected(self, item):
-        """Handle formation selection from the list"""
-        if not self.current_folder:
-            return
-            
-        formation_id = item.text()
-        is_base_game = item.foreground().color().getRgb()[:3] == (150, 150, 150)  # Check if it's a base game item
-        formation_file = (self.base_game_folder if is_base_game else self.current_folder) / "entities" / f"{formation_id}.formation"
+        # Only initialize command stack data if it doesn't exist
+        if file_path is not None and not self.command_stack.file_data.get(file_path):
+            self.command_stack.update_file_data(file_path, file_data)
+            print(f"Initialized command stack data for {file_path}")
         
-        try:
-            # Load from file
-            formation_data, _ = self.load_file(formation_file, try_base_game=False)  # Don't try base game again
-            if not formation_data:
-                print(f"Formation file not found: {formation_file}")
-                return
-                
-            # Clear existing details
-            self.clear_layout(self.formation_details_layout)
-            
-            # Create and add the schema view for formation details
-            schema_view = self.create_schema_view("formation", formation_data, is_base_game, formation_file)
-            self.formation_details_layout.addWidget(schema_view)
-            
-        except Exception as e:
-            print(f"Error loading formation {formation_id}: {str(e)}")
-            error_label = QLabel(f"Error loading formation: {str(e)}")
-            error_label.setStyleSheet("color: red;")
-            self.formation_details_layout.addWidget(error_label)
-
-    def on_pattern_selected(self, item):
-        """Handle flight pattern selection from the list"""
-        if not self.current_folder:
-            return
-            
-        pattern_id = item.text()
-        is_base_game = item.foreground().color().getRgb()[:3] == (150, 150, 150)  # Check if it's a base game item
-        pattern_file = (self.base_game_folder if is_base_game else self.current_folder) / "entities" / f"{pattern_id}.flight_pattern"
+        # Get the current data from command stack if available
+        display_data = self.command_stack.get_file_data(file_path) if file_path else file_data
         
-        try:
-            # Load from file
-            pattern_data, _ = self.load_file(pattern_file, try_base_game=False)  # Don't try base game again
-            if not pattern_data:
-                print(f"Flight pattern file not found: {pattern_file}")
-                return
-                
-            # Clear existing details
-            self.clear_layout(self.pattern_details_layout)
-            
-            # Create and add the schema view for pattern details
-            schema_view = self.create_schema_view("flight-pattern", pattern_data, is_base_game, pattern_file)
-            self.pattern_details_layout.addWidget(schema_view)
-            
-        except Exception as e:
-            print(f"Error loading flight pattern {pattern_id}: {str(e)}")
-            error_label = QLabel(f"Error loading flight pattern: {str(e)}")
-            error_label.setStyleSheet("color: red;")
-            self.pattern_details_layout.addWidget(error_label)
-
-    def on_reward_selected(self, item):
-        """Handle NPC reward selection from the list"""
-        if not self.current_folder:
-            return
+        # Get the schema name, for uniforms the file name determines the schema
+        schema_name = _schema_name(file_type, file_path.stem if file_type == "uniform" and file_path else None)
+        print(f"Looking for schema: {schema_name}")
             
-        reward_id = item.text()
-        is_base_game = item.foreground().color().getRgb()[:3] == (150, 150, 150)  # Check if it's a base game item
-        reward_file = (self.base_game_folder if is_base_game else self.current_folder) / "entities" / f"{reward_id}.npc_reward"
-        
-        try:
-            # Load from file
-            reward_data, _ = self.load_file(reward_file, try_base_game=False)  # Don't try base game again
-            if not reward_data:
-                print(f"NPC reward file not found: {reward_file}")
-                return
-                
-            # Clear existing details
-            self.clear_layout(self.reward_details_layout)
-            
-            # Create and add the schema view for reward details
-            schema_view = self.create_schema_view("npc-reward", reward_data, is_base_game, reward_file)
-            self.reward_details_layout.addWidget(schema_view)
-            
-        except Exception as e:
-            print(f"Error loading NPC reward {reward_id}: {str(e)}")
-            error_label = QLabel(f"Error loading NPC reward: {str(e)}")
-            error_label.setStyleSheet("color: red;")
-            self.reward_details_layout.addWidget(error_label)
-
-    def on_exotic_selected(self, item):
-        """Handle exotic selection from the list"""
-        if not self.current_folder:
-            return
-            
-        exotic_id = item.text()
-        is_base_game = item.foreground().color().getRgb()[:3] == (150, 150, 150)  # Check if it's a base game item
-        exotic_file = (self.base_game_folder if is_base_game else self.current_folder) / "entities" / f"{exotic_id}.exotic"
-        
-        try:
-            # Load from file
-            exotic_data, _ = self.load_file(exotic_file, try_base_game=False)  # Don't try base game again
-            if not exotic_data:
-                print(f"Exotic file not found: {exotic_file}")
-                return
-                
-            # Clear existing details
-            self.clear_layout(self.exotic_details_layout)
-            
-            # Create and add the schema view for exotic details
-            schema_view = self.create_schema_view("exotic", exotic_data, is_base_game, exotic_file)
-            self.exotic_details_layout.addWidget(schema_view)
-            
-        except Exception as e:
-            print(f"Error loading exotic {exotic_id}: {str(e)}")
-            error_label = QLabel(f"Error loading exotic: {str(e)}")
-            error_label.setStyleSheet("color: red;")
-            self.exotic_details_layout.addWidget(error_label)
-
-    def on_uniform_selected(self, item):
-        """Handle uniform selection from the list"""
-        if not self.current_folder:
-            return
-            
-        uniform_id = item.text()
-        is_base_game = item.foreground().color().getRgb()[:3] == (150, 150, 150)  # Check if it's a base game item
-        uniform_file = (self.base_game_folder if is_base_game else self.current_folder) / "uniforms" / f"{uniform_id}.uniforms"
-        
-        try:
-            # Load from file
-            uniform_data, _ = self.load_file(uniform_file, try_base_game=False)  # Don't try base game again
-            if not uniform_data:
-                print(f"Uniform file not found: {uniform_file}")
-                return
-                
-            # Clear existing details
-            self.clear_layout(self.uniform_details_layout)
-            
-            # Create and add the schema view for uniform details
-            schema_view = self.create_schema_view("uniform", uniform_data, is_base_game, uniform_file)
-            self.uniform_details_layout.addWidget(schema_view)
-            
-        except Exception as e:
-            print(f"Error loading uniform {uniform_id}: {str(e)}")
-            error_label = QLabel(f"Error loading uniform: {str(e)}")
-            error_label.setStyleSheet("color: red;")
-            self.uniform_details_layout.addWidget(error_label)
-
-    def create_schema_view(self, file_type: str, file_data: dict, is_base_game: bool = False, file_path: Path = None) -> QWidget:
-        """Create a reusable schema view for any file type.
-        
-        Args:
-            file_type: The type of file (e.g. 'unit', 'research-subject')
-            file_data: The data to display
-            is_base_game: Whether the data is from the base game
-            file_path: The path to the file being displayed
-            
-        Returns:
-            A QWidget containing the schema view
-        """
-        print(f"Creating schema view for {file_type}")
-        print(f"Is base game: {is_base_game}")
-        print(f"File path: {file_path}")
-        
-        # Only initialize command stack data if it doesn't exist
-        if file_path is not None and not self.command_stack.get_file_data(file_path):
-            self.command_stack.update_file_data(file_path, file_data)
-            print(f"Initialized command stack data for {file_path}")
-        
-        # Get the current data from command stack if available
-        display_data = self.command_stack.get_file_data(file_path) if file_path else file_data
-        
-        # Get the schema name
-        if file_type == "uniform":
-            # For uniforms, use the file name to determine the schema
-            if file_path:
-                # Convert from snake_case to kebab-case and append -uniforms-schema
-                schema_name = file_path.stem.replace("_", "-") + "-uniforms-schema"
-                print(f"Looking for uniform schema: {schema_name}")
-            else:
-                schema_name = "uniforms-schema"  # Default schema if no file path
-        else:
-            # Convert from snake_case to kebab-case for schema lookup
-            schema_name = file_type.replace("_", "-") + "-schema"
-            print(f"Looking for schema: {schema_name}")
-            
-        if schema_name not in self.schemas:
-            print(f"Schema not found for {schema_name}, using generic schema")
-            # Create a generic schema based on the data structure
-            def create_schema_for_value(value):
-                if isinstance(value, dict):
-                    properties = {}
-                    for key, val in value.items():
-                        properties[key] = create_schema_for_value(val)
-                    return {
-                        "type": "object",
-                        "properties": properties
-                    }
-                elif isinstance(value, list):
-                    if not value:  # Empty list
-                        return {
-                            "type": "array",
-                            "items": {"type": "string"}  # Default to string for empty arrays
-                        }
-                    # Use the type of the first item for all items
-                    return {
-                        "type": "array",
-                        "items": create_schema_for_value(value[0])
-                    }
-                elif isinstance(value, bool):
-                    return {"type": "boolean"}
-                elif isinstance(value, int):
-                    return {"type": "integer"}
-                elif isinstance(value, float):
-                    return {"type": "number"}
-                else:
-                    return {"type": "string"}
-
-            # Create the root schema
-            self.current_schema = create_schema_for_value(display_data)
-        else:
-            print(f"Found schema: {schema_name}")
-            # Get the schema and resolve any top-level references
-            schema = self.schemas[schema_name]
-            if isinstance(schema, dict) and "$ref" in schema:
-                schema = self.resolve_schema_references(schema)
-            self.current_schema = schema
+        if schema_name not in self.schemas:
+            print(f"Schema not found for {schema_name}, using generic schema")
+            # Create a generic schema based on the data structure
+            view_schema = self.create_generic_schema(display_data)
+        else:
+            print(f"Found schema: {schema_name}")
+            # Get the schema and resolve any top-level references
+            view_schema = self.schemas[schema_name]
+            if isinstance(view_schema, dict) and "$ref" in view_schema:
+                view_schema = self.resolve_schema_references(view_schema)
+        # The view's own code uses view_schema, current_schema stays the most recently opened
+        # view's schema for get_schema_for_path
+        self.current_schema = view_schema
         
         # Create scrollable area for the content
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setProperty("file_path", str(file_path) if file_path else None)
-        scroll.setProperty("file_type", file_type)
+        # Plain attributes, read without a QVariant round trip
+        scroll.view_file_path = file_path
+        scroll.view_file_type = file_type
+        scroll.view_schema = view_schema
         
-        # Create content widget
-        content = QWidget()
+        # The details group and its title row are built once and kept across full refreshes
+        view_parts = {}
+        
+        def build_details(new_data: dict):
+            """Rebuild the schema tree of the view for new data"""
+            logging.debug("Performing full update")
+            
+            if not view_parts:
+                # Create the main details widget using the schema
+                title = _view_title(file_type, is_base_game)
+                print(f"Creating details group with title: {title}")
+                details_group = QGroupBox(title)
+                if is_base_game:
+                    details_group.setStyleSheet("QGroupBox { color: #666666; font-style: italic; }")
+                details_layout = QVBoxLayout()
+
+                # Create title layout with refresh button
+                if file_path:
+                    title_layout = QHBoxLayout()
+                    title_layout.setContentsMargins(0, 0, 0, 0)
+                    title_layout.addStretch()
+                    
+                    refresh_btn = QPushButton()
+                    refresh_btn.setIcon(_icon("refresh.png"))
+                    refresh_btn.setToolTip('Refresh View')
+                    refresh_btn.setFixedSize(18, 18)
+                    refresh_btn.clicked.connect(lambda: self.refresh_schema_view(file_path))
+                    title_layout.addWidget(refresh_btn)
+                    details_layout.addLayout(title_layout)
+                
+                details_group.setLayout(details_layout)
+                main_layout.addWidget(details_group)
+                view_parts["layout"] = details_layout
+            
+            # Only the schema tree is replaced
+            details_layout = view_parts["layout"]
+            old_widget = view_parts.pop("widget", None)
+            if old_widget is not None:
+                details_layout.removeWidget(old_widget)
+                self.discard_widget(old_widget)
+            
+            # Create the content widget using the schema, passing an empty path to start tracking
+            logging.debug("Creating schema content widget")
+            # Build against the schema this view was created with, the build may happen later
+            previous_schema = self.current_schema
+            self.current_schema = view_schema
+            try:
+                details_widget = self.create_widget_for_schema(new_data, view_schema, is_base_game, [])
+            finally:
+                self.current_schema = previous_schema
+            details_layout.addWidget(details_widget)
+            view_parts["widget"] = details_widget
+        
+        # Create content widget, the details are only built once it is shown
+        content = LazySchemaPanel(build_details)
         main_layout = QVBoxLayout(content)
         main_layout.setSpacing(10)
         
@@ -3368,74 +3679,24 @@ class EntityToolGUI(QMainWindow):
             
             if should_full_refresh:
                 print("Full refresh")
-                # Full update - recreate entire view
-                logging.debug("Performing full update")
-                
-                # Clear existing content
-                while main_layout.count():
-                    item = main_layout.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                
-                # Create the main details widget using the schema
-                title = f"{file_type.replace('-', ' ').title()} Details (Base Game)" if is_base_game else f"{file_type.replace('-', ' ').title()} Details"
-                print(f"Creating details group with title: {title}")
-                details_group = QGroupBox(title)
-                if is_base_game:
-                    details_group.setStyleSheet("QGroupBox { color: #666666; font-style: italic; }")
-
-                # Create title layout with refresh button
-                if file_path:
-                    title_layout = QHBoxLayout()
-                    title_layout.setContentsMargins(0, 0, 0, 0)
-                    title_layout.addStretch()
-                    
-                    refresh_btn = QPushButton()
-                    refresh_btn.setIcon(QIcon(str(Path(__file__).parent / "icons" / "refresh.png")))
-                    refresh_btn.setToolTip('Refresh View')
-                    refresh_btn.setFixedSize(18, 18)
-                    refresh_btn.clicked.connect(lambda: self.refresh_schema_view(file_path))
-                    title_layout.addWidget(refresh_btn)
-                
-                # Create the content widget using the schema, passing an empty path to start tracking
-                logging.debug("Creating schema content widget")
-                details_widget = self.create_widget_for_schema(new_data, self.current_schema, is_base_game, [])
-                details_layout = QVBoxLayout()
-                if file_path:
-                    details_layout.addLayout(title_layout)
-                details_layout.addWidget(details_widget)
-                details_group.setLayout(details_layout)
-                main_layout.addWidget(details_group)
+                # Full update - recreate entire view now, or when next shown if hidden
+                content.request_build(new_data)
             else:
                 # Partial update - find and update specific widget
                 logging.debug("Performing partial update")
                 
-                def find_widget_by_path(widget: QWidget, target_path: List[str]) -> QWidget:
-                    """Recursively find a widget by its data path"""
-                    if hasattr(widget, 'property'):
-                        widget_path = widget.property('data_path')
-                        if widget_path == target_path:
-                            return widget
-                            
-                    # Search children
-                    if hasattr(widget, 'children'):
-                        for child in widget.children():
-                            result = find_widget_by_path(child, target_path)
-                            if result is not None:
-                                return result
-                    return None
-                
                 if is_array_update:
                     # Find the array's toggle button
                     array_path = data_path[:-1] if len(data_path) > 1 else data_path
-                    array_widget = find_widget_by_path(content, array_path)
+                    array_widget = next((w for w in self.find_widgets_by_path(content, array_path)
+                                         if isinstance(w, QToolButton)), None)
                     
                     if array_widget and isinstance(array_widget, QToolButton):
                         # Update the array count in the toggle button
                         array_data = value if len(data_path) == 1 else current
                         prop_name = data_path[-2] if len(data_path) >= 2 else data_path[0]
                         prop_name = prop_name if isinstance(prop_name, str) else f"Item {prop_name}"
-                        display_name = f"{prop_name.replace('_', ' ').title()} ({len(array_data)})"
+                        display_name = f"{_labels(prop_name)[0]} ({len(array_data)})"
                         array_widget.setText(display_name)
                         
                         # Find the array's content widget (it's the next widget after the button)
@@ -3458,7 +3719,7 @@ class EntityToolGUI(QMainWindow):
                                         
                                         # Create widget for the new array item
                                         # Get the schema for array items by traversing the schema structure
-                                        current_schema = self.current_schema
+                                        current_schema = view_schema
                                         if len(data_path) == 1:
                                             # For top-level arrays, get the items schema directly
                                             current_schema = current_schema.get("properties", {}).get(data_path[0], {})
@@ -3482,23 +3743,19 @@ class EntityToolGUI(QMainWindow):
                                     break
                 elif data_path:  # Only do regular value update if we have a data path and it's not an array update
                     # Regular value update
-                    target_widget = find_widget_by_path(content, data_path)
+                    # Labels can share the path of the editor next to them, prefer the editor
+                    candidates = self.find_widgets_by_path(content, data_path)
+                    target_widget = next((w for w in candidates if _value_setter(w) is not None),
+                                         candidates[0] if candidates else None)
                     if target_widget is not None and target_widget is not source_widget:
                         print(f"Found widget to update: {target_widget}")
                         # Update widget value based on its type
-                        if isinstance(target_widget, QLineEdit):
-                            print(f"Updating QLineEdit with value: {value}")
-                            target_widget.setText(str(value) if value is not None else "")
-                        elif isinstance(target_widget, QSpinBox):
-                            target_widget.setValue(int(value) if value is not None else 0)
-                        elif isinstance(target_widget, QDoubleSpinBox):
-                            target_widget.setValue(float(value) if value is not None else 0.0)
-                        elif isinstance(target_widget, QCheckBox):
-                            target_widget.setChecked(bool(value))
-                        elif isinstance(target_widget, QComboBox):
-                            target_widget.setCurrentText(str(value) if value is not None else "")
+                        setter = _value_setter(target_widget)
+                        if setter is not None:
+                            print(f"Updating {type(target_widget).__name__} with value: {value}")
+                            setter(target_widget, value)
                         # Update original value property
-                        target_widget.setProperty("original_value", value)
+                        self.set_widget_original(target_widget, value)
         
         # Initial content update with command stack data
         update_content(display_data)
@@ -3507,9 +3764,17 @@ class EntityToolGUI(QMainWindow):
         if file_path is not None:
             self.command_stack.register_data_change_callback(file_path, update_content)
             
+            view_key = Path(file_path)
+            self._schema_views[view_key] = scroll
+            
             def cleanup():
                 self.command_stack.unregister_data_change_callback(file_path, update_content)
+                if self._schema_views.get(view_key) is scroll:
+                    del self._schema_views[view_key]
             scroll.destroyed.connect(cleanup)
+            # Also run right away when the view is cleared, so it stops getting updates
+            # before the deferred delete goes through
+            scroll.view_cleanup = cleanup
         
         scroll.setWidget(content)
         logging.debug("Finished creating schema view")
@@ -3517,281 +3782,315 @@ class EntityToolGUI(QMainWindow):
     
     def create_widget_for_schema(self, data: dict, schema: dict, is_base_game: bool = False, path: list = None) -> QWidget:
         """Create a widget to display data according to a JSON schema"""
-        if path is None:
-            path = []
+        # Paths are extended as tuples while recursing and stored as tuples in _widget_paths
+        path = () if path is None else tuple(path)
             
         if not schema:
             return QLabel("Invalid schema")
             
         # Handle schema references
         original_schema = schema
-        if "$ref" in schema:
-            ref_path = schema["$ref"].split("/")[1:]  # Skip the '#'
-            current = self.current_schema
-            for part in ref_path:
-                if part in current:
-                    current = current[part]
-                else:
-                    return QLabel(f"Invalid reference: {schema['$ref']}")
+        if "__ref_target__" in schema:
+            # Precomputed in load_schemas
+            schema = schema["__ref_target__"]
+        elif "$ref" in schema:
+            current = self.resolve_ref(schema["$ref"])
+            if current is None:
+                return QLabel(f"Invalid reference: {schema['$ref']}")
             schema = current
             
         schema_type = schema.get("type")
         if not schema_type:
             return QLabel("Schema missing type")
             
-        if schema_type == "object":
-            # Create container for object properties
-            container = QWidget()
-            container_layout = QVBoxLayout(container)
-            container_layout.setContentsMargins(0, 0, 0, 0)
-            container_layout.setSpacing(0)
-            
-            # If data is None, create an empty dict with required properties
-            if data is None:
-                data = self.get_default_value(schema)
-            
-            # Sort properties alphabetically but prioritize common fields
-            priority_fields = ["name", "description", "id", "type", "version"]
-            properties = schema.get("properties", {}).items()
-            sorted_properties = sorted(properties, 
-                                    key=lambda x: (x[0] not in priority_fields, x[0].lower()))
-            
-            # Add required properties first if they don't exist in data
-            required_props = schema.get("required", [])
-            for prop_name in required_props:
-                if prop_name not in data and prop_name in schema.get("properties", {}):
-                    data[prop_name] = self.get_default_value(schema["properties"][prop_name])
-            
-            for prop_name, prop_schema in sorted_properties:
-                # For new objects, show all required properties and existing properties
-                if prop_name in data or prop_name in required_props:
-                    value = data.get(prop_name, self.get_default_value(prop_schema))
-                    
-                    # Check if this is a simple value or array of simple values
-                    is_simple_value = isinstance(value, (str, int, float, bool))
-                    # Update path for this property
-                    prop_path = path + [prop_name]
-                    
-                    # Create widget for the property with updated path
+        # Dispatch on schema type, simple values fall through to create_widget_for_value
+        handler = self._schema_dispatch.get(schema_type)
+        if handler:
+            return handler(data, schema, is_base_game, path)
+        # For simple values, use create_widget_for_value with path
+        return self.create_widget_for_value(data, schema, is_base_game, path)
+
+    def _build_object_widget(self, data: dict, schema: dict, is_base_game: bool, path: tuple) -> QWidget:
+        """Create a widget for an object schema, one row or section per property"""
+        # Create container for object properties
+        container = QWidget()
+        container_layout = QVBoxLayout(container)
+        container_layout.setContentsMargins(0, 0, 0, 0)
+        container_layout.setSpacing(0)
+        
+        # If data is None, create an empty dict with required properties
+        if data is None:
+            data = self.get_default_value(schema)
+        
+        # Sort properties alphabetically but prioritize common fields
+        # Keyed on the properties dict so shallow schema copies share the entry
+        properties = schema.get("properties", {})
+        cached = self._sorted_props_cache.get(id(properties))
+        if cached is not None and cached[0] is properties:
+            sorted_properties = cached[1]
+        else:
+            sorted_properties = sorted(properties.items(),
+                                    key=lambda x: (PRIORITY_RANK.get(x[0], len(PRIORITY_RANK)), x[0].lower()))
+            self._sorted_props_cache[id(properties)] = (properties, sorted_properties)
+        
+        # Add required properties first if they don't exist in data
+        required_props = schema.get("required", [])
+        for prop_name in required_props:
+            if prop_name not in data and prop_name in schema.get("properties", {}):
+                data[prop_name] = self.get_default_value(schema["properties"][prop_name])
+        
+        for prop_name, prop_schema in sorted_properties:
+            # For new objects, show all required properties and existing properties
+            if prop_name in data or prop_name in required_props:
+                value = data.get(prop_name, self.get_default_value(prop_schema))
+                
+                # Check if this is a simple value or array of simple values
+                is_simple_value = isinstance(value, _PRIMITIVES)
+                # Update path for this property
+                prop_path = path + (prop_name,)
+                
+                # Complex objects are built lazily when their section is first expanded
+                is_collapsible = not is_simple_value and not isinstance(value, list)
+                
+                # Create widget for the property with updated path
+                widget = None
+                if not is_collapsible:
                     widget = self.create_widget_for_property(
                         prop_name, value, prop_schema, is_base_game, prop_path
                     )
-                    if widget:
-                        if is_simple_value:
-                            # Create simple label and value layout for primitive types
-                            row_widget = QWidget()
-                            row_layout = QHBoxLayout(row_widget)
-                            row_layout.setContentsMargins(0, 2, 0, 2)  # Add small vertical spacing
-                            
-                            label = QLabel(prop_name.replace("_", " ").title() + ":")
-                            # Make label bold if property is required
-                            if prop_name in required_props:
-                                label.setStyleSheet("QLabel { font-weight: bold; }")
-                            
-                            # Add context menu to label
-                            label.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-                            label.setProperty("data_path", prop_path)
-                            label.customContextMenuRequested.connect(
-                                lambda pos, w=label, v=value: self.show_context_menu(w, pos, v)
-                            )
-                            
-                            row_layout.addWidget(label)
-                            row_layout.addWidget(widget)
-                            row_layout.addStretch()
-                            
-                            container_layout.addWidget(row_widget)
-                        elif isinstance(value, list):
-                            # For arrays, just add the widget directly (it will create its own header)
-                            container_layout.addWidget(widget)
-                        else:
-                            # Create collapsible section for complex types
-                            group_widget = QWidget()
-                            group_layout = QVBoxLayout(group_widget)
-                            group_layout.setContentsMargins(0, 0, 0, 0)
-                            
-                            # Create collapsible button
-                            toggle_btn = QToolButton()
-                            toggle_btn.setStyleSheet("QToolButton { border: none; }")
-                            toggle_btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
-                            toggle_btn.setArrowType(Qt.ArrowType.RightArrow)
-                            toggle_btn.setText(prop_name.replace("_", " ").title())
-                            toggle_btn.setCheckable(True)
-                            
-                            # Make button bold if property is required
-                            if prop_name in required_props:
-                                toggle_btn.setStyleSheet("QToolButton { border: none; font-weight: bold; }")
-                            
-                            # Store object data and path for context menu
-                            toggle_btn.setProperty("data_path", prop_path)
-                            toggle_btn.setProperty("original_value", value)
-                            
-                            # Add context menu to the button
-                            toggle_btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-                            toggle_btn.customContextMenuRequested.connect(
-                                lambda pos, w=toggle_btn, v=value: self.show_context_menu(w, pos, v)
-                            )
-                            
-                            # Create content widget
-                            content = QWidget()
-                            content_layout = QVBoxLayout(content)
-                            content_layout.setContentsMargins(20, 0, 0, 0)
-                            content_layout.addWidget(widget)
-                            
-                            content.setVisible(False)  # Initially collapsed
-                            
-                            def update_arrow_state(checked, btn=toggle_btn):
-                                btn.setArrowType(Qt.ArrowType.DownArrow if checked else Qt.ArrowType.RightArrow)
-                            
-                            toggle_btn.toggled.connect(content.setVisible)
-                            toggle_btn.toggled.connect(update_arrow_state)
-                            
-                            group_layout.addWidget(toggle_btn)
-                            group_layout.addWidget(content)
-                            container_layout.addWidget(group_widget)
-            
-            # For top-level objects, add context menu to the container itself
-            if not path:
-                container.setProperty("data_path", path)
-                container.setProperty("original_value", data)
-                container.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-                container.customContextMenuRequested.connect(
-                    lambda pos, w=container, v=data: self.show_context_menu(w, pos, v)
-                )
-            
-            return container
-            
-        elif schema_type == "array":
-            # Create collapsible container for the entire array
-            container = QWidget()
-            container_layout = QVBoxLayout(container)
-            container_layout.setContentsMargins(0, 0, 0, 0)
-            container_layout.setSpacing(0)
-            
-            # Create collapsible button for the array
-            toggle_btn = QToolButton()
-            toggle_btn.setStyleSheet("QToolButton { border: none; }")
-            toggle_btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
-            toggle_btn.setArrowType(Qt.ArrowType.RightArrow)
-            # Get property name from path
-            prop_name = path[-1] if path else "Items"
-            # Format as "Property Name (X)"
-            if isinstance(prop_name, str):
-                display_name = f"{prop_name.replace('_', ' ').title()} ({len(data)})"
-            else:
-                display_name = f"Item {prop_name} ({len(data)})"
-            toggle_btn.setText(display_name)
-            toggle_btn.setCheckable(True)
-            
-            # Store array data and path for context menu
-            toggle_btn.setProperty("data_path", path)
-            toggle_btn.setProperty("original_value", data)
-
-            # Add context menu to the button
-            toggle_btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-            toggle_btn.customContextMenuRequested.connect(
-                lambda pos, w=toggle_btn: self.show_context_menu(w, pos, data)
-            )
-            
-            container_layout.addWidget(toggle_btn)
-            
-            # Create content widget for array items
-            content = QWidget()
-            content_layout = QVBoxLayout(content)
-            content_layout.setContentsMargins(20, 0, 0, 0)  # Add left margin for indentation
-            content_layout.setSpacing(0)
-            content_layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)  # Align content to the left and top
-            content.setVisible(False)  # Initially collapsed
-            
-            # Get the schema for array items
-            items_schema = schema.get("items", {})
-            if isinstance(items_schema, dict):
-                # Check if array contains simple values
-                is_simple_array = (
-                    items_schema.get("type") in ["string", "number", "boolean", "integer"] and
-                    not any(key in items_schema for key in ["$ref", "format", "properties"]) and
-                    all(isinstance(x, (str, int, float, bool)) for x in data)
-                )
-                
-                if is_simple_array:
-                    # For simple arrays, show values directly in a vertical layout
-                    for i, item in enumerate(data):
-                        # Update path for this array item
-                        item_path = path + [i]
-                        widget = self.create_widget_for_value(item, items_schema, is_base_game, item_path)
+                if widget or is_collapsible:
+                    if is_simple_value:
+                        # Create simple label and value layout for primitive types
+                        row_widget = QWidget()
+                        row_layout = QHBoxLayout(row_widget)
+                        row_layout.setContentsMargins(0, 2, 0, 2)  # Add small vertical spacing
+                        
+                        label = QLabel(_labels(prop_name)[1])
+                        # Make label bold if property is required
+                        if prop_name in required_props:
+                            label.setStyleSheet("QLabel { font-weight: bold; }")
                         
-                        # Add index label before each item
-                        item_container = QWidget()
-                        item_layout = QHBoxLayout(item_container)
-                        item_layout.setContentsMargins(0, 0, 0, 0)
-                        item_layout.setSpacing(4)
-                        item_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)  # Align items to the left
+                        # Add context menu to label
+                        label.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+                        self.set_widget_path(label, prop_path)
+                        label.customContextMenuRequested.connect(
+                            lambda pos, w=label, v=value: self.show_context_menu(w, pos, v)
+                        )
                         
-                        # Add index label with context menu
-                        index_label = QLabel(f"[{i}]")
-                        index_label.setStyleSheet("QLabel { color: gray; }")
-                        index_label.setProperty("data_path", item_path)
-                        index_label.setProperty("array_data", data)
+                        row_layout.addWidget(label)
+                        row_layout.addWidget(widget)
+                        row_layout.addStretch()
                         
-                        # Only add context menu if there's more than one item
-                        if len(data) > 1:
-                            index_label.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-                            index_label.customContextMenuRequested.connect(
-                                lambda pos, w=index_label: self.show_array_item_menu(w, pos)
-                            )
+                        container_layout.addWidget(row_widget)
+                    elif isinstance(value, list):
+                        # For arrays, just add the widget directly (it will create its own header)
+                        container_layout.addWidget(widget)
+                    else:
+                        # Create collapsible section for complex types, reusing a pooled one if possible
+                        group_widget, toggle_btn, content, content_layout = self._acquire_group_widget(_labels(prop_name)[0])
                         
-                        item_layout.addWidget(index_label)
-                        item_layout.addWidget(widget)
-                        content_layout.addWidget(item_container)
-                else:
-                    # For complex arrays, show each item with its index
-                    for i, item in enumerate(data):
-                        # Update path for this array item
-                        item_path = path + [i]
-                        widget = self.create_widget_for_schema(
-                            item, items_schema, is_base_game, item_path
+                        # Make button bold if property is required
+                        if prop_name in required_props:
+                            toggle_btn.setStyleSheet("QToolButton { border: none; font-weight: bold; }")
+                        
+                        # Store object data and path for context menu
+                        self.set_widget_path(toggle_btn, prop_path)
+                        self.set_widget_original(toggle_btn, value)
+                        
+                        # Add context menu to the button
+                        toggle_btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+                        toggle_btn.customContextMenuRequested.connect(
+                            lambda pos, w=toggle_btn, v=value: self.show_context_menu(w, pos, v)
                         )
-                        if widget:
+                        
+                        def build_content(checked, layout=content_layout, name=prop_name, v=value,
+                                          s=prop_schema, p=prop_path, view_schema=self.current_schema, built=[False]):
+                            if not checked or built[0]:
+                                return
+                            built[0] = True
+                            # Build against the schema this view was created with
+                            previous_schema = self.current_schema
+                            self.current_schema = view_schema
+                            try:
+                                child = self.create_widget_for_property(name, v, s, is_base_game, p)
+                            finally:
+                                self.current_schema = previous_schema
+                            if child:
+                                layout.addWidget(child)
+                        
+                        def update_arrow_state(checked, btn=toggle_btn):
+                            btn.setArrowType(Qt.ArrowType.DownArrow if checked else Qt.ArrowType.RightArrow)
+                        
+                        toggle_btn.toggled.connect(build_content)
+                        toggle_btn.toggled.connect(content.setVisible)
+                        toggle_btn.toggled.connect(update_arrow_state)
+                        
+                        container_layout.addWidget(group_widget)
+        
+        # For top-level objects, add context menu to the container itself
+        if not path:
+            self.set_widget_path(container, path)
+            self.set_widget_original(container, data)
+            container.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+            container.customContextMenuRequested.connect(
+                lambda pos, w=container, v=data: self.show_context_menu(w, pos, v)
+            )
+        
+        return container
+
+    def _build_array_widget(self, data: list, schema: dict, is_base_game: bool, path: tuple) -> QWidget:
+        """Create a collapsible widget for an array schema with one row per item"""
+        # Create collapsible container for the entire array
+        container = QWidget()
+        container_layout = QVBoxLayout(container)
+        container_layout.setContentsMargins(0, 0, 0, 0)
+        container_layout.setSpacing(0)
+        
+        # Create collapsible button for the array
+        toggle_btn = QToolButton()
+        toggle_btn.setStyleSheet("QToolButton { border: none; }")
+        toggle_btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
+        toggle_btn.setArrowType(Qt.ArrowType.RightArrow)
+        # Get property name from path
+        prop_name = path[-1] if path else "Items"
+        # Format as "Property Name (X)"
+        if isinstance(prop_name, str):
+            display_name = f"{_labels(prop_name)[0]} ({len(data)})"
+        else:
+            display_name = f"Item {prop_name} ({len(data)})"
+        toggle_btn.setText(display_name)
+        toggle_btn.setCheckable(True)
+        
+        # Store array data and path for context menu
+        self.set_widget_path(toggle_btn, path)
+        self.set_widget_original(toggle_btn, data)
+
+        # Add context menu to the button
+        toggle_btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        toggle_btn.customContextMenuRequested.connect(
+            lambda pos, w=toggle_btn: self.show_context_menu(w, pos, data)
+        )
+        
+        container_layout.addWidget(toggle_btn)
+        
+        # Create content widget for array items
+        content = QWidget()
+        content_layout = QVBoxLayout(content)
+        content_layout.setContentsMargins(20, 0, 0, 0)  # Add left margin for indentation
+        content_layout.setSpacing(0)
+        content_layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)  # Align content to the left and top
+        content.setVisible(False)  # Initially collapsed
+        
+        # Get the schema for array items
+        items_schema = schema.get("items", {})
+        # Item rows are built the first time the array is expanded
+        view_schema = self.current_schema
+        built = [False]
+        
+        def build_items(checked):
+            if not checked or built[0]:
+                return
+            built[0] = True
+            # Build against the schema this view was created with
+            previous_schema = self.current_schema
+            self.current_schema = view_schema
+            try:
+                populate_items()
+            finally:
+                self.current_schema = previous_schema
+        
+        def populate_items():
+            # Populate items with updates suspended on the content widget, then repaint once
+            content.setUpdatesEnabled(False)
+            try:
+                if isinstance(items_schema, dict):
+                    # Check if array contains simple values
+                    is_simple_array = (
+                        items_schema.get("type") in ["string", "number", "boolean", "integer"] and
+                        not any(key in items_schema for key in ["$ref", "format", "properties"]) and
+                        (not data or next((False for x in data if not isinstance(x, _PRIMITIVES)), True))
+                    )
+            
+                    if is_simple_array:
+                        # For simple arrays, show values directly in a vertical layout
+                        for i, item in enumerate(data):
+                            # Update path for this array item
+                            item_path = path + (i,)
+                            widget = self.create_widget_for_value(item, items_schema, is_base_game, item_path)
+                    
                             # Add index label before each item
                             item_container = QWidget()
                             item_layout = QHBoxLayout(item_container)
                             item_layout.setContentsMargins(0, 0, 0, 0)
                             item_layout.setSpacing(4)
                             item_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)  # Align items to the left
-                            
+                    
                             # Add index label with context menu
                             index_label = QLabel(f"[{i}]")
                             index_label.setStyleSheet("QLabel { color: gray; }")
-                            index_label.setProperty("data_path", item_path)
+                            self.set_widget_path(index_label, item_path)
                             index_label.setProperty("array_data", data)
-                            
+                    
                             # Only add context menu if there's more than one item
                             if len(data) > 1:
                                 index_label.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
                                 index_label.customContextMenuRequested.connect(
                                     lambda pos, w=index_label: self.show_array_item_menu(w, pos)
                                 )
-                            
+                    
                             item_layout.addWidget(index_label)
                             item_layout.addWidget(widget)
                             content_layout.addWidget(item_container)
-            
-            def update_arrow_state(checked):
-                toggle_btn.setArrowType(Qt.ArrowType.DownArrow if checked else Qt.ArrowType.RightArrow)
-            
-            toggle_btn.toggled.connect(content.setVisible)
-            toggle_btn.toggled.connect(update_arrow_state)
-            
-            container_layout.addWidget(content)
-            return container
-            
-        else:
-            # For simple values, use create_widget_for_value with path
-            return self.create_widget_for_value(data, schema, is_base_game, path)
+                    else:
+                        # For complex arrays, show each item with its index
+                        for i, item in enumerate(data):
+                            # Update path for this array item
+                            item_path = path + (i,)
+                            widget = self.create_widget_for_schema(
+                                item, items_schema, is_base_game, item_path
+                            )
+                            if widget:
+                                # Add index label before each item
+                                item_container = QWidget()
+                                item_layout = QHBoxLayout(item_container)
+                                item_layout.setContentsMargins(0, 0, 0, 0)
+                                item_layout.setSpacing(4)
+                                item_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)  # Align items to the left
+                        
+                                # Add index label with context menu
+                                index_label = QLabel(f"[{i}]")
+                                index_label.setStyleSheet("QLabel { color: gray; }")
+                                self.set_widget_path(index_label, item_path)
+                                index_label.setProperty("array_data", data)
+                        
+                                # Only add context menu if there's more than one item
+                                if len(data) > 1:
+                                    index_label.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+                                    index_label.customContextMenuRequested.connect(
+                                        lambda pos, w=index_label: self.show_array_item_menu(w, pos)
+                                    )
+                        
+                                item_layout.addWidget(index_label)
+                                item_layout.addWidget(widget)
+                                content_layout.addWidget(item_container)
+        
+            finally:
+                content.setUpdatesEnabled(True)
+        
+        
+        def update_arrow_state(checked):
+            toggle_btn.setArrowType(Qt.ArrowType.DownArrow if checked else Qt.ArrowType.RightArrow)
+        
+        toggle_btn.toggled.connect(build_items)
+        toggle_btn.toggled.connect(content.setVisible)
+        toggle_btn.toggled.connect(update_arrow_state)
+        
+        container_layout.addWidget(content)
+        return container
     
     def create_widget_for_property(self, prop_name: str, value: any, schema: dict, is_base_game: bool, path: list = None) -> QWidget:
         """Create a widget for a specific property based on its schema"""
-        if path is None:
-            path = []
+        path = () if path is None else tuple(path)
             
         # Add property name to schema for special handling
         if isinstance(schema, dict):
@@ -3800,12 +4099,12 @@ class EntityToolGUI(QMainWindow):
             
         # Handle references to other schema definitions
         if "$ref" in schema:
-            ref_path = schema["$ref"].split("/")[1:]  # Skip the '#'
-            current = self.current_schema
-            for part in ref_path:
-                if part in current:
-                    current = current[part]
-                else:
+            if "__ref_target__" in schema:
+                # Precomputed in load_schemas
+                current = schema["__ref_target__"]
+            else:
+                current = self.resolve_ref(schema["$ref"])
+                if current is None:
                     return QLabel(f"Invalid reference: {schema['$ref']}")
             # Pass along the property name when resolving references
             if isinstance(current, dict):
@@ -3824,13 +4123,53 @@ class EntityToolGUI(QMainWindow):
         # Handle simple values
         return self.create_widget_for_value(value, schema, is_base_game, path)
     
-    def create_widget_for_value(self, value: any, schema: dict, is_base_game: bool, path: list = None) -> QWidget:
+    def _classify_string(self, value_str: str, property_name: str) -> tuple[str, Any]:
+        """Classify a string value as one of:
+        ("missing_ref", expected type), ("entity", entity type), ("localized", (text, is_base_game)),
+        ("texture", None) or ("plain", None)"""
+        cache_key = (value_str, property_name)
+        result = self._classify_cache.get(cache_key)
+        if result is not None:
+            return result
+        
+        # Check if the property name maps to a known entity type
+        expected_type = _MANIFEST_TYPE_MAP.get(property_name)
+        if expected_type:
+            # Only check the expected type based on property name
+            if (expected_type in self._manifest_index_mod.get(value_str, ()) or 
+                expected_type in self._manifest_index_base.get(value_str, ())):
+                result = ("entity", expected_type)
+            else:
+                print(f"Referenced {expected_type} not found: {value_str}")
+                result = ("missing_ref", expected_type)
+        else:
+            # Only search all manifests if no specific type is mapped, mod takes priority
+            manifest_types = self._manifest_index_mod.get(value_str) or self._manifest_index_base.get(value_str)
+            if manifest_types:
+                result = ("entity", manifest_types[0])
+        
+        if result is None:
+            # Single lookup into the merged mod/base game strings (see build_localized_lookup)
+            localized_text = self._merged_strings.get(value_str)
+            if localized_text is not None:
+                result = ("localized", (localized_text, value_str in self._base_game_keys))
+            elif value_str in self._texture_set:
+                result = ("texture", None)
+            else:
+                result = ("plain", None)
+        
+        self._classify_cache[cache_key] = result
+        return result
+    
+    def create_widget_for_value(self, value: any, schema: dict, is_base_game: bool, path: list | tuple = None) -> QWidget:
         """Create an editable widget for a value based on its schema type"""
+        # Paths are tuples here, child paths are built without copying into lists
         if path is None:
-            path = []
+            path = ()
         elif not isinstance(path, (list, tuple)):
-            path = [path]
-        path = list(path)  # Convert to list if it's a tuple
+            path = (path,)
+        else:
+            path = tuple(path)
             
         print(f"create_widget_for_value called with:")
         print(f"  value: {value}")
@@ -3854,35 +4193,17 @@ class EntityToolGUI(QMainWindow):
             value_str = str(current_value) if current_value is not None else "ERROR: No value"
 
             # Get property name from the path - use the last string in the path
-            property_name = next((p for p in reversed(path) if isinstance(p, str)), "").lower()
+            last = path[-1] if path else None
+            if isinstance(last, str):
+                property_name = _lower_key(last)  # Common case, no need to scan the path
+            else:
+                # Walk back from the end until we hit a string key
+                property_name = ""
+                for i in range(len(path) - 2, -1, -1):
+                    if isinstance(path[i], str):
+                        property_name = _lower_key(path[i])
+                        break
             print(f"Extracted property_name from path: {property_name}")
-            
-            manifest_type_map = {
-                "weapon": "weapon",
-                "weapons": "weapon",
-                "skins": "unit_skin",
-                "skin": "unit_skin",
-                "abilities": "ability",
-                "ability": "ability",
-                "action_data_source": "action_data_source",
-                "buffs": "buff",
-                "buff": "buff",
-                "item": "unit_item",
-                "unit_items": "unit_item",
-                "unit_item": "unit_item",
-                "formations": "formation",
-                "formation": "formation",
-                "flight_patterns": "flight_pattern",
-                "flight_pattern": "flight_pattern",
-                "npc_rewards": "npc_reward",
-                "npc_reward": "npc_reward",
-                "exotics": "exotic",
-                "exotic": "exotic",
-                "uniforms": "uniform",
-                "uniform": "uniform",
-                "research_subjects": "research_subject",
-                "research_subject": "research_subject"
-            }
 
             # Special handling for arrays and objects
             if isinstance(value, list):
@@ -3893,6 +4214,13 @@ class EntityToolGUI(QMainWindow):
                 
                 print(f"Processing array with schema: {schema}")
                 
+                # Fast path for the common case of a plain list of strings
+                if all(isinstance(item, str) for item in value):
+                    item_schema = {"type": "string", "property_name": schema.get("property_name", "")}
+                    for i, item in enumerate(value):
+                        layout.addWidget(self.create_widget_for_value(item, item_schema, is_base_game, path + (i,)))
+                    return container
+                
                 for i, item in enumerate(value):
                     if isinstance(item, dict):
                         # For objects in arrays (like skin_groups), recursively process their values
@@ -3912,7 +4240,7 @@ class EntityToolGUI(QMainWindow):
                                         sub_item,
                                         {"type": "string", "property_name": key},
                                         is_base_game,
-                                        path + [i, key]
+                                        path + (i, key)
                                     )
                                     layout.addWidget(widget)
                             else:
@@ -3921,7 +4249,7 @@ class EntityToolGUI(QMainWindow):
                                     val,
                                     {"type": "string", "property_name": key},
                                     is_base_game,
-                                    path + [i, key]
+                                    path + (i, key)
                                 )
                                 layout.addWidget(widget)
                     else:
@@ -3932,50 +4260,23 @@ class EntityToolGUI(QMainWindow):
                             item,
                             {"type": "string", "property_name": parent_property},
                             is_base_game,
-                            path + [i]
+                            path + (i,)
                         )
                         layout.addWidget(widget)
                 
                 return container
 
-            # Check if property name indicates a specific entity type
-            entity_type = None
-            print(f"Checking for {value_str} in manifest type {property_name}")
-            
-            # Check if the property name maps to a known entity type
-            if property_name in manifest_type_map:
-                print(f"Found manifest type mapping: {property_name} -> {manifest_type_map[property_name]}")
-                expected_type = manifest_type_map[property_name]
-                print(f"Checking for {value_str} in manifest type {expected_type}")
-                # Only check the expected type based on property name
-                if (value_str in self.manifest_data['mod'].get(expected_type, {}) or 
-                    value_str in self.manifest_data['base_game'].get(expected_type, {})):
-                    entity_type = expected_type
-                    print(f"Found {value_str} in manifest {expected_type}")
-                else:
-                    # If not found in the expected type, log a warning
-                    print(f"Referenced {expected_type} not found: {value_str}")
-                    # Don't search other manifests if we have a specific type
-                    return QLabel(value_str)
-            else:
-                # Only search all manifests if no specific type is mapped
-                print(f"Checking all manifests for {value_str}")
-                for manifest_type, manifest_data in self.manifest_data['mod'].items():
-                    if value_str in manifest_data:
-                        print(f"Found {value_str} in mod manifest {manifest_type}")
-                        entity_type = manifest_type
-                        break
-                if not entity_type:
-                    for manifest_type, manifest_data in self.manifest_data['base_game'].items():
-                        if value_str in manifest_data:
-                            print(f"Found {value_str} in base game manifest {manifest_type}")
-                            entity_type = manifest_type
-                            break
+            # Decide what kind of reference this string is, cached per value and property name
+            kind, payload = self._classify_string(value_str, property_name)
+            if kind == "missing_ref":
+                # Don't search other manifests if we have a specific type
+                return QLabel(value_str)
+            entity_type = payload if kind == "entity" else None
             
             if entity_type:
                 print(f"Creating button for {value_str} of type {entity_type}")
                 btn = QPushButton(value_str)
-                btn.setStyleSheet("text-align: left; padding: 2px;")
+                btn.setProperty("valueStyle", _BASE_GAME_STYLE if is_base_game else _ITALIC_STYLE)
 
                 # Add context menu
                 btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -3995,7 +4296,8 @@ class EntityToolGUI(QMainWindow):
                             mod_file = self.current_folder / "entities" / f"{entity_id}.{entity_type}"
                             base_file = None if not self.base_game_folder else self.base_game_folder / "entities" / f"{entity_id}.{entity_type}"
                             
-                            if not mod_file.exists() and (not base_file or not base_file.exists()):
+                            if (not self.entity_file_exists(entity_id, entity_type) and 
+                                (not base_file or not self.entity_file_exists(entity_id, entity_type, 'base_game'))):
                                 error_msg = f"Could not find {entity_type} file: {entity_id}\n\n"
                                 if not self.base_game_folder:
                                     error_msg += "Note: Base game folder is not configured. Some references may not be found."
@@ -4010,44 +4312,15 @@ class EntityToolGUI(QMainWindow):
                     return handler
                 
                 btn.clicked.connect(create_click_handler())
-
-                btn.setStyleSheet("font-style: italic;")
-                
-                if is_base_game:
-                    btn.setStyleSheet(btn.styleSheet() + "; color: #666666;")
                 
                 # Store path and original value
-                btn.setProperty("data_path", path)
-                btn.setProperty("original_value", value)
+                self.set_widget_path(btn, path)
+                self.set_widget_original(btn, value)
                 return btn
                 
             # Check if the string value is a localized text key
-            is_localized_key = False
-            localized_text = None
-            is_base = False
-            
-            # Try mod strings first
-            if self.current_language in self.all_localized_strings['mod'] and value_str in self.all_localized_strings['mod'][self.current_language]:
-                is_localized_key = True
-                localized_text = self.all_localized_strings['mod'][self.current_language][value_str]
-                is_base = False
-                print(f"Found localized text in mod {self.current_language}: {localized_text}")
-            elif "en" in self.all_localized_strings['mod'] and value_str in self.all_localized_strings['mod']["en"]:
-                is_localized_key = True
-                localized_text = self.all_localized_strings['mod']["en"][value_str]
-                is_base = False
-                print(f"Found localized text in mod en: {localized_text}")
-            # Try base game strings
-            elif self.current_language in self.all_localized_strings['base_game'] and value_str in self.all_localized_strings['base_game'][self.current_language]:
-                is_localized_key = True
-                localized_text = self.all_localized_strings['base_game'][self.current_language][value_str]
-                is_base = True
-                print(f"Found localized text in base game {self.current_language}: {localized_text}")
-            elif "en" in self.all_localized_strings['base_game'] and value_str in self.all_localized_strings['base_game']["en"]:
-                is_localized_key = True
-                localized_text = self.all_localized_strings['base_game']["en"][value_str]
-                is_base = True
-                print(f"Found localized text in base game en: {localized_text}")
+            is_localized_key = kind == "localized"
+            localized_text, is_base = payload if is_localized_key else (None, False)
             
             if is_localized_key:
                 print(f"Creating localized text widget for key: {value_str}")
@@ -4060,10 +4333,11 @@ class EntityToolGUI(QMainWindow):
                 # Add editable field for the key
                 print(f"Creating key edit for: {value_str}")
                 key_edit = QLineEdit(value_str)
-                key_edit.textChanged.connect(lambda text: self.on_text_changed(key_edit, text))
-                key_edit.setProperty("data_path", path)
-                key_edit.setProperty("original_value", value)
-                key_edit.setStyleSheet("font-style: italic;")
+                key_edit.textChanged.connect(self._on_any_text_changed)
+                self.set_widget_path(key_edit, path)
+                self.set_widget_original(key_edit, value)
+                # Base game keys are muted, others italic
+                key_edit.setProperty("valueStyle", _MUTED_STYLE if is_base_game else _ITALIC_STYLE)
                 layout.addWidget(key_edit)
 
                 # Add context menu
@@ -4071,14 +4345,9 @@ class EntityToolGUI(QMainWindow):
                 key_edit.customContextMenuRequested.connect(
                     lambda pos, w=key_edit, v=value_str: self.show_context_menu(w, pos, v)
                 )
-                # Style key if from base game
-                if is_base:
-                    key_edit.setStyleSheet("font-style: italic;")
-
                 # Make key non-editable if base game
                 if is_base_game:
                     key_edit.setReadOnly(True)
-                    key_edit.setStyleSheet("color: #666666;")
                 
                 # Get the current value from command stack if available
                 text_file = self.current_folder / "localized_text" / f"{self.current_language}.localized_text"
@@ -4093,7 +4362,7 @@ class EntityToolGUI(QMainWindow):
                 text_edit.setPlaceholderText("Enter translation...")
                 text_edit.setProperty("localized_key", value_str)
                 text_edit.setProperty("language", self.current_language)
-                text_edit.setProperty("original_value", current_text)
+                self.set_widget_original(text_edit, current_text)
                 text_edit.setProperty("is_updating", False)
                 
                 def on_text_changed():
@@ -4112,13 +4381,13 @@ class EntityToolGUI(QMainWindow):
 
                 # Make text non-editable if base game
                 if is_base:
-                    text_edit.setStyleSheet("color: #666666")
+                    text_edit.setProperty("valueStyle", _MUTED_STYLE)
                     text_edit.setReadOnly(True)
                 
                 # Store the text file path in the container for updates
                 container.setProperty("text_file_path", str(text_file))
-                container.setProperty("data_path", path)
-                container.setProperty("original_value", value)
+                self.set_widget_path(container, path)
+                self.set_widget_original(container, value)
                 
                 # Register for command stack updates
                 if not is_base and text_file is not None:
@@ -4136,7 +4405,7 @@ class EntityToolGUI(QMainWindow):
                 return container
                 
             # Check if the string value is a texture file name
-            elif value_str in self.all_texture_files['mod'] or value_str in self.all_texture_files['base_game']:
+            elif kind == "texture":
                 # Handle texture references - create a container with both texture and editable field
                 container = QWidget()
                 layout = QVBoxLayout(container)
@@ -4151,10 +4420,10 @@ class EntityToolGUI(QMainWindow):
                 if not is_base_game:
                     print(f"Creating texture edit for: {value_str}")
                     edit = QLineEdit(value_str)
-                    edit.textChanged.connect(lambda text: self.on_text_changed(edit, text))
-                    edit.setProperty("data_path", path)
-                    edit.setProperty("original_value", value)
-                    edit.setStyleSheet("font-style: italic;")
+                    edit.textChanged.connect(self._on_any_text_changed)
+                    self.set_widget_path(edit, path)
+                    self.set_widget_original(edit, value)
+                    edit.setProperty("valueStyle", _ITALIC_STYLE)
                     layout.addWidget(edit)
                 
                     # Add context menu
@@ -4163,10 +4432,20 @@ class EntityToolGUI(QMainWindow):
                         lambda pos, w=edit, v=value_str: self.show_context_menu(w, pos, v)
                     )
                 
-                container.setProperty("data_path", path)
-                container.setProperty("original_value", value)
+                self.set_widget_path(container, path)
+                self.set_widget_original(container, value)
                 return container
 
+            # Base game values are read-only, a label is much cheaper than a combo box or line edit
+            if is_base_game:
+                label = QLabel(value_str)
+                label.setProperty("valueStyle", _BASE_GAME_STYLE)
+                
+                # Store path and original value
+                self.set_widget_path(label, path)
+                self.set_widget_original(label, value)
+                return label
+
             # Handle enum values
             if "enum" in schema:
                 # Create dropdown for enum values
@@ -4175,46 +4454,49 @@ class EntityToolGUI(QMainWindow):
                 current_index = combo.findText(value_str)
                 if current_index >= 0:
                     combo.setCurrentIndex(current_index)
-                if is_base_game:
-                    combo.setStyleSheet("color: #666666; font-style: italic;")
-                    combo.setEnabled(False)  # Disable combo box for base game content
-                else:
-                    # Connect currentTextChanged signal to command creation
-                    combo.currentTextChanged.connect(lambda text: self.on_combo_changed(combo, text))
+                # Connect currentTextChanged signal to command creation
+                combo.currentTextChanged.connect(self._on_any_combo_changed)
                 
                 # Install wheel event filter
                 combo.installEventFilter(self.wheel_filter)
                 
                 # Store path and original value
-                combo.setProperty("data_path", path)
-                combo.setProperty("original_value", value)
+                self.set_widget_path(combo, path)
+                self.set_widget_original(combo, value)
                 return combo
 
             # Handle all other values
             else:
                 print(f"Creating edit for: {value_str}")
                 edit = QLineEdit(value_str)
-                if is_base_game:
-                    edit.setStyleSheet("color: #666666; font-style: italic;")
-                    edit.setReadOnly(True)
-                else:
-                    # Connect text changed signal to command creation
-                    edit.textChanged.connect(lambda text: self.on_text_changed(edit, text))
-                    
-                    # Add context menu
-                    edit.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-                    edit.customContextMenuRequested.connect(
-                        lambda pos, w=edit, v=value_str: self.show_context_menu(w, pos, v)
-                    )
+                # Connect text changed signal to command creation
+                edit.textChanged.connect(self._on_any_text_changed)
+                
+                # Add context menu
+                edit.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+                edit.customContextMenuRequested.connect(
+                    lambda pos, w=edit, v=value_str: self.show_context_menu(w, pos, v)
+                )
                 
                 # Store path and original value
-                edit.setProperty("data_path", path)
-                edit.setProperty("original_value", value)
+                self.set_widget_path(edit, path)
+                self.set_widget_original(edit, value)
                 return edit
                 
+        elif schema_type in ("integer", "number") and is_base_game:
+            # Base game numbers are read-only, a label is much cheaper than a spinbox
+            label = QLabel(str(self.simplify_number(current_value if current_value is not None else 0)))
+            label.setProperty("valueStyle", _BASE_GAME_STYLE)
+            
+            # Store path and original value
+            self.set_widget_path(label, path)
+            self.set_widget_original(label, current_value)
+            return label
+            
         elif schema_type == "integer":
-            spin = QSpinBox()
-            spin.setValue(int(current_value) if current_value is not None else 0)
+            spin = self._acquire_spin_box(QSpinBox)
+            # A reused spin box is already connected, don't let setting it up count as an edit
+            spin.blockSignals(True)
             
             # Set minimum and maximum if specified
             if "minimum" in schema:
@@ -4226,25 +4508,19 @@ class EntityToolGUI(QMainWindow):
                 spin.setMaximum(schema["maximum"])
             else:
                 spin.setMaximum(1000000)  # Reasonable default maximum
-                
-            if is_base_game:
-                spin.setStyleSheet("color: #666666; font-style: italic;")
-                spin.setReadOnly(True)  # Make spinbox read-only for base game content
-                spin.setButtonSymbols(QSpinBox.ButtonSymbols.NoButtons)  # Hide up/down buttons
-            else:
-                # Connect valueChanged signal to command creation
-                spin.valueChanged.connect(lambda value: self.on_spin_changed(spin, value))
             
-            # Install wheel event filter
-            spin.installEventFilter(self.wheel_filter)
+            spin.setValue(int(current_value) if current_value is not None else 0)
+            spin.blockSignals(False)
             
             # Store path and original value
-            spin.setProperty("data_path", path)
-            spin.setProperty("original_value", current_value)
+            self.set_widget_path(spin, path)
+            self.set_widget_original(spin, current_value)
             return spin
             
         elif schema_type == "number":
-            spin = QDoubleSpinBox()
+            spin = self._acquire_spin_box(QDoubleSpinBox)
+            # A reused spin box is already connected, don't let setting it up count as an edit
+            spin.blockSignals(True)
             
             # Convert value to float, handling scientific notation
             try:
@@ -4264,61 +4540,48 @@ class EntityToolGUI(QMainWindow):
             # Set step size
             spin.setStepType(QDoubleSpinBox.StepType.AdaptiveDecimalStepType)
             spin.setSingleStep(0.000001)  # Small step size for precision
-            
-            if is_base_game:
-                spin.setStyleSheet("color: #666666; font-style: italic;")
-                spin.setReadOnly(True)  # Make spinbox read-only for base game content
-                spin.setButtonSymbols(QDoubleSpinBox.ButtonSymbols.NoButtons)  # Hide up/down buttons
-            else:
-                # Connect valueChanged signal to command creation
-                spin.valueChanged.connect(lambda value: self.on_spin_changed(spin, value))
-            
-            # Install wheel event filter
-            spin.installEventFilter(self.wheel_filter)
+            spin.blockSignals(False)
             
             # Store path and original value
-            spin.setProperty("data_path", path)
-            spin.setProperty("original_value", current_value)
+            self.set_widget_path(spin, path)
+            self.set_widget_original(spin, current_value)
             return spin
             
         elif schema_type == "boolean":
             checkbox = QCheckBox()
             checkbox.setChecked(bool(current_value))
             if is_base_game:
-                checkbox.setStyleSheet("color: #666666; font-style: italic;")
+                checkbox.setProperty("valueStyle", _BASE_GAME_STYLE)
                 checkbox.setEnabled(False)  # Disable checkbox for base game content
             else:
                 # Connect stateChanged signal to command creation
-                checkbox.stateChanged.connect(lambda state: self.on_checkbox_changed(checkbox, state))
+                checkbox.stateChanged.connect(self._on_any_checkbox_changed)
             
             # Store path and original value
-            checkbox.setProperty("data_path", path)
-            checkbox.setProperty("original_value", current_value)
+            self.set_widget_path(checkbox, path)
+            self.set_widget_original(checkbox, current_value)
             return checkbox
             
         elif schema_type == "object":
             # For objects, create a widget that shows the object's structure
             group = QGroupBox()
-            layout = QVBoxLayout()
+            # One form layout for all rows instead of a QWidget + QHBoxLayout per property
+            layout = QFormLayout()
             for key, val in current_value.items():
                 if isinstance(val, dict):
                     # Recursively handle nested objects
-                    nested_widget = self.create_widget_for_value(val, {"type": "object"}, is_base_game, path + [key])
-                    layout.addWidget(QLabel(key))
-                    layout.addWidget(nested_widget)
+                    nested_widget = self.create_widget_for_value(val, {"type": "object"}, is_base_game, path + (key,))
+                    layout.addRow(QLabel(key))
+                    layout.addRow(nested_widget)
                 else:
                     # Handle simple values
-                    row_widget = QWidget()
-                    row_layout = QHBoxLayout(row_widget)
-                    row_layout.addWidget(QLabel(f"{key}:"))
-                    value_widget = self.create_widget_for_value(val, {"type": type(val).__name__}, is_base_game, path + [key])
-                    row_layout.addWidget(value_widget)
-                    layout.addWidget(row_widget)
+                    value_widget = self.create_widget_for_value(val, {"type": type(val).__name__}, is_base_game, path + (key,))
+                    layout.addRow(QLabel(f"{key}:"), value_widget)
             group.setLayout(layout)
             
             # Store path and original value
-            group.setProperty("data_path", path)
-            group.setProperty("original_value", current_value)
+            self.set_widget_path(group, path)
+            self.set_widget_original(group, current_value)
             return group
             
         else:
@@ -4327,12 +4590,12 @@ class EntityToolGUI(QMainWindow):
             print(f"Creating edit for unknown type: {value}")
             edit = QLineEdit(str(value))
             if is_base_game:
-                edit.setStyleSheet("color: #666666; font-style: italic;")
+                edit.setProperty("valueStyle", _BASE_GAME_STYLE)
                 edit.setReadOnly(True)
             
             # Store path and original value
-            edit.setProperty("data_path", path)
-            edit.setProperty("original_value", value)
+            self.set_widget_path(edit, path)
+            self.set_widget_original(edit, value)
 
             # Add context menu
             edit.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -4354,7 +4617,7 @@ class EntityToolGUI(QMainWindow):
             return
             
         # Try mod folder first
-        entity_file = self.current_folder / "entities" / f"{entity_id}.{entity_type}"
+        entity_file = self.entity_file_path(entity_id, entity_type)
         entity_data = None
         is_base_game = False
         
@@ -4376,7 +4639,7 @@ class EntityToolGUI(QMainWindow):
                 
                 # Try base game folder if not found in mod folder
                 elif self.base_game_folder:
-                    base_game_file = self.base_game_folder / "entities" / f"{entity_id}.{entity_type}"
+                    base_game_file = self.entity_file_path(entity_id, entity_type, True)
                     if base_game_file.exists():
                         print(f"Loading referenced entity from base game: {base_game_file}")
                         with open(base_game_file, 'r', encoding='utf-8') as f:
@@ -4401,275 +4664,18 @@ class EntityToolGUI(QMainWindow):
                 print(f"Storing initial data in command stack for {entity_file}")
                 self.command_stack.update_file_data(entity_file, entity_data)
             
-            # Handle different entity types and switch to appropriate tab
-            if entity_type == "weapon":
-                # Weapons are shown in the Units tab
-                units_tab = next((i for i in range(self.tab_widget.count()) if self.tab_widget.tabText(i) == "Units"), 0)
-                self.tab_widget.setCurrentIndex(units_tab)
-                
-                # Only clear and update the weapon panel content
-                while self.weapon_details_layout.count():
-                    item = self.weapon_details_layout.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                
-                schema_view = self.create_schema_view("weapon", entity_data, is_base_game, entity_file)
-                self.weapon_details_layout.addWidget(schema_view)
-                self.weapon_file = entity_file  # Store file path
-                print(f"Created weapon schema view for {entity_file}")
-
-            elif entity_type == "research_subject":
-                # Switch to Research tab
-                research_tab = next((i for i in range(self.tab_widget.count()) if self.tab_widget.tabText(i) == "Research"), 0)
-                self.tab_widget.setCurrentIndex(research_tab)
-                
-                # Load the research subject
-                self.load_research_subject(entity_id)
-                
-            elif entity_type == "unit_skin":
-                # Unit skins are shown in the Units tab
-                units_tab = next((i for i in range(self.tab_widget.count()) if self.tab_widget.tabText(i) == "Units"), 0)
-                self.tab_widget.setCurrentIndex(units_tab)
-                
-                # Only clear and update the skin panel content
-                while self.skin_details_layout.count():
-                    item = self.skin_details_layout.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                
-                schema_view = self.create_schema_view("unit-skin", entity_data, is_base_game, entity_file)
-                self.skin_details_layout.addWidget(schema_view)
-                self.skin_file = entity_file  # Store file path
-                print(f"Created unit skin schema view for {entity_file}")
-                
-            elif entity_type == "ability":
-                # Switch to Abilities/Buffs tab
-                abilities_tab = next((i for i in range(self.tab_widget.count()) if self.tab_widget.tabText(i) == "Abilities/Buffs"), 0)
-                self.tab_widget.setCurrentIndex(abilities_tab)
-                
-                # Select the ability in the list if it exists
-                for i in range(self.ability_list.count()):
-                    if self.ability_list.item(i).text() == entity_id:
-                        self.ability_list.setCurrentRow(i)
-                        break
-                
-                # Only clear and update the ability panel content
-                while self.ability_details_layout.count():
-                    item = self.ability_details_layout.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                
-                schema_view = self.create_schema_view("ability", entity_data, is_base_game, entity_file)
-                self.ability_details_layout.addWidget(schema_view)
-                self.ability_file = entity_file  # Store file path
-                print(f"Created ability schema view for {entity_file}")
-                
-            elif entity_type == "unit_item":
-                # Switch to Unit Items tab
-                items_tab = next((i for i in range(self.tab_widget.count()) if self.tab_widget.tabText(i) == "Unit Items"), 0)
-                self.tab_widget.setCurrentIndex(items_tab)
-                
-                # Select the item in the list if it exists
-                for i in range(self.items_list.count()):
-                    if self.items_list.item(i).text() == entity_id:
-                        self.items_list.setCurrentRow(i)
-                        break
-                
-                # Only clear and update the item panel content
-                while self.item_details_layout.count():
-                    item = self.item_details_layout.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                
-                schema_view = self.create_schema_view("unit-item", entity_data, is_base_game, entity_file)
-                self.item_details_layout.addWidget(schema_view)
-                
-            elif entity_type == "buff":
-                # Switch to Abilities/Buffs tab
-                abilities_tab = next((i for i in range(self.tab_widget.count()) if self.tab_widget.tabText(i) == "Abilities/Buffs"), 0)
-                self.tab_widget.setCurrentIndex(abilities_tab)
-                
-                # Select the buff in the list if it exists
-                for i in range(self.buff_list.count()):
-                    if self.buff_list.item(i).text() == entity_id:
-                        self.buff_list.setCurrentRow(i)
-                        break
-                
-                # Only clear and update the buff panel content
-                while self.buff_details_layout.count():
-                    item = self.buff_details_layout.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                
-                schema_view = self.create_schema_view("buff", entity_data, is_base_game, entity_file)
-                self.buff_details_layout.addWidget(schema_view)
-                
-            elif entity_type == "action_data_source":
-                # Switch to Abilities/Buffs tab
-                abilities_tab = next((i for i in range(self.tab_widget.count()) if self.tab_widget.tabText(i) == "Abilities/Buffs"), 0)
-                self.tab_widget.setCurrentIndex(abilities_tab)
-                
-                # Select the action in the list if it exists
-                for i in range(self.action_list.count()):
-                    if self.action_list.item(i).text() == entity_id:
-                        self.action_list.setCurrentRow(i)
-                        break
-                
-                # Only clear and update the action panel content
-                while self.action_details_layout.count():
-                    item = self.action_details_layout.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                
-                schema_view = self.create_schema_view("action-data-source", entity_data, is_base_game, entity_file)
-                self.action_details_layout.addWidget(schema_view)
-                
-            elif entity_type == "formation":
-                # Switch to Formations tab
-                formations_tab = next((i for i in range(self.tab_widget.count()) if self.tab_widget.tabText(i) == "Formations"), 0)
-                self.tab_widget.setCurrentIndex(formations_tab)
-                
-                # Select the formation in the list if it exists
-                for i in range(self.formations_list.count()):
-                    if self.formations_list.item(i).text() == entity_id:
-                        self.formations_list.setCurrentRow(i)
-                        break
-                
-                # Only clear and update the formation panel content
-                while self.formation_details_layout.count():
-                    item = self.formation_details_layout.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                
-                schema_view = self.create_schema_view("formation", entity_data, is_base_game, entity_file)
-                self.formation_details_layout.addWidget(schema_view)
-                
-            elif entity_type == "flight_pattern":
-                # Switch to Flight Patterns tab
-                patterns_tab = next((i for i in range(self.tab_widget.count()) if self.tab_widget.tabText(i) == "Flight Patterns"), 0)
-                self.tab_widget.setCurrentIndex(patterns_tab)
-                
-                # Select the pattern in the list if it exists
-                for i in range(self.patterns_list.count()):
-                    if self.patterns_list.item(i).text() == entity_id:
-                        self.patterns_list.setCurrentRow(i)
-                        break
-                
-                # Only clear and update the pattern panel content
-                while self.pattern_details_layout.count():
-                    item = self.pattern_details_layout.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                
-                schema_view = self.create_schema_view("flight-pattern", entity_data, is_base_game, entity_file)
-                self.pattern_details_layout.addWidget(schema_view)
-                
-            elif entity_type == "npc_reward":
-                # Switch to NPC Rewards tab
-                rewards_tab = next((i for i in range(self.tab_widget.count()) if self.tab_widget.tabText(i) == "NPC Rewards"), 0)
-                self.tab_widget.setCurrentIndex(rewards_tab)
-                
-                # Select the reward in the list if it exists
-                for i in range(self.rewards_list.count()):
-                    if self.rewards_list.item(i).text() == entity_id:
-                        self.rewards_list.setCurrentRow(i)
-                        break
-                
-                # Only clear and update the reward panel content
-                while self.reward_details_layout.count():
-                    item = self.reward_details_layout.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                
-                schema_view = self.create_schema_view("npc-reward", entity_data, is_base_game, entity_file)
-                self.reward_details_layout.addWidget(schema_view)
-                
-            elif entity_type == "exotic":
-                # Switch to Exotics tab
-                exotics_tab = next((i for i in range(self.tab_widget.count()) if self.tab_widget.tabText(i) == "Exotics"), 0)
-                self.tab_widget.setCurrentIndex(exotics_tab)
-                
-                # Select the exotic in the list if it exists
-                for i in range(self.exotics_list.count()):
-                    if self.exotics_list.item(i).text() == entity_id:
-                        self.exotics_list.setCurrentRow(i)
-                        break
-                
-                # Only clear and update the exotic panel content
-                while self.exotic_details_layout.count():
-                    item = self.exotic_details_layout.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                
-                schema_view = self.create_schema_view("exotic", entity_data, is_base_game, entity_file)
-                self.exotic_details_layout.addWidget(schema_view)
-                
-            elif entity_type == "uniform":
-                # Switch to Uniforms tab
-                uniforms_tab = next((i for i in range(self.tab_widget.count()) if self.tab_widget.tabText(i) == "Uniforms"), 0)
-                self.tab_widget.setCurrentIndex(uniforms_tab)
-                
-                # Select the uniform in the list if it exists
-                for i in range(self.uniforms_list.count()):
-                    if self.uniforms_list.item(i).text() == entity_id:
-                        self.uniforms_list.setCurrentRow(i)
-                        break
-                
-                # Only clear and update the uniform panel content
-                while self.uniform_details_layout.count():
-                    item = self.uniform_details_layout.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                
-                schema_view = self.create_schema_view("uniform", entity_data, is_base_game, entity_file)
-                self.uniform_details_layout.addWidget(schema_view)
-                
-            elif entity_type == "unit":
-                # Switch to Units tab
-                units_tab = next((i for i in range(self.tab_widget.count()) if self.tab_widget.tabText(i) == "Units"), 0)
-                self.tab_widget.setCurrentIndex(units_tab)
-                
-                # Select the unit in the buildable list if it exists
-                found = False
-                for i in range(self.units_list.count()):
-                    if self.units_list.item(i).text() == entity_id:
-                        self.units_list.setCurrentRow(i)
-                        found = True
-                        break
-                
-                # Check strikecraft list if not found in units list
-                if not found:
-                    for i in range(self.strikecraft_list.count()):
-                        if self.strikecraft_list.item(i).text() == entity_id:
-                            self.strikecraft_list.setCurrentRow(i)
-                            found = True
-                            break
-                        
-                # Finally check all units list
-                if not found:
-                    for i in range(self.all_units_list.count()):
-                        if self.all_units_list.item(i).text() == entity_id:
-                            self.all_units_list.setCurrentRow(i)
-                            found = True
-                            break
-                
-                # Only clear and update the unit panel content
-                while self.unit_details_layout.count():
-                    item = self.unit_details_layout.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                
-                schema_view = self.create_schema_view("unit", entity_data, is_base_game, entity_file)
-                self.unit_details_layout.addWidget(schema_view)
-                
-            elif entity_type == "research_subject":
+            # Research subjects have their own view
+            if entity_type == "research_subject":
                 # Switch to Research tab
-                research_tab = next((i for i in range(self.tab_widget.count()) if self.tab_widget.tabText(i) == "Research"), 0)
-                self.tab_widget.setCurrentIndex(research_tab)
+                self.tab_widget.setCurrentIndex(self._tab_index_by_name.get("Research", 0))
                 
                 # Load the research subject
                 self.load_research_subject(entity_id)
-                
+                return
+            
+            handler = self._entity_handlers.get(entity_type)
+            if handler:
+                self.show_referenced_entity(handler, entity_id, entity_data, is_base_game, entity_file)
             else:
                 QMessageBox.warning(self, "Error", f"Unknown entity type: {entity_type}")
                 print(f"Unknown entity type: {entity_type}")
@@ -4681,6 +4687,37 @@ class EntityToolGUI(QMainWindow):
             print(f"Error loading {entity_type} file {entity_id}: {str(e)}")
             return
     
+    def find_list_row(self, list_widget: QListWidget, text: str) -> int:
+        """Get the first row with the given text in a list widget, or None"""
+        index = self._list_index.get(list_widget)
+        if index is None:
+            index = {}
+            for i in range(list_widget.count()):
+                index.setdefault(list_widget.item(i).text(), i)
+            self._list_index[list_widget] = index
+        return index.get(text)
+    
+    def show_referenced_entity(self, handler: tuple, entity_id: str, entity_data: dict, is_base_game: bool, entity_file: Path):
+        """Switch to an entity's tab, select it in its list and show it in the details panel"""
+        tab_name, list_widgets, details_layout, schema_name, file_attr = handler
+        self.tab_widget.setCurrentIndex(self._tab_index_by_name.get(tab_name, 0))
+        
+        # Select the entity in the first list that has it
+        for list_widget in list_widgets:
+            row = self.find_list_row(list_widget, entity_id)
+            if row is not None:
+                list_widget.setCurrentRow(row)
+                break
+        
+        # Only clear and update the details panel content
+        self.clear_layout(details_layout)
+        
+        schema_view = self.create_schema_view(schema_name, entity_data, is_base_game, entity_file)
+        details_layout.addWidget(schema_view)
+        if file_attr:
+            setattr(self, file_attr, entity_file)  # Store file path
+        print(f"Created {schema_name} schema view for {entity_file}")
+    
     def get_schema_for_path(self, path: list) -> dict:
         """Get the schema for a specific data path"""
         if not self.current_schema:
@@ -4701,14 +4738,9 @@ class EntityToolGUI(QMainWindow):
             if isinstance(schema, dict):
                 if "$ref" in schema:
                     # Resolve reference
-                    ref_path = schema["$ref"].split("/")[1:]
-                    current = self.current_schema
-                    for ref_part in ref_path:
-                        if ref_part in current:
-                            current = current[ref_part]
-                        else:
-                            return None
-                    schema = current
+                    schema = schema.get("__ref_target__") or self.resolve_ref(schema["$ref"])
+                    if schema is None:
+                        return None
                 
                 if isinstance(part, str):
                     # Object property
@@ -4722,14 +4754,9 @@ class EntityToolGUI(QMainWindow):
                         schema = schema["items"]
                         # Resolve any references in the items schema
                         if isinstance(schema, dict) and "$ref" in schema:
-                            ref_path = schema["$ref"].split("/")[1:]
-                            current = self.current_schema
-                            for ref_part in ref_path:
-                                if ref_part in current:
-                                    current = current[ref_part]
-                                else:
-                                    return None
-                            schema = current
+                            schema = schema.get("__ref_target__") or self.resolve_ref(schema["$ref"])
+                            if schema is None:
+                                return None
                     else:
                         return None
                         
@@ -4815,7 +4842,7 @@ class EntityToolGUI(QMainWindow):
                     for part in ref_path:
                         resolved = resolved[part]
                     # Merge any additional properties from the original schema
-                    resolved = {**resolved, **{k: v for k, v in schema.items() if k != "$ref"}}
+                    resolved = {**resolved, **{k: v for k, v in schema.items() if k not in ("$ref", "__ref_target__")}}
                     return resolved
                 except (KeyError, TypeError):
                     continue
@@ -4838,48 +4865,66 @@ class EntityToolGUI(QMainWindow):
 
     def create_generic_schema(self, data: dict) -> dict:
         """Create a generic schema that matches any JSON structure"""
-        if isinstance(data, dict):
-            properties = {}
-            for key, value in data.items():
-                properties[key] = self.create_generic_schema(value)
-            return {
-                "type": "object",
-                "properties": properties
-            }
-        elif isinstance(data, list):
-            # If list is empty or has mixed types, use any type
-            if not data or not all(isinstance(x, type(data[0])) for x in data):
-                return {
-                    "type": "array",
-                    "items": {"type": "string"}  # Default to string for empty/mixed arrays
-                }
-            # Otherwise use the type of the first item for all items
-            return {
-                "type": "array",
-                "items": self.create_generic_schema(data[0])
-            }
-        elif isinstance(data, bool):
-            return {"type": "boolean"}
-        elif isinstance(data, int):
-            return {"type": "integer"}
-        elif isinstance(data, float):
-            return {"type": "number"}
-        else:
-            return {"type": "string"}  # Default to string for all other types
+        root = {}
+        # Fill in (schema, value) pairs from an explicit stack instead of recursing,
+        # JSON only has these exact types so compare them directly
+        stack = [(root, data)]
+        while stack:
+            schema, value = stack.pop()
+            value_type = type(value)
+            if value_type is dict:
+                properties = {}
+                schema["type"] = "object"
+                schema["properties"] = properties
+                for key, val in value.items():
+                    properties[key] = child = {}
+                    stack.append((child, val))
+            elif value_type is list:
+                schema["type"] = "array"
+                schema["items"] = items = {}
+                # If list is empty or has mixed types, use any type
+                if not value or not all(isinstance(x, type(value[0])) for x in value):
+                    items["type"] = "string"  # Default to string for empty/mixed arrays
+                else:
+                    # Otherwise use the type of the first item for all items
+                    stack.append((items, value[0]))
+            elif value_type is bool:
+                schema["type"] = "boolean"
+            elif value_type is int:
+                schema["type"] = "integer"
+            elif value_type is float:
+                schema["type"] = "number"
+            else:
+                schema["type"] = "string"  # Default to string for all other types
+        return root
 
     def get_schema_view_file_path(self, widget: QWidget) -> Path | None:
         """Get the file path from the parent schema view of a widget"""
+        # Widgets stay in the view they were built in, so remember the answer on the widget
+        file_path = getattr(widget, "_schema_file_path", None)
+        if file_path is not None:
+            return file_path
+        
         # Walk up the widget hierarchy until we find a QScrollArea (schema view)
         current = widget
         while current is not None:
             if isinstance(current, QScrollArea):
-                file_path_str = current.property("file_path")
-                if file_path_str:
-                    return Path(file_path_str)
+                file_path = getattr(current, "view_file_path", None)
+                if file_path:
+                    # Not cached while unparented, the widget may not be in its view yet
+                    widget._schema_file_path = file_path = Path(file_path)
+                    return file_path
                 break
             current = current.parent()
         return None
 
+    def find_schema_view(self, file_path: Path) -> QWidget | None:
+        """Get the schema view currently showing a file, if it is still in the window"""
+        schema_view = self._schema_views.get(Path(file_path)) if file_path else None
+        if schema_view is not None and schema_view.parent() is not None:
+            return schema_view
+        return None
+
     def find_parent_schema_view(self, widget: QWidget) -> QWidget:
         """Find the parent schema view widget that contains the file path"""
         current = widget
@@ -4900,12 +4945,7 @@ class EntityToolGUI(QMainWindow):
             return
             
         # Find the schema view widget
-        schema_view = None
-        for widget in self.findChildren(QWidget):
-            if (hasattr(widget, 'property') and 
-                widget.property("file_path") == str(file_path)):
-                schema_view = widget
-                break
+        schema_view = self.find_schema_view(file_path)
         
         if schema_view and schema_view.parent() and schema_view.parent().layout():
             # Get the schema type from the file extension
@@ -4963,30 +5003,23 @@ class EntityToolGUI(QMainWindow):
         # Re-add tier headers and grid lines
         current_view.add_tier_headers()
         
-        # Load field backgrounds from research data
-        field_backgrounds = {}
-        if "research_domains" in self.current_data["research"]:
-            for domain_name, domain_data in self.current_data["research"]["research_domains"].items():
-                if "research_fields" in domain_data:
-                    for field_data in domain_data["research_fields"]:
-                        field_id = field_data.get("id")
-                        picture = field_data.get("picture")
-                        if field_id and picture:
-                            pixmap, is_base_game = self.load_texture(picture)
-                            if not pixmap.isNull():
-                                field_backgrounds[field_id] = pixmap
-        
         # Set field backgrounds in tree view
-        current_view.set_field_backgrounds(field_backgrounds)
+        current_view.set_field_backgrounds(self.load_field_background_pixmaps(self.current_data["research"]))
         
         # Add research subjects to the view
         if "research_subjects" in self.current_data["research"]:
             # First pass: collect all subjects and sort by tier
             subjects_by_tier = {}
-            for subject_id in self.current_data["research"]["research_subjects"]:
-                subject_file = self.current_folder / "entities" / f"{subject_id}.research_subject"
-                subject_data, is_base_game = self.load_file(subject_file)
-                
+            subject_ids = self.current_data["research"]["research_subjects"]
+            paths = [self.current_folder / "entities" / f"{subject_id}.research_subject" for subject_id in subject_ids]
+            
+            # Read subject files in parallel, only the file I/O leaves the GUI thread
+            results = []
+            if paths:
+                with ThreadPoolExecutor(max_workers=min(16, len(paths))) as ex:
+                    results = list(ex.map(self.load_file, paths))
+            
+            for subject_id, (subject_data, is_base_game) in zip(subject_ids, results):
                 if subject_data:
                     tier = subject_data.get("tier", 0)  # Default to tier 0
                     if tier not in subjects_by_tier:
@@ -5028,16 +5061,239 @@ class EntityToolGUI(QMainWindow):
             current_view.set_domain(current_domain)
             current_view.scale(current_zoom / current_view.transform().m11(), current_zoom / current_view.transform().m11())
 
+    def _acquire_group_widget(self, text: str) -> tuple[QWidget, QToolButton, QWidget, QVBoxLayout]:
+        """Get a collapsed section (group, toggle button, content, content layout) from the pool or create one"""
+        if self._group_widget_pool:
+            group_widget, toggle_btn, content, content_layout = self._group_widget_pool.pop()
+            toggle_btn.blockSignals(True)
+            toggle_btn.setChecked(False)
+            toggle_btn.blockSignals(False)
+        else:
+            group_widget = QWidget()
+            group_layout = QVBoxLayout(group_widget)
+            group_layout.setContentsMargins(0, 0, 0, 0)
+            
+            # Create collapsible button
+            toggle_btn = QToolButton()
+            toggle_btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
+            toggle_btn.setCheckable(True)
+            # Pooled like the spin boxes, so its path is tracked the same way
+            toggle_btn._pool_generation = 0
+            toggle_btn.destroyed.connect(lambda _=None, key=id(toggle_btn): self._forget_widget(key))
+            
+            # Create content widget
+            content = QWidget()
+            content_layout = QVBoxLayout(content)
+            content_layout.setContentsMargins(20, 0, 0, 0)
+            
+            group_layout.addWidget(toggle_btn)
+            group_layout.addWidget(content)
+            group_widget.setProperty("pooled_group", True)
+        
+        toggle_btn.setStyleSheet("QToolButton { border: none; }")
+        toggle_btn.setArrowType(Qt.ArrowType.RightArrow)
+        toggle_btn.setText(text)
+        content.setVisible(False)  # Initially collapsed
+        return group_widget, toggle_btn, content, content_layout
+    
+    def _release_group_widgets(self, root: QWidget):
+        """Return pooled collapsible sections under root to the pool before root is deleted"""
+        for group_widget in root.findChildren(QWidget):
+            if len(self._group_widget_pool) >= GROUP_WIDGET_POOL_SIZE:
+                return
+            if not group_widget.property("pooled_group"):
+                continue
+            group_layout = group_widget.layout()
+            toggle_btn = group_layout.itemAt(0).widget()
+            content = group_layout.itemAt(1).widget()
+            
+            # Drop connections and built content from the previous use
+            for signal in (toggle_btn.toggled, toggle_btn.customContextMenuRequested):
+                try:
+                    signal.disconnect()
+                except TypeError:
+                    pass  # Nothing connected
+            content_layout = content.layout()
+            while content_layout.count():
+                child = content_layout.takeAt(0).widget()
+                if child is not None:
+                    child.setParent(None)
+                    child.deleteLater()
+            
+            # The button's path and original value belong to the old view
+            self._forget_widget(id(toggle_btn))
+            toggle_btn._pool_generation += 1
+            # So is the file get_schema_view_file_path cached on them, the next view sets its own
+            for widget in (group_widget, toggle_btn, content):
+                widget._schema_file_path = None
+            group_widget.setParent(None)
+            self._group_widget_pool.append((group_widget, toggle_btn, content, content_layout))
+    
+    def _acquire_spin_box(self, spin_type: type) -> QSpinBox | QDoubleSpinBox:
+        """Get a spin box from the pool or create one, either way connected and filtered"""
+        pool = self._editor_pool[spin_type]
+        if pool:
+            return pool.pop()
+        spin = spin_type()
+        # Bumped each time the spin box goes back to the pool, see _spin_value_updater
+        spin._pool_generation = 0
+        # Connected once here, _track_widget skips pooled widgets so reuse doesn't stack connections
+        spin.destroyed.connect(lambda _=None, key=id(spin): self._forget_widget(key))
+        # Connect valueChanged signal to command creation
+        spin.valueChanged.connect(self._on_any_spin_changed)
+        # Install wheel event filter
+        spin.installEventFilter(self.wheel_filter)
+        return spin
+    
+    def release_editor_widget(self, widget: QWidget) -> bool:
+        """Detach a spin box into the pool instead of deleting it, False if it can't be pooled"""
+        pool = self._editor_pool.get(type(widget))
+        key = id(widget)
+        # A queued edit still needs the widget as it is
+        if pool is None or len(pool) >= EDITOR_WIDGET_POOL_SIZE or key in self._pending_edits:
+            return False
+        self._forget_widget(key)
+        widget._schema_file_path = None  # The next view sets its own
+        widget._pool_generation += 1  # Commands holding it must not write to it anymore
+        widget.setParent(None)
+        pool.append(widget)
+        return True
+    
+    def _release_editor_widgets(self, root: QWidget) -> None:
+        """Return spin boxes under root to the pool before root is deleted"""
+        for spin_type in self._editor_pool:
+            for spin in root.findChildren(spin_type):
+                if type(spin) is spin_type:
+                    self.release_editor_widget(spin)
+    
+    def _release_schema_views(self, root: QWidget) -> None:
+        """Unregister the data change callbacks of schema views in a widget that is being removed"""
+        for view in [root, *root.findChildren(QScrollArea)]:
+            cleanup = getattr(view, "view_cleanup", None)
+            if cleanup is not None:
+                cleanup()
+
+    def discard_widget(self, widget: QWidget) -> None:
+        """Delete a widget that was taken out of its layout"""
+        self._release_schema_views(widget)
+        # Editors first, releasing groups deletes whatever is left in their content
+        self._release_editor_widgets(widget)
+        self._release_group_widgets(widget)
+        # Hide so stale content isn't painted before the deferred delete runs
+        widget.hide()
+        # Detach first so the whole subtree is deleted in one cascade
+        widget.setParent(None)
+        widget.deleteLater()
+
     def clear_layout(self, layout):
         """Clear a layout and all its widgets"""
-        if layout is not None:
-            while layout.count():
-                item = layout.takeAt(0)
+        # Edits still waiting on the timer belong to widgets about to go away
+        self.flush_pending_edits()
+        # Walk nested layouts with an explicit stack instead of recursing
+        stack = [layout] if layout is not None else []
+        while stack:
+            current = stack.pop()
+            # Take items from the end so Qt doesn't shift the remaining items on every take
+            for i in reversed(range(current.count())):
+                item = current.takeAt(i)
                 widget = item.widget()
                 if widget is not None:
-                    widget.deleteLater()
+                    self.discard_widget(widget)
                 else:
-                    self.clear_layout(item.layout())
+                    sub_layout = item.layout()
+                    if sub_layout is not None:
+                        stack.append(sub_layout)
+
+    def _track_widget(self, widget: QObject, key: int) -> None:
+        """Drop a widget's path and original value once Qt destroys it"""
+        if hasattr(widget, "_pool_generation"):
+            return  # Pooled widgets connected destroyed when they were created
+        if key not in self._widget_paths and key not in self._widget_original:
+            widget.destroyed.connect(lambda _=None, key=key: self._forget_widget(key))
+    
+    def _forget_widget(self, key: int) -> None:
+        path = self._widget_paths.pop(key, None)
+        if path is not None:
+            self._unindex_widget(path, key)
+        self._widget_original.pop(key, None)
+    
+    def _unindex_widget(self, path: tuple, key: int) -> None:
+        widgets = self._widgets_by_path.get(path)
+        if widgets:
+            widgets[:] = [w for w in widgets if id(w) != key]
+            if not widgets:
+                del self._widgets_by_path[path]
+    
+    def set_widget_path(self, widget: QObject, path) -> None:
+        """Store the data path a widget edits, kept on the Python side to avoid QVariant conversion"""
+        key = id(widget)
+        self._track_widget(widget, key)
+        path = tuple(path)
+        old_path = self._widget_paths.get(key)
+        if old_path is not None:
+            self._unindex_widget(old_path, key)
+        self._widget_paths[key] = path
+        self._widgets_by_path.setdefault(path, []).append(widget)
+    
+    def find_widgets_by_path(self, root: QWidget, path) -> list:
+        """Get the widgets under root that have the given data path, in creation order"""
+        return [w for w in self._widgets_by_path.get(tuple(path), ()) if root.isAncestorOf(w)]
+    
+    def widget_path(self, widget: QObject) -> list:
+        """Get the data path of a widget as a list, or None if it has none"""
+        path = self._widget_paths.get(id(widget))
+        return None if path is None else list(path)
+    
+    def set_widget_original(self, widget: QObject, value) -> None:
+        """Store the value a widget was created with"""
+        key = id(widget)
+        self._track_widget(widget, key)
+        if not isinstance(value, _PRIMITIVES) and value is not None:
+            # Snapshot containers so later edits to the data don't change the original
+            value = json.loads(json.dumps(value))
+        self._widget_original[key] = value
+    
+    def widget_original(self, widget: QObject):
+        """Get the value a widget was created with"""
+        return self._widget_original.get(id(widget))
+    
+    # Shared slots for editable widgets, the sending widget identifies the value
+    def _on_any_text_changed(self, text: str):
+        self.queue_edit(self.sender(), self.on_text_changed, text)
+    
+    def _on_any_combo_changed(self, text: str):
+        self.on_combo_changed(self.sender(), text)
+    
+    def _on_any_spin_changed(self, value):
+        self.queue_edit(self.sender(), self.on_spin_changed, value)
+    
+    def _on_any_checkbox_changed(self, state: int):
+        self.on_checkbox_changed(self.sender(), state)
+    
+    def queue_edit(self, widget: QWidget, handler: Callable, value) -> None:
+        """Hold a keystroke/spin edit until the widget has been quiet for a moment"""
+        if self.command_stack.is_executing:
+            # Undo/redo is writing the widget, handle it now so the original value follows
+            self._pending_edits.pop(id(widget), None)
+            handler(widget, value)
+            return
+        # Only the latest value matters, the handler compares it to the original
+        self._pending_edits[id(widget)] = (widget, handler, value)
+        self.edit_commit_timer.start()
+    
+    def flush_pending_edits(self) -> None:
+        """Push a command for every widget with a queued edit"""
+        self.edit_commit_timer.stop()
+        pending = self._pending_edits
+        if not pending:
+            return
+        self._pending_edits = {}
+        for widget, handler, value in pending.values():
+            try:
+                handler(widget, value)
+            except RuntimeError as e:
+                # Widget was deleted before its edit was flushed
+                print(f"Dropping queued edit for deleted widget: {str(e)}")
 
     def on_text_changed(self, widget: QLineEdit, new_text: str):
         """Handle text changes in QLineEdit widgets"""
@@ -5046,8 +5302,8 @@ class EntityToolGUI(QMainWindow):
         if not file_path:
             return
             
-        data_path = widget.property("data_path")
-        old_value = widget.property("original_value")
+        data_path = self.widget_path(widget)
+        old_value = self.widget_original(widget)
         
         # Convert None to empty string for comparison
         old_value_str = str(old_value) if old_value is not None else ""
@@ -5071,7 +5327,7 @@ class EntityToolGUI(QMainWindow):
             )
             command.source_widget = widget  # Track which widget initiated the change
             self.command_stack.push(command)
-            widget.setProperty("original_value", new_text)
+            self.set_widget_original(widget, new_text)
             self.update_save_button()  # Update save button state
 
     def on_combo_changed(self, widget: QComboBox, new_text: str):
@@ -5081,8 +5337,8 @@ class EntityToolGUI(QMainWindow):
         if not file_path:
             return
             
-        data_path = widget.property("data_path")
-        old_value = widget.property("original_value")
+        data_path = self.widget_path(widget)
+        old_value = self.widget_original(widget)
         
         if data_path is not None and old_value != new_text:
             command = EditValueCommand(
@@ -5095,7 +5351,7 @@ class EntityToolGUI(QMainWindow):
             )
             command.source_widget = widget  # Track which widget initiated the change
             self.command_stack.push(command)
-            widget.setProperty("original_value", new_text)
+            self.set_widget_original(widget, new_text)
             self.update_save_button()  # Update save button state
             
     def on_spin_changed(self, widget: QSpinBox | QDoubleSpinBox, new_value: int | float):
@@ -5105,27 +5361,53 @@ class EntityToolGUI(QMainWindow):
         if not file_path:
             return
             
-        data_path = widget.property("data_path")
-        old_value = widget.property("original_value")
+        data_path = self.widget_path(widget)
+        old_value = self.widget_original(widget)
         
         # Simplify the number if possible
         if isinstance(new_value, (int, float)):
             new_value = self.simplify_number(new_value)
         
+        # Spinning back to the shown value isn't an edit, even if int/float or rounding differ
+        if isinstance(old_value, (int, float)) and not isinstance(old_value, bool):
+            if isinstance(widget, QDoubleSpinBox):
+                if abs(float(old_value) - float(new_value)) < 0.5 * 10 ** -widget.decimals():
+                    return
+            elif int(old_value) == int(new_value):
+                return
+        
         if data_path is not None and old_value != new_value:
             command = EditValueCommand(
                 file_path,
                 data_path,
                 old_value,
                 new_value,
-                lambda value: widget.setValue(value),
+                self._spin_value_updater(widget, file_path, data_path),
                 self.update_data_value
             )
             command.source_widget = widget  # Track which widget initiated the change
             self.command_stack.push(command)
-            widget.setProperty("original_value", new_value)
+            self.set_widget_original(widget, new_value)
             self.update_save_button()  # Update save button state
             
+    def _spin_value_updater(self, widget: QSpinBox | QDoubleSpinBox, file_path: Path, data_path: list) -> Callable:
+        """Widget update for an edit command, safe against the spin box being pooled and reused"""
+        generation = widget._pool_generation
+        
+        def update(value):
+            if widget._pool_generation == generation:
+                widget.setValue(value)
+                return
+            # The spin box may edit another field now, update whatever shows this path instead
+            view = self.find_schema_view(file_path)
+            if view is not None:
+                for target in self.find_widgets_by_path(view, data_path):
+                    setter = _value_setter(target)
+                    if setter is not None:
+                        setter(target, value)
+                    self.set_widget_original(target, value)
+        return update
+    
     def on_checkbox_changed(self, widget: QCheckBox, new_state: int):
         """Handle state changes in QCheckBox widgets"""
         # Get file path from parent schema view
@@ -5133,9 +5415,9 @@ class EntityToolGUI(QMainWindow):
         if not file_path:
             return
             
-        data_path = widget.property("data_path")
-        old_value = widget.property("original_value")
-        new_value = bool(new_state == Qt.CheckState.Checked.value)
+        data_path = self.widget_path(widget)
+        old_value = self.widget_original(widget)
+        new_value = new_state == _CHECKED
         
         if data_path is not None and old_value != new_value:
             command = EditValueCommand(
@@ -5148,7 +5430,7 @@ class EntityToolGUI(QMainWindow):
             )
             command.source_widget = widget  # Track which widget initiated the change
             self.command_stack.push(command)
-            widget.setProperty("original_value", new_value)
+            self.set_widget_original(widget, new_value)
             self.update_save_button()  # Update save button state
 
     def on_text_edit_timer_timeout(self):
@@ -5157,8 +5439,8 @@ class EntityToolGUI(QMainWindow):
 
     def on_select_value(self, target_widget, new_value):
         """Handle selection from any selector dialog"""
-        data_path = target_widget.property("data_path")
-        old_value = target_widget.property("original_value")
+        data_path = self.widget_path(target_widget)
+        old_value = self.widget_original(target_widget)
         file_path = self.get_schema_view_file_path(target_widget)
         
         if data_path is not None and old_value != new_value and file_path:
@@ -5198,27 +5480,11 @@ class EntityToolGUI(QMainWindow):
         if text_key.startswith(":"):  # Raw string
             return text_key[1:], False
         
-        # Try current language in mod folder first
-        if self.current_language in self.all_localized_strings['mod']:
-            if text_key in self.all_localized_strings['mod'][self.current_language]:
-                return self.all_localized_strings['mod'][self.current_language][text_key], False
-        
-        # Try English in mod folder
-        if "en" in self.all_localized_strings['mod']:
-            if text_key in self.all_localized_strings['mod']["en"]:
-                return self.all_localized_strings['mod']["en"][text_key], False
-        
-        # Try base game current language
-        if self.current_language in self.all_localized_strings['base_game']:
-            if text_key in self.all_localized_strings['base_game'][self.current_language]:
-                return self.all_localized_strings['base_game'][self.current_language][text_key], True
-        
-        # Try base game English
-        if "en" in self.all_localized_strings['base_game']:
-            if text_key in self.all_localized_strings['base_game']["en"]:
-                return self.all_localized_strings['base_game']["en"][text_key], True
-        
-        return text_key, False  # Return key if no translation found
+        # Single lookup into the merged mod/base game strings
+        text = self._merged_strings.get(text_key)
+        if text is None:
+            return text_key, False  # Return key if no translation found
+        return text, text_key in self._base_game_keys
 
     def on_localized_text_changed(self, edit: QPlainTextEdit, text: str):
         """Handle changes to localized text values"""
@@ -5264,6 +5530,7 @@ class EntityToolGUI(QMainWindow):
             if language not in self.all_localized_strings['mod']:
                 self.all_localized_strings['mod'][language] = {}
             self.all_localized_strings['mod'][language][key] = text
+            self.refresh_localized_key(key)
             
     def update_text_preserve_cursor(self, edit: QPlainTextEdit, value: str):
         """Update text in QPlainTextEdit while preserving cursor position and selection"""
@@ -5315,7 +5582,7 @@ class EntityToolGUI(QMainWindow):
         if not file_path:
             return
             
-        data_path = widget.property("data_path")
+        data_path = self.widget_path(widget)
         if data_path is None:
             data_path = []  # Empty list for root properties
             
@@ -5350,6 +5617,10 @@ class EntityToolGUI(QMainWindow):
             new_value = target.copy()  # Make a new copy for the modified data
             new_value[prop_name] = default_value  # Add the new property
         
+        # Expand collapsed sections first so their lazily built content exists
+        if isinstance(widget, QToolButton) and widget.isCheckable() and not widget.isChecked():
+            widget.setChecked(True)
+        
         # Find the content widget (next widget after the toggle button)
         container = widget.parent()
         content_widget = None
@@ -5393,7 +5664,7 @@ class EntityToolGUI(QMainWindow):
         try:
             print(f"Starting delete_property for {property_name}")
             # Get the data path
-            data_path = widget.property("data_path")
+            data_path = self.widget_path(widget)
             print(f"Data path from widget: {data_path}")
             if data_path is None:  # Changed from 'if not data_path:' to handle empty lists
                 print("No data path found on widget")
@@ -5463,7 +5734,7 @@ class EntityToolGUI(QMainWindow):
         if not file_path:
             return
             
-        data_path = widget.property("data_path")
+        data_path = self.widget_path(widget)
         if data_path is None:
             return
             
@@ -5508,6 +5779,10 @@ class EntityToolGUI(QMainWindow):
                     
         new_array = array_data + [new_item]
         
+        # Expand collapsed arrays first so their lazily built items exist
+        if isinstance(widget, QToolButton) and widget.isCheckable() and not widget.isChecked():
+            widget.setChecked(True)
+        
         # Find the array's content widget (next widget after the toggle button)
         array_container = widget.parent()
         content_widget = None
@@ -5621,21 +5896,15 @@ class EntityToolGUI(QMainWindow):
         def update_subject_list(search=""):
             list_widget.clear()
             
-            # Add mod subjects first
-            for subject_id in sorted(self.manifest_data['mod'].get('research_subject', {})):
-                if search.lower() in subject_id.lower():
-                    item = QListWidgetItem(subject_id)
-                    list_widget.addItem(item)
-            
-            # Then add base game subjects
-            for subject_id in sorted(self.manifest_data['base_game'].get('research_subject', {})):
-                if search.lower() in subject_id.lower() and subject_id not in self.manifest_data['mod'].get('research_subject', {}):
-                    item = QListWidgetItem(subject_id)
-                    item.setForeground(QColor(150, 150, 150))
-                    font = item.font()
-                    font.setItalic(True)
-                    item.setFont(font)
-                    list_widget.addItem(item)
+            search = search.lower()
+            
+            # Mod subjects first, then base game subjects
+            mod_subjects = self.manifest_data['mod'].get('research_subject', {})
+            _fill_list(
+                list_widget,
+                [subject_id for subject_id in sorted(mod_subjects) if search in subject_id.lower()],
+                [subject_id for subject_id in sorted(self.manifest_data['base_game'].get('research_subject', {}))
+                 if search in subject_id.lower() and subject_id not in mod_subjects])
 
         def get_research_fields():
             """Get available research fields from the current player file"""
@@ -5900,8 +6169,7 @@ class EntityToolGUI(QMainWindow):
             "schema_folder": ""
         }
         try:
-            with open('config.json', 'w') as f:
-                json.dump(default_config, f, indent=4)
+            write_json_file('config.json', default_config)
             self.config = default_config
             logging.info("Created default config.json")
         except Exception as e:
@@ -6048,7 +6316,7 @@ class EntityToolGUI(QMainWindow):
                 
                 def on_overwrite_changed(state):
                     nonlocal overwrite
-                    overwrite = state == Qt.CheckState.Checked.value
+                    overwrite = state == _CHECKED
                     name_edit.setEnabled(not overwrite)
                     name_edit.setText(source_file if overwrite else "")
                     